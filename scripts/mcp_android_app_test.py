@@ -7,16 +7,123 @@ from datetime import timedelta
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
 
+# Prefer orjson for text payloads when available; fall back to the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 PKG = "com.example.androidtestapp"
+MAIN_ACTIVITY = ".MainActivity"
+# Wait polling starts quick and backs off toward the cap on the server side
+POLL_INTERVAL_START = 0.05
+POLL_INTERVAL_CAP = 0.5
+# Lookups only need a few elements; cap the payload the server sends back
+FIND_MAX_CHARS = 50000
+
+# Tools that may change what is on screen
+SCREEN_MUTATING_TOOLS = frozenset({
+    "device_tap",
+    "device_tap_many",
+    "device_double_tap",
+    "device_long_press",
+    "device_type",
+    "device_swipe",
+    "swipe_element_and_check",
+    "device_tap_and_wait",
+    "scroll_to_top",
+    "go_back",
+    "app_start",
+    "open_notification",
+    "wait_seconds",
+})
+# Tools that leave the current case screen, dropping the cached screen root
+SCREEN_LEAVING_TOOLS = frozenset({"go_back", "app_start", "open_notification"})
+# Content container of the app window; lookups within a case are scoped to it
+SCREEN_ROOT_ID = "android:id/content"
+# Tools that leave a fresh snapshot on the server as a side effect
+SNAPSHOT_TOOLS = frozenset({
+    "find_element",
+    "find_elements",
+    "wait_for_text",
+    "wait_for_any_text",
+    "device_tap_and_wait",
+    "swipe_element_and_check",
+})
+# Lookup tools whose refresh_snapshot can be skipped on an unchanged screen
+LOOKUP_TOOLS = frozenset({"find_element", "find_elements"})
+
+
+class ScreenCache:
+    """Session wrapper that reuses the server snapshot while the screen is unchanged.
+
+    find_element only forces refresh_snapshot after a tool that may have
+    changed the screen; otherwise the server's current snapshot is reused.
+    screen_root holds the ref lookups in the current case are scoped to.
+
+    find_one results are memoized per screen epoch; the epoch advances
+    whenever the screen may have changed, which drops every memoized lookup.
+    on_main records that the main list was confirmed in the current epoch.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self._dirty = True
+        self._refresh_lock = anyio.Lock()
+        self.screen_root = None
+        self.epoch = 0
+        self._found = {}
+        self.on_main = False
+
+    def invalidate(self):
+        self._dirty = True
+        self.epoch += 1
+        self._found.clear()
+        self.on_main = False
+
+    def recall(self, key):
+        return self._found.get((self.epoch, key))
+
+    def remember(self, key, element, epoch):
+        # A lookup that raced a screen change belongs to a stale epoch
+        if epoch == self.epoch:
+            self._found[(epoch, key)] = element
+
+    async def call_tool(self, name, arguments=None, **kwargs):
+        arguments = dict(arguments or {})
+        if name in LOOKUP_TOOLS and arguments.get("refresh_snapshot"):
+            # Concurrent lookups share a single refresh.
+            async with self._refresh_lock:
+                if not self._dirty:
+                    arguments["refresh_snapshot"] = False
+                return await self._call_tool(name, arguments, **kwargs)
+        return await self._call_tool(name, arguments, **kwargs)
+
+    async def _call_tool(self, name, arguments, **kwargs):
+        result = await self._session.call_tool(name, arguments=arguments, **kwargs)
+        if name in SCREEN_MUTATING_TOOLS:
+            self.invalidate()
+            self._dirty = result.isError or not arguments.get("return_snapshot")
+        if name in SNAPSHOT_TOOLS and not result.isError:
+            self._dirty = False
+        if name in SCREEN_LEAVING_TOOLS:
+            self.screen_root = None
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
 
 
 def _unwrap(result):
     if result.isError:
         raise RuntimeError(f"Tool error: {result}")
-    if result.structuredContent and "result" in result.structuredContent:
-        return result.structuredContent["result"]
+    # Servers on mcp>=1.10 send the already-parsed result; older ones only text
+    structured = result.structuredContent
+    if structured and "result" in structured:
+        return structured["result"]
     if result.content:
-        return json.loads(result.content[0].text)
+        return _json_loads(result.content[0].text)
     return {}
 
 
@@ -37,7 +144,23 @@ async def wait_for_text(session, text, partial=False, timeout=10):
             "text": text,
             "partial": partial,
             "timeout": timeout,
-            "poll_interval": 0.5,
+            "poll_interval": POLL_INTERVAL_CAP,
+            "initial_poll_interval": POLL_INTERVAL_START,
+        },
+        timeout=timeout + 15,
+    )
+
+
+async def wait_for_any_text(session, texts, partial=False, timeout=10):
+    return await call(
+        session,
+        "wait_for_any_text",
+        {
+            "texts": list(texts),
+            "partial": partial,
+            "timeout": timeout,
+            "poll_interval": POLL_INTERVAL_CAP,
+            "initial_poll_interval": POLL_INTERVAL_START,
         },
         timeout=timeout + 15,
     )
@@ -49,63 +172,180 @@ async def try_wait_for_text(session, text, partial=False, timeout=5):
 
 
 async def find_one(session, **criteria):
-    result = await call(session, "find_element", {**criteria, "refresh_snapshot": True})
+    if not isinstance(session, ScreenCache):
+        return await _find_scoped(session, **criteria)
+    key = json.dumps(criteria, sort_keys=True)
+    element = session.recall(key)
+    if element is None:
+        epoch = session.epoch
+        element = await _find_scoped(session, **criteria)
+        session.remember(key, element, epoch)
+    return element
+
+
+async def _find_scoped(session, **criteria):
+    root = getattr(session, "screen_root", None)
+    if root is not None:
+        try:
+            return await _find_one(session, root_ref=root, **criteria)
+        except RuntimeError:
+            # The root may be gone from the new screen; search everything
+            session.screen_root = None
+    return await _find_one(session, **criteria)
+
+
+async def _find_one(session, **criteria):
+    result = await call(
+        session,
+        "find_element",
+        {
+            **criteria,
+            "refresh_snapshot": True,
+            "max_chars": FIND_MAX_CHARS,
+            "limit": 1,
+        },
+    )
     if result["count"] == 0:
         raise RuntimeError(f"Element not found: {criteria}")
     return result["elements"][0]
 
 
+async def find_batch(session, *criteria):
+    """Resolve several elements from one snapshot, returned in argument order."""
+    result = await call(
+        session,
+        "find_elements",
+        {"queries": list(criteria), "refresh_snapshot": True, "limit": 1},
+    )
+    elements = []
+    for query, found in zip(criteria, result["results"]):
+        if not found["elements"]:
+            raise RuntimeError(f"Element not found: {query}")
+        elements.append(found["elements"][0])
+    return tuple(elements)
+
+
+async def on_main_activity(session):
+    """Return True/False from the foreground activity, or None if unknown."""
+    try:
+        current = await call(session, "app_current")
+    except RuntimeError:
+        return None
+    activity = current.get("activity") or ""
+    return current.get("package") == PKG and activity.endswith(MAIN_ACTIVITY)
+
+
+async def wait_for_main(session, timeout=10):
+    """Wait for the main list; remember it so the next open_case skips probing."""
+    result = await wait_for_text(session, "Test Cases", timeout=timeout)
+    if result.get("found") and isinstance(session, ScreenCache):
+        session.on_main = True
+    return result.get("found", False)
+
+
+async def back_to_main(session, timeout=10):
+    await call(session, "go_back")
+    return await wait_for_main(session, timeout=timeout)
+
+
+async def tap_many(session, *targets):
+    """Tap (element, label) pairs in order with a single call."""
+    taps = [{"ref": element["ref"], "element": label} for element, label in targets]
+    return await call(session, "device_tap_many", {"taps": taps})
+
+
 async def ensure_on_main(session, attempts=3, relaunch=True):
+    if getattr(session, "on_main", False):
+        return
     for _ in range(attempts):
-        result = await wait_for_text(session, "Test Cases", timeout=5)
-        if result.get("found"):
+        on_main = await on_main_activity(session)
+        if on_main:
+            return
+        if on_main is None and await wait_for_main(session, timeout=5):
+            return
+        # Let the back navigation settle before probing again
+        if await back_to_main(session, timeout=5):
             return
-        await call(session, "go_back")
     if relaunch:
         await call(session, "app_start", {"package": PKG, "stop_first": False})
-        result = await wait_for_text(session, "Test Cases", timeout=10)
-        if result.get("found"):
+        if await wait_for_main(session, timeout=10):
             return
     raise RuntimeError("Failed to return to Test Cases screen")
 
 
+async def _first_clickable_ref(session):
+    result = await call(
+        session,
+        "find_element",
+        {"clickable": True, "refresh_snapshot": True, "limit": 1},
+    )
+    return result["elements"][0]["ref"] if result["elements"] else None
+
+
 async def scroll_to_top(session, attempts=4):
+    try:
+        await call(session, "scroll_to_top")
+        return
+    except RuntimeError:
+        pass
+    # Fallback: swipe until the screen stops changing (refs are stable across
+    # snapshots, so an unchanged first element means we are at the top).
+    previous = await _first_clickable_ref(session)
     for _ in range(attempts):
         await call(session, "device_swipe", {"direction": "down", "duration": 0.5})
+        current = await _first_clickable_ref(session)
+        if current == previous:
+            return
+        previous = current
 
 
-async def swipe_left_on_element(session, element, padding=10, duration=0.3):
-    bounds = element["bounds"]
-    start_x = bounds[2] - padding
-    end_x = bounds[0] + padding
-    y = (bounds[1] + bounds[3]) // 2
-    await call(
+async def _scope_to_screen_root(session):
+    # Look the container up in the current snapshot without a refresh; its ref
+    # stays the same across screens because the container itself does not move.
+    result = await call(
         session,
-        "device_swipe",
-        {
-            "start_x": start_x,
-            "start_y": y,
-            "end_x": end_x,
-            "end_y": y,
-            "duration": duration,
-        },
+        "find_element",
+        {"resource_id": SCREEN_ROOT_ID, "limit": 1},
     )
+    if result["elements"]:
+        session.screen_root = result["elements"][0]["ref"]
 
 
-async def open_case(session, title):
+async def open_case(session, title, expect=None, partial=False, timeout=10):
+    """Open a case from the main list and wait for its landmark text, if any."""
     await ensure_on_main(session)
     await scroll_to_top(session)
     for _ in range(12):
         result = await call(
             session,
             "find_element",
-            {"text": title, "refresh_snapshot": True},
+            {
+                "text": title,
+                "refresh_snapshot": True,
+                "max_chars": FIND_MAX_CHARS,
+                "limit": 1,
+            },
             timeout=20,
         )
         if result.get("count", 0) > 0:
             elem = result["elements"][0]
-            await call(session, "device_tap", {"ref": elem["ref"], "element": title})
-            return
+            await _scope_to_screen_root(session)
+            if expect is None:
+                return await call(session, "device_tap", {"ref": elem["ref"], "element": title})
+            return await call(
+                session,
+                "device_tap_and_wait",
+                {
+                    "ref": elem["ref"],
+                    "element": title,
+                    "text": expect,
+                    "partial": partial,
+                    "timeout": timeout,
+                    "poll_interval": POLL_INTERVAL_CAP,
+                    "initial_poll_interval": POLL_INTERVAL_START,
+                },
+                timeout=timeout + 15,
+            )
         await call(session, "device_swipe", {"direction": "up", "duration": 0.5})
     raise RuntimeError(f"Case not found after scrolling: {title}")
 
@@ -115,7 +355,12 @@ async def scroll_until_text(session, text, attempts=5):
         result = await call(
             session,
             "find_element",
-            {"text": text, "refresh_snapshot": True},
+            {
+                "text": text,
+                "refresh_snapshot": True,
+                "max_chars": FIND_MAX_CHARS,
+                "limit": 1,
+            },
             timeout=20,
         )
         if result.get("count", 0) > 0:
@@ -134,39 +379,36 @@ async def run_tests():
     async with stdio_client(server) as (read, write):
         async with ClientSession(read, write) as session:
             await session.initialize()
+            session = ScreenCache(session)
 
             devices = await call(session, "device_list")
             if devices.get("count", 0) == 0:
                 raise RuntimeError("No devices available for testing")
 
             await call(session, "app_start", {"package": PKG, "stop_first": True})
-            await wait_for_text(session, "Test Cases", timeout=15)
+            await wait_for_main(session, timeout=15)
 
             # Controls
-            await open_case(session, "Controls")
-            await wait_for_text(session, "Submit", timeout=10)
+            await open_case(session, "Controls", "Submit")
+            # Each action expires refs, so look every target up right before it
             email = await find_one(session, resource_id=f"{PKG}:id/input_email")
-            password = await find_one(session, resource_id=f"{PKG}:id/input_password")
-            submit = await find_one(session, text="Submit")
             await call(session, "device_type", {"text": "user@example.com", "ref": email["ref"], "clear_first": True})
+            password = await find_one(session, resource_id=f"{PKG}:id/input_password")
             await call(session, "device_type", {"text": "pass1234", "ref": password["ref"], "clear_first": True})
+            submit = await find_one(session, text="Submit")
             await call(session, "device_tap", {"ref": submit["ref"], "element": "Submit"})
             await wait_for_text(session, "SUBMITTED", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Lists
-            await open_case(session, "Lists")
-            await wait_for_text(session, "Selected:", partial=True, timeout=10)
+            await open_case(session, "Lists", "Selected:", partial=True)
             item20 = await scroll_until_text(session, "Item 20")
             await call(session, "device_tap", {"ref": item20["ref"], "element": "Item 20"})
             await wait_for_text(session, "Selected: Item 20", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Dialogs
-            await open_case(session, "Dialogs")
-            await wait_for_text(session, "Show Alert", timeout=10)
+            await open_case(session, "Dialogs", "Show Alert")
             alert = await find_one(session, text="Show Alert")
             await call(session, "device_tap", {"ref": alert["ref"], "element": "Show Alert"})
             ok = await wait_for_text(session, "OK", timeout=10)
@@ -181,88 +423,83 @@ async def run_tests():
                 await call(session, "device_tap", {"ref": sheet_ok["ref"], "element": "Sheet OK"})
             await wait_for_text(session, "SHEET_OK", partial=True, timeout=10)
 
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Gestures
-            await open_case(session, "Gestures")
-            await wait_for_text(session, "Gesture:", partial=True, timeout=10)
+            await open_case(session, "Gestures", "Gesture:", partial=True)
             area = await find_one(session, resource_id=f"{PKG}:id/gesture_area")
             await call(session, "device_double_tap", {"ref": area["ref"], "element": "Gesture Area"})
             await wait_for_text(session, "DOUBLE_TAP", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Permissions
-            await open_case(session, "Permissions")
-            await wait_for_text(session, "Request Notification Permission", partial=True, timeout=10)
+            await open_case(
+                session, "Permissions", "Request Notification Permission", partial=True
+            )
             perm_btn = await find_one(session, text_contains="Request Notification")
             await call(session, "device_tap", {"ref": perm_btn["ref"], "element": "Request Permission"})
-            allow = await wait_for_text(session, "Allow", partial=True, timeout=3)
-            if allow.get("found"):
-                await call(session, "device_tap", {"ref": allow["ref"], "element": "Allow"})
-            await try_wait_for_text(session, "Status:", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            # Either the system dialog shows up or the status settles without one
+            outcome = await wait_for_any_text(
+                session,
+                ["Allow", "Status: GRANTED", "Status: DENIED"],
+                partial=True,
+                timeout=3,
+            )
+            if outcome.get("text") == "Allow":
+                await call(session, "device_tap", {"ref": outcome["ref"], "element": "Allow"})
+                await try_wait_for_text(session, "Status:", partial=True, timeout=10)
+            elif not outcome.get("found"):
+                await try_wait_for_text(session, "Status:", partial=True, timeout=10)
+            await back_to_main(session)
 
             # WebView
-            await open_case(session, "WebView")
-            await wait_for_text(session, "Run JS", timeout=10)
+            await open_case(session, "WebView", "Run JS")
             run_js = await find_one(session, text="Run JS")
             await call(session, "device_tap", {"ref": run_js["ref"], "element": "Run JS"})
             await wait_for_text(session, "clicked", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Scrolling
             await open_case(session, "Scrolling")
             await scroll_until_text(session, "Scroll Item 60")
 
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Tabs
-            await open_case(session, "Tabs")
-            await wait_for_text(session, "Tab A Content", timeout=10)
+            await open_case(session, "Tabs", "Tab A Content")
             tab_b = await find_one(session, content_desc="Tab B")
             await call(session, "device_tap", {"ref": tab_b["ref"], "element": "Tab B"})
             await wait_for_text(session, "Tab B Content", timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Notifications
-            await open_case(session, "Notifications")
-            await wait_for_text(session, "Send Notification", timeout=10)
+            await open_case(session, "Notifications", "Send Notification")
             send_btn = await find_one(session, text="Send Notification")
             await call(session, "device_tap", {"ref": send_btn["ref"], "element": "Send Notification"})
             await wait_for_text(session, "Status: SENT", partial=True, timeout=10)
             await call(session, "open_notification")
             await wait_for_text(session, "Test Notification", partial=True, timeout=5)
             await call(session, "go_back")
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # File Picker
-            await open_case(session, "File Picker")
-            await wait_for_text(session, "Open Document", timeout=10)
+            await open_case(session, "File Picker", "Open Document")
             open_doc = await find_one(session, text="Open Document")
             await call(session, "device_tap", {"ref": open_doc["ref"], "element": "Open Document"})
             await call(session, "wait_seconds", {"seconds": 2})
             await call(session, "go_back")
             await wait_for_text(session, "Result: Cancelled", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Snackbars & Toasts
-            await open_case(session, "Snackbars & Toasts")
-            await wait_for_text(session, "Show Snackbar", timeout=10)
+            await open_case(session, "Snackbars & Toasts", "Show Snackbar")
             show_snackbar = await find_one(session, text="Show Snackbar")
             await call(session, "device_tap", {"ref": show_snackbar["ref"], "element": "Show Snackbar"})
             await wait_for_text(session, "SNACKBAR_SHOWN", partial=True, timeout=10)
             action_result = await call(
                 session,
                 "find_element",
-                {"text": "Action", "refresh_snapshot": True},
+                {"text": "Action", "refresh_snapshot": True, "max_chars": FIND_MAX_CHARS},
                 timeout=20,
             )
             if action_result.get("count", 0) > 0:
@@ -272,59 +509,48 @@ async def run_tests():
             show_toast = await find_one(session, text="Show Toast")
             await call(session, "device_tap", {"ref": show_toast["ref"], "element": "Show Toast"})
             await wait_for_text(session, "TOAST_SHOWN", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Bottom Navigation
-            await open_case(session, "Bottom Navigation")
-            await wait_for_text(session, "Home Screen", partial=True, timeout=10)
+            await open_case(session, "Bottom Navigation", "Home Screen", partial=True)
             dashboard = await find_one(session, text="Dashboard")
             await call(session, "device_tap", {"ref": dashboard["ref"], "element": "Dashboard"})
             await wait_for_text(session, "Dashboard Screen", partial=True, timeout=10)
+            # Look up Settings on the Dashboard screen, after the tab switch
             settings = await find_one(session, text="Settings")
             await call(session, "device_tap", {"ref": settings["ref"], "element": "Settings"})
             await wait_for_text(session, "Settings Screen", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Sliders
-            await open_case(session, "Sliders")
-            await wait_for_text(session, "Progress:", partial=True, timeout=10)
+            await open_case(session, "Sliders", "Progress:", partial=True)
             increase = await find_one(session, text="Increase")
-            await call(session, "device_tap", {"ref": increase["ref"], "element": "Increase"})
-            await call(session, "device_tap", {"ref": increase["ref"], "element": "Increase"})
+            await tap_many(session, (increase, "Increase"), (increase, "Increase"))
             await wait_for_text(session, "Progress: 20", partial=True, timeout=10)
             decrease = await find_one(session, text="Decrease")
             await call(session, "device_tap", {"ref": decrease["ref"], "element": "Decrease"})
             await wait_for_text(session, "Progress: 10", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Swipe Refresh
-            await open_case(session, "Swipe Refresh")
-            await wait_for_text(session, "Trigger Refresh", timeout=10)
+            await open_case(session, "Swipe Refresh", "Trigger Refresh")
             trigger = await find_one(session, text="Trigger Refresh")
             await call(session, "device_tap", {"ref": trigger["ref"], "element": "Trigger Refresh"})
             await wait_for_text(session, "Status: Refreshed", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Counter
-            await open_case(session, "Counter")
-            await wait_for_text(session, "Count: 0", partial=True, timeout=10)
+            await open_case(session, "Counter", "Count: 0", partial=True)
             plus = await find_one(session, text="Plus")
-            await call(session, "device_tap", {"ref": plus["ref"], "element": "Plus"})
-            await call(session, "device_tap", {"ref": plus["ref"], "element": "Plus"})
+            await tap_many(session, (plus, "Plus"), (plus, "Plus"))
             await wait_for_text(session, "Count: 2", partial=True, timeout=10)
             minus = await find_one(session, text="Minus")
             await call(session, "device_tap", {"ref": minus["ref"], "element": "Minus"})
             await wait_for_text(session, "Count: 1", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # App Bar & Menu
-            await open_case(session, "App Bar & Menu")
-            await wait_for_text(session, "Open Overflow", timeout=10)
+            await open_case(session, "App Bar & Menu", "Open Overflow")
             overflow = await find_one(session, text="Open Overflow")
             await call(session, "device_tap", {"ref": overflow["ref"], "element": "Open Overflow"})
             search_item = await find_one(session, text="Search")
@@ -335,71 +561,49 @@ async def run_tests():
             share_item = await find_one(session, text="Share")
             await call(session, "device_tap", {"ref": share_item["ref"], "element": "Share"})
             await wait_for_text(session, "Last Action: Share", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Navigation Drawer
-            await open_case(session, "Navigation Drawer")
-            await wait_for_text(session, "Open Drawer", timeout=10)
+            await open_case(session, "Navigation Drawer", "Open Drawer")
             open_drawer = await find_one(session, text="Open Drawer")
             await call(session, "device_tap", {"ref": open_drawer["ref"], "element": "Open Drawer"})
             profile = await find_one(session, text="Profile")
             await call(session, "device_tap", {"ref": profile["ref"], "element": "Profile"})
             await wait_for_text(session, "Selected: Profile", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Swipe List
-            await open_case(session, "Swipe List")
-            await wait_for_text(session, "Reset List", timeout=10)
+            await open_case(session, "Swipe List", "Reset List")
             removed = False
             for _ in range(2):
-                item_result = await call(
+                swipe = await call(
                     session,
-                    "find_element",
-                    {"text": "Swipe Item 1", "refresh_snapshot": True},
-                    timeout=20,
+                    "swipe_element_and_check",
+                    {
+                        "text": "Swipe Item 1",
+                        "direction": "left",
+                        "expect_text": "Removed: Swipe Item 1",
+                        "timeout": 6,
+                        "poll_interval": POLL_INTERVAL_CAP,
+                        "initial_poll_interval": POLL_INTERVAL_START,
+                    },
+                    timeout=25,
                 )
-                if item_result.get("count", 0) == 0:
-                    removed = True
-                    break
-                swipe_item = item_result["elements"][0]
-                await swipe_left_on_element(session, swipe_item)
-                removed_result = await wait_for_text(
-                    session,
-                    "Removed: Swipe Item 1",
-                    partial=True,
-                    timeout=6,
-                )
-                if removed_result.get("found"):
-                    removed = True
-                    break
-                still_there = await call(
-                    session,
-                    "find_element",
-                    {"text": "Swipe Item 1", "refresh_snapshot": True},
-                    timeout=20,
-                )
-                if still_there.get("count", 0) == 0:
+                if not swipe["found_before"] or swipe["expect_seen"] or not swipe["found_after"]:
                     removed = True
                     break
             if not removed:
                 raise RuntimeError("Swipe List did not report removing Swipe Item 1")
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             # Chips
-            await open_case(session, "Chips")
-            await wait_for_text(session, "Show Selection", timeout=10)
-            chip_a = await find_one(session, text="Filter A")
-            chip_c = await find_one(session, text="Filter C")
-            await call(session, "device_tap", {"ref": chip_a["ref"], "element": "Filter A"})
-            await call(session, "device_tap", {"ref": chip_c["ref"], "element": "Filter C"})
+            await open_case(session, "Chips", "Show Selection")
+            chip_a, chip_c = await find_batch(session, {"text": "Filter A"}, {"text": "Filter C"})
+            await tap_many(session, (chip_a, "Filter A"), (chip_c, "Filter C"))
             apply_btn = await find_one(session, text="Show Selection")
             await call(session, "device_tap", {"ref": apply_btn["ref"], "element": "Show Selection"})
             await wait_for_text(session, "Selected: Filter A, Filter C", partial=True, timeout=10)
-            await call(session, "go_back")
-            await wait_for_text(session, "Test Cases", timeout=10)
+            await back_to_main(session)
 
             print("MCP automation test completed successfully")
 
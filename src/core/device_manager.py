@@ -4,14 +4,22 @@ Provides thread-safe device connection management, caching, and multi-device sup
 Similar to the original server.py implementation but enhanced for multiple devices.
 """
 
+import asyncio
+import atexit
 import contextlib
+import functools
 import logging
+import os
 import re
+import socket
 import subprocess
+import sys
 import threading
 import time
+from collections import OrderedDict
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Dict, Generator, List, Optional
+from typing import AsyncGenerator, Generator, List, Optional, Tuple
 
 import uiautomator2 as u2
 
@@ -30,24 +38,39 @@ MAX_DEVICE_ID_LENGTH = 255
 # Memory management
 MAX_CACHED_DEVICES = 5
 CACHE_TTL_SECONDS = 300  # 5 minutes
+# A connection that answered a ping this recently is not pinged again
+PING_TTL_SECONDS = 2.0
+# ADB server (ANDROID_ADB_SERVER_PORT overrides the port, as with the adb CLI)
+ADB_SERVER_HOST = "127.0.0.1"
+ADB_SERVER_PORT = 5037
+ADB_SOCKET_TIMEOUT_SECONDS = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedDevice:
-    """Cached device with timestamp for TTL management."""
+    """Cached device with timestamp for TTL management.
+
+    last_used is a time.monotonic() reading, so clock adjustments don't
+    expire entries early or keep them alive.
+    """
     device: u2.Device
-    last_used: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.monotonic)
+    last_ping: float = 0.0  # time.monotonic() of the last successful ping
 
-    def is_expired(self, ttl_seconds: float = CACHE_TTL_SECONDS) -> bool:
-        """Check if cache entry has expired."""
-        return time.time() - self.last_used > ttl_seconds
+    def is_expired(
+        self, ttl_seconds: float = CACHE_TTL_SECONDS, now: Optional[float] = None
+    ) -> bool:
+        """Check if cache entry has expired (as of now, if given)."""
+        if now is None:
+            now = time.monotonic()
+        return now - self.last_used > ttl_seconds
 
     def touch(self):
         """Update last used timestamp."""
-        self.last_used = time.time()
+        self.last_used = time.monotonic()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     """Information about a connected device."""
 
@@ -78,9 +101,110 @@ def validate_device_id(device_id: Optional[str]) -> bool:
         return False
     if len(device_id) > MAX_DEVICE_ID_LENGTH:
         return False
+    return _matches_device_id_pattern(device_id)
+
+
+@functools.lru_cache(maxsize=64)
+def _matches_device_id_pattern(device_id: str) -> bool:
+    """Regex check for validate_device_id, memoized for the few serials in use."""
     return DEVICE_ID_PATTERN.match(device_id) is not None
 
 
+class _AdbProtocolError(Exception):
+    """The ADB server refused a request or sent a malformed reply."""
+
+
+def _adb_server_port() -> int:
+    """Return the ADB server port, honouring ANDROID_ADB_SERVER_PORT.
+
+    A malformed or out-of-range override falls back to the default port.
+    """
+    value = os.environ.get("ANDROID_ADB_SERVER_PORT")
+    if value is None:
+        return ADB_SERVER_PORT
+    try:
+        port = int(value)
+    except ValueError:
+        port = 0
+    if not 0 < port < 65536:
+        logger.warning(
+            "Ignoring invalid ANDROID_ADB_SERVER_PORT=%r, using %d",
+            value,
+            ADB_SERVER_PORT,
+        )
+        return ADB_SERVER_PORT
+    return port
+
+
+def _adb_socket_request(command: str) -> str:
+    """Send a host service request to the ADB server and return its payload.
+
+    Speaks the ADB smart-socket protocol: a 4-hex-digit length prefix and the
+    command, answered by OKAY or FAIL and a length-prefixed payload.
+
+    Raises:
+        OSError: The server is not reachable
+        _AdbProtocolError: The server rejected the request or sent a
+            malformed reply
+    """
+    with socket.create_connection(
+        (ADB_SERVER_HOST, _adb_server_port()), timeout=ADB_SOCKET_TIMEOUT_SECONDS
+    ) as sock:
+        sock.sendall(f"{len(command):04x}{command}".encode())
+        status = _recv_exact(sock, 4)
+        prefix = _recv_exact(sock, 4)
+        try:
+            length = int(prefix, 16)
+        except ValueError:
+            raise _AdbProtocolError(f"{command}: bad length prefix {prefix!r}") from None
+        payload = _recv_exact(sock, length).decode(errors="replace")
+    if status != b"OKAY":
+        raise _AdbProtocolError(f"{command}: {payload or status!r}")
+    return payload
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from sock."""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise _AdbProtocolError("ADB server closed the connection")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+# `adb devices -l` keys -> DeviceInfo fields
+_DEVICE_INFO_FIELDS = {"model": "model", "product": "product", "transport_id": "transport_id"}
+
+
+def _parse_device_lines(lines: List[str]) -> List[DeviceInfo]:
+    """Parse `adb devices -l` lines (without the header) into DeviceInfo."""
+    devices = []
+    for line in lines:
+        if not line.strip():
+            continue
+        parts = line.split()
+        if len(parts) >= 2:
+            # State, model and product repeat across devices and listings;
+            # interning keeps one copy each and makes state checks identity hits
+            fields = {"serial": parts[0], "state": sys.intern(parts[1])}
+            # Parse additional "key:value" info
+            for part in parts[2:]:
+                key, sep, value = part.partition(":")
+                if sep and key in _DEVICE_INFO_FIELDS:
+                    fields[_DEVICE_INFO_FIELDS[key]] = sys.intern(value)
+            devices.append(DeviceInfo(**fields))
+    return devices
+
+
+# (manager, resolved serial, device) of the innermost device_session, if any
+_DEVICE_SESSION: ContextVar[
+    Optional[Tuple["DeviceManager", Optional[str], u2.Device]]
+] = ContextVar("device_session", default=None)
+
+
 class DeviceManager:
     """Manages Android device connections.
 
@@ -92,38 +216,48 @@ class DeviceManager:
     """
 
     def __init__(self):
-        self._cache: Dict[str, CachedDevice] = {}
+        # Least recently used first; entries move to the end on every use
+        self._cache: "OrderedDict[str, CachedDevice]" = OrderedDict()
         self._cache_lock = threading.Lock()
+        # Written by select_device with a single assignment and read without a
+        # lock: rebinding an attribute is atomic in CPython, so readers see
+        # either the old or the new serial.
         self._selected_device: Optional[str] = None
-        self._selection_lock = threading.Lock()
 
     def _cleanup_expired_cache(self):
-        """Remove expired entries from cache. Must be called with lock held."""
-        expired_keys = [
-            key for key, cached in self._cache.items()
-            if cached.is_expired()
-        ]
-        for key in expired_keys:
-            logger.debug(f"Removing expired cache entry: {key}")
-            self._cache.pop(key, None)
+        """Remove expired entries from cache. Must be called with lock held.
+
+        Entries are kept in last-used order, so the scan stops at the first
+        entry that has not expired.
+        """
+        now = time.monotonic()
+        while self._cache:
+            key, cached = next(iter(self._cache.items()))
+            if not cached.is_expired(now=now):
+                break
+            logger.debug("Removing expired cache entry: %s", key)
+            self._cache.popitem(last=False)
 
     def _evict_oldest_if_needed(self):
         """Evict oldest cache entry if at capacity. Must be called with lock held."""
         if len(self._cache) >= MAX_CACHED_DEVICES:
-            # Find oldest entry
-            oldest_key = min(
-                self._cache.keys(),
-                key=lambda k: self._cache[k].last_used
-            )
-            logger.debug(f"Evicting oldest cache entry: {oldest_key}")
-            self._cache.pop(oldest_key, None)
+            oldest_key, _ = self._cache.popitem(last=False)
+            logger.debug("Evicting oldest cache entry: %s", oldest_key)
 
     def list_devices(self) -> List[DeviceInfo]:
         """List all connected Android devices.
 
+        Asks the ADB server directly over its socket; falls back to the adb
+        CLI (which also starts the server) when the server is unreachable.
+
         Returns:
             List of DeviceInfo objects
         """
+        try:
+            return _parse_device_lines(_adb_socket_request("host:devices-l").splitlines())
+        except (OSError, _AdbProtocolError) as e:
+            logger.debug("ADB server query failed, falling back to adb CLI: %s", e)
+
         try:
             result = subprocess.run(
                 ["adb", "devices", "-l"],
@@ -132,39 +266,7 @@ class DeviceManager:
                 timeout=10,
             )
             lines = result.stdout.strip().split("\n")[1:]  # Skip header
-
-            devices = []
-            for line in lines:
-                if not line.strip():
-                    continue
-                parts = line.split()
-                if len(parts) >= 2:
-                    serial = parts[0]
-                    state = parts[1]
-
-                    # Parse additional info
-                    model = None
-                    product = None
-                    transport_id = None
-                    for part in parts[2:]:
-                        if part.startswith("model:"):
-                            model = part.split(":")[1]
-                        elif part.startswith("product:"):
-                            product = part.split(":")[1]
-                        elif part.startswith("transport_id:"):
-                            transport_id = part.split(":")[1]
-
-                    devices.append(
-                        DeviceInfo(
-                            serial=serial,
-                            state=state,
-                            model=model,
-                            product=product,
-                            transport_id=transport_id,
-                        )
-                    )
-
-            return devices
+            return _parse_device_lines(lines)
 
         except subprocess.TimeoutExpired:
             logger.error("ADB devices command timed out")
@@ -173,7 +275,7 @@ class DeviceManager:
             logger.error("ADB not found in PATH")
             return []
         except Exception as e:
-            logger.error(f"Failed to list devices: {e}")
+            logger.error("Failed to list devices: %s", e)
             return []
 
     def get_available_devices(self) -> List[DeviceInfo]:
@@ -197,15 +299,13 @@ class DeviceManager:
         if not any(d.serial == device_id for d in devices):
             raise DeviceNotFoundError(device_id)
 
-        with self._selection_lock:
-            self._selected_device = device_id
-            logger.info(f"Selected device: {device_id}")
-            return True
+        self._selected_device = device_id
+        logger.info("Selected device: %s", device_id)
+        return True
 
     def get_selected_device(self) -> Optional[str]:
         """Get the currently selected device ID."""
-        with self._selection_lock:
-            return self._selected_device
+        return self._selected_device
 
     def _normalize_device_id(self, device_id: Optional[str]) -> Optional[str]:
         """Normalize device_id input to avoid passing sentinel values downstream."""
@@ -262,6 +362,10 @@ class DeviceManager:
         Raises:
             MultipleDevicesError: Multiple devices connected without selection.
         """
+        session = _DEVICE_SESSION.get()
+        if session is not None and session[0] is self:
+            if self._normalize_device_id(device_id) in (None, session[1]):
+                return session[1] or "default"
         resolved = self._resolve_device_id_with_policy(device_id)
         return resolved or "default"
 
@@ -283,6 +387,14 @@ class DeviceManager:
             DeviceNotFoundError: No devices available
             MultipleDevicesError: Multiple devices connected without selection
         """
+        session = _DEVICE_SESSION.get()
+        if session is not None and session[0] is self:
+            if self._normalize_device_id(device_id) in (None, session[1]):
+                # Inside device_session: reuse its handle, the session's own
+                # get_device already did the lookup, ping and error handling
+                yield session[2]
+                return
+
         # Resolve device ID
         resolved_id = self._resolve_device_id_with_policy(device_id)
 
@@ -299,7 +411,7 @@ class DeviceManager:
 
             if cache_key not in self._cache:
                 try:
-                    logger.info(f"Connecting to device: {cache_key}")
+                    logger.info("Connecting to device: %s", cache_key)
 
                     # Check if any device is available when using default
                     if resolved_id is None:
@@ -313,24 +425,77 @@ class DeviceManager:
                 except (DeviceNotFoundError, MultipleDevicesError):
                     raise
                 except Exception as e:
-                    logger.error(f"Failed to connect to device: {e}")
+                    logger.error("Failed to connect to device: %s", e)
                     raise DeviceConnectionError(cache_key, str(e))
 
             cached = self._cache[cache_key]
             cached.touch()  # Update last used time
+            self._cache.move_to_end(cache_key)
             device = cached.device
 
         # Validate connection and yield
         try:
-            device.info  # Ping to verify connection
+            if cached.last_used - cached.last_ping >= PING_TTL_SECONDS:
+                device.info  # Ping to verify connection
+                cached.last_ping = time.monotonic()
             yield device
         except Exception as e:
             # Connection lost, invalidate cache
             with self._cache_lock:
                 self._cache.pop(cache_key, None)
-            logger.warning(f"Device connection lost, cache invalidated: {cache_key}")
+            logger.warning("Device connection lost, cache invalidated: %s", cache_key)
             raise DeviceConnectionError(cache_key, f"Connection lost: {e}")
 
+    @contextlib.contextmanager
+    def device_session(
+        self, device_id: Optional[str] = None
+    ) -> Generator[u2.Device, None, None]:
+        """Hold one device connection for a run of tool calls.
+
+        Inside the block, get_device and resolve_device_id_or_default for the
+        same device (or for the default device) answer from the session,
+        skipping device ID resolution, the cache lock and the liveness ping. The session is
+        scoped with a ContextVar, so other threads and asyncio tasks are
+        unaffected.
+
+        Args:
+            device_id: Device serial (None for default/selected)
+
+        Yields:
+            uiautomator2 Device object
+
+        Raises:
+            Same as get_device.
+        """
+        resolved_id = self._resolve_device_id_with_policy(device_id)
+        with self.get_device(resolved_id) as device:
+            token = _DEVICE_SESSION.set((self, resolved_id, device))
+            try:
+                yield device
+            finally:
+                _DEVICE_SESSION.reset(token)
+
+    @contextlib.asynccontextmanager
+    async def aget_device(
+        self, device_id: Optional[str] = None
+    ) -> AsyncGenerator[u2.Device, None]:
+        """Async form of get_device for use from an event loop.
+
+        Resolution, connecting and the liveness ping run in a worker thread
+        so the loop is not blocked; the yielded device is the same
+        (synchronous) uiautomator2 client, so wrap its calls in
+        asyncio.to_thread too.
+        """
+        manager = self.get_device(device_id)
+        device = await asyncio.to_thread(manager.__enter__)
+        try:
+            yield device
+        except BaseException as exc:
+            if not await asyncio.to_thread(manager.__exit__, type(exc), exc, exc.__traceback__):
+                raise
+        else:
+            await asyncio.to_thread(manager.__exit__, None, None, None)
+
     def get_device_info(self, device_id: Optional[str] = None) -> dict:
         """Get detailed device information.
 
@@ -364,7 +529,7 @@ class DeviceManager:
         cache_key = device_id or "default"
         with self._cache_lock:
             self._cache.pop(cache_key, None)
-        logger.info(f"Disconnected device: {cache_key}")
+        logger.info("Disconnected device: %s", cache_key)
 
     def disconnect_all(self):
         """Disconnect all cached devices."""
@@ -381,7 +546,13 @@ _manager_lock = threading.Lock()
 def get_device_manager() -> DeviceManager:
     """Get the global DeviceManager instance."""
     global _device_manager
+    # Lock-free once created; the lock only guards first construction
+    instance = _device_manager
+    if instance is not None:
+        return instance
     with _manager_lock:
         if _device_manager is None:
             _device_manager = DeviceManager()
+            # Drop pooled connections before interpreter teardown
+            atexit.register(_device_manager.disconnect_all)
         return _device_manager
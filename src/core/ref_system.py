@@ -14,15 +14,30 @@ Usage:
 """
 
 import hashlib
+import heapq
+import io
+from bisect import bisect_right
 from itertools import count
 import logging
 import re
+import sys
 import threading
 import time
 import uuid
-from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict, List, Optional, Tuple
+from functools import cached_property
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from xml.etree import ElementTree as ET
 
 # Try to import defusedxml for security; fallback to standard library with warning
@@ -43,12 +58,17 @@ if not _USE_DEFUSEDXML:
         "Install with: pip install defusedxml"
     )
 
-_BOUNDS_RE = re.compile(r"\d+")
+# Prebuilt ref strings for the first few thousand elements of each device
+_REF_IDS: Tuple[str, ...] = tuple(f"e{i}" for i in range(4096))
+_BOUNDS_RE = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ElementInfo:
-    """Information about a single UI element."""
+    """Information about a single UI element.
+
+    Immutable, so snapshots can share unchanged elements safely.
+    """
 
     ref: str  # e.g., "e0", "e1"
     class_name: str  # e.g., "android.widget.Button"
@@ -65,26 +85,28 @@ class ElementInfo:
     scrollable: bool = False
     long_clickable: bool = False
     index: int = 0
-
-    @property
-    def center(self) -> Tuple[int, int]:
-        """Get center coordinates of the element."""
+    depth: int = 0  # nesting level in the hierarchy (root nodes are 0)
+    # Derived from bounds once at construction
+    center: Tuple[int, int] = field(init=False, repr=False, compare=False)
+    width: int = field(init=False, repr=False, compare=False)
+    height: int = field(init=False, repr=False, compare=False)
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
         left, top, right, bottom = self.bounds
-        return ((left + right) // 2, (top + bottom) // 2)
-
-    @property
-    def width(self) -> int:
-        """Get element width."""
-        return self.bounds[2] - self.bounds[0]
-
-    @property
-    def height(self) -> int:
-        """Get element height."""
-        return self.bounds[3] - self.bounds[1]
+        object.__setattr__(self, "center", ((left + right) // 2, (top + bottom) // 2))
+        object.__setattr__(self, "width", right - left)
+        object.__setattr__(self, "height", bottom - top)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for MCP response."""
-        return {
+        """Convert to dictionary for MCP response.
+
+        Built once and shared, also by every snapshot that reuses this
+        element; callers must not mutate it.
+        """
+        if self._dict is not None:
+            return self._dict
+        data = {
             "class": self.class_name,
             "text": self.text,
             "content-desc": self.content_desc,
@@ -97,6 +119,8 @@ class ElementInfo:
             "scrollable": self.scrollable,
             "selected": self.selected,
         }
+        object.__setattr__(self, "_dict", data)
+        return data
 
     def matches(
         self,
@@ -133,18 +157,76 @@ class ElementInfo:
         return True
 
 
+# Criteria in the order _build_matcher tests them: most selective first
+_MATCHER_ORDER = (
+    "resource_id",
+    "clickable",
+    "text",
+    "content_desc",
+    "resource_id_contains",
+    "text_contains",
+    "class_name",
+    "enabled",
+)
+
+
+def _build_matcher(criteria: dict) -> Callable[[ElementInfo], bool]:
+    """Build a predicate equivalent to ElementInfo.matches(**criteria).
+
+    Only the criteria actually given become checks, so a single criterion
+    costs a single comparison per element.
+    """
+    unknown = criteria.keys() - set(_MATCHER_ORDER)
+    if unknown:
+        raise TypeError(f"Unknown match criteria: {', '.join(sorted(unknown))}")
+
+    checks: List[Callable[[ElementInfo], bool]] = []
+    for key in _MATCHER_ORDER:
+        value = criteria.get(key)
+        if value is None:
+            continue
+        if key == "text_contains":
+            checks.append(lambda e, v=value: e.text is not None and v in e.text)
+        elif key == "resource_id_contains":
+            checks.append(
+                lambda e, v=value: e.resource_id is not None and v in e.resource_id
+            )
+        else:
+            checks.append(lambda e, a=key, v=value: getattr(e, a) == v)
+
+    if not checks:
+        return lambda e: True
+    if len(checks) == 1:
+        return checks[0]
+
+    def match(elem: ElementInfo) -> bool:
+        for check in checks:
+            if not check(elem):
+                return False
+        return True
+
+    return match
+
+
 def _parse_bounds(bounds_str: str) -> Tuple[int, int, int, int]:
     """Parse bounds string '[100,200][300,400]' -> (100, 200, 300, 400)."""
-    match = _BOUNDS_RE.findall(bounds_str)
-    if len(match) >= 4:
-        return tuple(map(int, match[:4]))
-    logger.debug(f"Invalid bounds string: {bounds_str}")
+    match = _BOUNDS_RE.fullmatch(bounds_str)
+    if match:
+        return (int(match[1]), int(match[2]), int(match[3]), int(match[4]))
+    logger.debug("Invalid bounds string: %s", bounds_str)
     return (0, 0, 0, 0)
 
 
 @dataclass
 class Snapshot:
-    """A snapshot of device UI state with ref mappings."""
+    """A snapshot of device UI state with ref mappings.
+
+    Besides the ``refs`` mapping, the snapshot keeps parallel columns
+    (``texts``, ``resource_ids``, ``bounds``) aligned with ``elements``, plus
+    exact-text and exact-resource-ID indexes and the positions of clickable
+    elements, built once at construction. ``refs`` must not be mutated
+    afterwards.
+    """
 
     snapshot_id: str
     device_id: str
@@ -154,63 +236,236 @@ class Snapshot:
     screen_size: Tuple[int, int]  # (width, height)
     refs: Dict[str, ElementInfo] = field(default_factory=dict)
     xml_hash: str = ""
+    # time.monotonic() at creation; staleness is measured against this, while
+    # the wall-clock timestamp is only reported
+    monotonic_timestamp: float = field(default_factory=time.monotonic, repr=False, compare=False)
+    elements: List[ElementInfo] = field(init=False, repr=False, compare=False)
+    texts: List[Optional[str]] = field(init=False, repr=False, compare=False)
+    resource_ids: List[Optional[str]] = field(init=False, repr=False, compare=False)
+    bounds: List[Tuple[int, int, int, int]] = field(init=False, repr=False, compare=False)
+    text_index: Dict[str, List[int]] = field(init=False, repr=False, compare=False)
+    resource_id_index: Dict[str, List[int]] = field(init=False, repr=False, compare=False)
+    clickable_positions: List[int] = field(init=False, repr=False, compare=False)
+    positions: Dict[str, int] = field(init=False, repr=False, compare=False)
+    # Distinct texts, longest first, with their negated lengths for bisecting
+    distinct_texts: List[str] = field(init=False, repr=False, compare=False)
+    _neg_text_lengths: List[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.elements = list(self.refs.values())
+        self.positions = {ref: i for i, ref in enumerate(self.refs)}
+        self.texts = [elem.text for elem in self.elements]
+        self.resource_ids = [elem.resource_id for elem in self.elements]
+        self.bounds = [elem.bounds for elem in self.elements]
+        self.text_index = {}
+        for i, text in enumerate(self.texts):
+            if text is not None:
+                self.text_index.setdefault(text, []).append(i)
+        self.resource_id_index = {}
+        for i, resource_id in enumerate(self.resource_ids):
+            if resource_id is not None:
+                self.resource_id_index.setdefault(resource_id, []).append(i)
+        self.clickable_positions = [
+            i for i, elem in enumerate(self.elements) if elem.clickable
+        ]
+        self.distinct_texts = sorted(self.text_index, key=len, reverse=True)
+        self._neg_text_lengths = [-len(text) for text in self.distinct_texts]
+
+    def text_contains_positions(self, needle: str) -> Iterator[int]:
+        """Yield element positions whose text contains needle, in order.
+
+        Only distinct texts at least as long as needle are scanned; repeated
+        texts (list rows, labels) are tested once. Each text's positions are
+        already ascending, so they are merged lazily and a caller that stops
+        after a few matches does not order the rest.
+        """
+        cut = bisect_right(self._neg_text_lengths, -len(needle))
+        index = self.text_index
+        return heapq.merge(
+            *(index[text] for text in self.distinct_texts[:cut] if needle in text)
+        )
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Short hash of what element lookups match on.
+
+        Covers text, resource ID, content description, class and bounds of
+        every element. Equal fingerprints mean those are unchanged, even if
+        state such as focus or checked differs.
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        for elem in self.elements:
+            digest.update(
+                f"{elem.text}\x1f{elem.resource_id}\x1f{elem.content_desc}\x1f"
+                f"{elem.class_name}\x1f{elem.bounds}\x1e".encode()
+            )
+        return digest.hexdigest()
 
     def is_stale(self, max_age_seconds: float = 30.0) -> bool:
         """Check if snapshot is too old."""
-        return time.time() - self.timestamp > max_age_seconds
+        return self.age_seconds > max_age_seconds
 
     @property
     def age_seconds(self) -> float:
         """Get snapshot age in seconds."""
-        return time.time() - self.timestamp
+        return time.monotonic() - self.monotonic_timestamp
 
     def get_element(self, ref: str) -> Optional[ElementInfo]:
         """Get element by ref ID."""
         return self.refs.get(ref)
 
-    def find_elements(self, **criteria) -> List[ElementInfo]:
-        """Find elements matching criteria."""
-        return [elem for elem in self.refs.values() if elem.matches(**criteria)]
+    def subtree_span(self, ref: str) -> Tuple[int, int]:
+        """Return the [start, stop) element positions of ref and its descendants.
+
+        Elements are stored in pre-order, so a subtree is the run of elements
+        after ref that sit deeper than it.
+
+        Raises:
+            RefNotFoundError: ref is not in this snapshot
+        """
+        start = self.positions.get(ref)
+        if start is None:
+            raise RefNotFoundError(ref, list(self.refs.keys()))
+        elements = self.elements
+        depth = elements[start].depth
+        stop = start + 1
+        while stop < len(elements) and elements[stop].depth > depth:
+            stop += 1
+        return start, stop
+
+    def _candidate_positions(self, criteria: dict) -> Optional[Iterable[int]]:
+        """Narrow criteria to ascending element positions through the columns.
+
+        Uses the most selective available column; returns None when no
+        criterion can be answered from the columns.
+        """
+        text = criteria.get("text")
+        if text is not None:
+            return self.text_index.get(text, ())
+        resource_id = criteria.get("resource_id")
+        if resource_id is not None:
+            return self.resource_id_index.get(resource_id, ())
+        text_contains = criteria.get("text_contains")
+        if text_contains is not None:
+            return self.text_contains_positions(text_contains)
+        resource_id_contains = criteria.get("resource_id_contains")
+        if resource_id_contains is not None:
+            return [
+                i
+                for i, resource_id in enumerate(self.resource_ids)
+                if resource_id is not None and resource_id_contains in resource_id
+            ]
+        if criteria.get("clickable") is True:
+            return self.clickable_positions
+        return None
+
+    def iter_elements(
+        self, root_ref: Optional[str] = None, **criteria
+    ) -> Iterator[ElementInfo]:
+        """Yield elements matching criteria in hierarchy order.
+
+        Text, resource ID and clickable criteria narrow the candidates through
+        the columns first, so the remaining predicates only run on likely
+        matches. Callers that need only the first few matches can stop early.
+        With root_ref, only that element and its descendants are searched.
+        """
+        elements = self.elements
+        if root_ref is not None:
+            start, stop = self.subtree_span(root_ref)
+        else:
+            start, stop = 0, len(elements)
+        positions = self._candidate_positions(criteria)
+        if positions is None:
+            candidates: Iterable[ElementInfo] = elements[start:stop]
+        else:
+            candidates = (elements[i] for i in positions if start <= i < stop)
+        return filter(_build_matcher(criteria), candidates)
+
+    def find_elements(self, root_ref: Optional[str] = None, **criteria) -> List[ElementInfo]:
+        """Find elements matching criteria (optionally under root_ref)."""
+        return list(self.iter_elements(root_ref, **criteria))
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for MCP response."""
+        """Convert to dictionary for MCP response.
+
+        Built once per snapshot and shared; callers must not mutate it.
+        """
+        return self._dict
+
+    @cached_property
+    def _dict(self) -> dict:
         return {
             "snapshot_id": self.snapshot_id,
             "url": f"{self.package}/{self.activity}",
             "screen_size": {"width": self.screen_size[0], "height": self.screen_size[1]},
             "element_count": len(self.refs),
+            "fingerprint": self.fingerprint,
             "timestamp": self.timestamp,
             "refs": {ref: elem.to_dict() for ref, elem in self.refs.items()},
         }
 
 
+class _HashingReader(io.RawIOBase):
+    """Binary reader that feeds every chunk it returns into a hash."""
+
+    def __init__(self, source: BinaryIO, digest: "hashlib._Hash"):
+        self._source = source
+        self._digest = digest
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._source.read(size)
+        self._digest.update(chunk)
+        return chunk
+
+
 class SnapshotManager:
     """Manages snapshots and ref mappings for multiple devices.
 
-    Thread-safe implementation for concurrent access.
+    Thread-safe implementation for concurrent access. Each device has its own
+    lock, so work on one device never waits on another.
     """
 
     def __init__(self, max_snapshots_per_device: int = 5, default_stale_seconds: float = 30.0):
-        self._snapshots: Dict[str, Dict[str, Snapshot]] = {}  # device_id -> {id: Snapshot}
-        self._snapshot_order: Dict[str, Deque[str]] = {}  # device_id -> [snapshot_id]
-        self._current: Dict[str, str] = {}  # device_id -> snapshot_id
-        self._lock = threading.Lock()
+        # device_id -> fixed-size ring of recent snapshots, and the newest slot
+        self._history: Dict[str, List[Optional[Snapshot]]] = {}
+        self._head: Dict[str, int] = {}
+        # device_id -> current Snapshot; read without a lock (see get_current_snapshot)
+        self._current_snapshot: Dict[str, Snapshot] = {}
+        # device_id -> {natural key: element} from the latest snapshot (hash-consing)
+        self._interned: Dict[str, Dict[tuple, ElementInfo]] = {}
+        self._ref_counters: Dict[str, "count[int]"] = {}  # device_id -> ref counter
+        self._locks: Dict[str, threading.Lock] = {}  # device_id -> lock
+        self._locks_lock = threading.Lock()  # guards creation of per-device locks
         self._max_snapshots = max_snapshots_per_device
         self._default_stale_seconds = default_stale_seconds
 
+    def _device_lock(self, device_id: str) -> threading.Lock:
+        """Get the lock for a device, creating it on first use."""
+        lock = self._locks.get(device_id)
+        if lock is None:
+            with self._locks_lock:
+                lock = self._locks.setdefault(device_id, threading.Lock())
+        return lock
+
     def create_snapshot(
         self,
         device_id: str,
-        xml_content: str,
+        xml_content: Union[bytes, str],
         package: str,
         activity: str,
         screen_size: Tuple[int, int],
     ) -> Snapshot:
         """Create a new snapshot from UI hierarchy XML.
 
+        Only the parsed element index and a hash of the XML are kept; neither
+        the XML string nor its parse tree outlives this call.
+
         Args:
             device_id: Device identifier
-            xml_content: UI hierarchy XML string
+            xml_content: UI hierarchy XML, as bytes or str
             package: Current app package name
             activity: Current activity name
             screen_size: (width, height) tuple
@@ -218,9 +473,15 @@ class SnapshotManager:
         Returns:
             New Snapshot with ref mappings
         """
-        with self._lock:
+        # Encode once; the parser hashes the bytes as it reads them
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode()
+        digest = hashlib.blake2b(digest_size=16)
+
+        with self._device_lock(device_id):
             # Parse XML and generate refs
-            refs = self._parse_hierarchy(xml_content)
+            refs = self._parse_hierarchy(xml_content, device_id, digest)
+            xml_hash = digest.hexdigest()
 
             # Create snapshot with unique ID
             snapshot_id = f"{device_id}_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
@@ -232,93 +493,154 @@ class SnapshotManager:
                 timestamp=time.time(),
                 screen_size=screen_size,
                 refs=refs,
-                xml_hash=hashlib.md5(xml_content.encode()).hexdigest(),
+                xml_hash=xml_hash,
             )
 
-            # Store in cache
-            if device_id not in self._snapshots:
-                self._snapshots[device_id] = {}
-                self._snapshot_order[device_id] = deque()
-            self._snapshots[device_id][snapshot_id] = snapshot
-            self._snapshot_order[device_id].append(snapshot_id)
+            # Store in the ring, overwriting the oldest (keep at least 1)
+            ring = self._history.get(device_id)
+            if ring is None:
+                ring = self._history[device_id] = [None] * max(1, self._max_snapshots)
+            head = (self._head.get(device_id, -1) + 1) % len(ring)
+            ring[head] = snapshot
+            self._head[device_id] = head
 
-            # Cleanup old snapshots (ensure max is at least 1)
-            max_allowed = max(1, self._max_snapshots)
-            while len(self._snapshot_order[device_id]) > max_allowed:
-                old_id = self._snapshot_order[device_id].popleft()
-                self._snapshots[device_id].pop(old_id, None)
-
-            # Set as current
-            self._current[device_id] = snapshot_id
+            # Publish as current with a single dict assignment
+            self._current_snapshot[device_id] = snapshot
 
             return snapshot
 
-    def _parse_hierarchy(self, xml_content: str) -> Dict[str, ElementInfo]:
-        """Parse UI hierarchy XML and generate ref mappings."""
+    def _parse_hierarchy(
+        self,
+        xml_content: Union[bytes, str],
+        device_id: Optional[str] = None,
+        digest: Optional["hashlib._Hash"] = None,
+    ) -> Dict[str, ElementInfo]:
+        """Parse UI hierarchy XML and generate ref mappings.
+
+        With a device_id, elements are hash-consed against the device's
+        previous snapshot: an element with the same natural key keeps its ref,
+        and an unchanged element reuses the same ElementInfo object.
+        With a digest, bytes XML is fed to it as the parser reads it, so
+        hashing needs no second pass over the buffer.
+        Must be called with the device's lock held.
+        """
         refs: Dict[str, ElementInfo] = {}
-        counter = count()
-
-        def traverse(node: ET.Element):
-            """Recursively traverse and assign refs."""
-            attrib = node.attrib
+        if device_id is None:
+            counter = count()
+            previous: Dict[tuple, ElementInfo] = {}
+        else:
+            counter = self._ref_counters.setdefault(device_id, count())
+            previous = self._interned.get(device_id, {})
+        interned: Dict[tuple, ElementInfo] = {}
+        occurrences: Dict[tuple, int] = {}
+
+        def visit(attrib: Dict[str, str], depth: int):
+            """Assign a ref to one node."""
             bounds = _parse_bounds(attrib.get("bounds", "[0,0][0,0]"))
 
             # Only create ref for elements with valid bounds
-            if bounds != (0, 0, 0, 0):
-                ref = f"e{next(counter)}"
-
-                element = ElementInfo(
-                    ref=ref,
-                    class_name=attrib.get("class", "node"),
-                    bounds=bounds,
-                    resource_id=attrib.get("resource-id") or None,
-                    text=attrib.get("text") or None,
-                    content_desc=attrib.get("content-desc") or None,
-                    package=attrib.get("package") or None,
-                    clickable=attrib.get("clickable") == "true",
-                    focusable=attrib.get("focusable") == "true",
-                    enabled=attrib.get("enabled", "true") == "true",
-                    checked=(
-                        attrib.get("checked") == "true"
-                        if "checked" in attrib
-                        else None
-                    ),
-                    selected=attrib.get("selected") == "true",
-                    scrollable=attrib.get("scrollable") == "true",
-                    long_clickable=attrib.get("long-clickable") == "true",
-                    index=int(attrib.get("index", 0)),
-                )
-                refs[ref] = element
-
-            # Process children
-            for child in node:
-                traverse(child)
+            if bounds == (0, 0, 0, 0):
+                return
+            resource_id = attrib.get("resource-id")
+            package = attrib.get("package")
+            # Class, package and resource ID repeat across many nodes; interning
+            # shares one str per value and makes equality checks identity checks
+            fields = dict(
+                class_name=sys.intern(attrib.get("class", "node")),
+                bounds=bounds,
+                resource_id=sys.intern(resource_id) if resource_id else None,
+                text=attrib.get("text") or None,
+                content_desc=attrib.get("content-desc") or None,
+                package=sys.intern(package) if package else None,
+                clickable=attrib.get("clickable") == "true",
+                focusable=attrib.get("focusable") == "true",
+                enabled=attrib.get("enabled", "true") == "true",
+                checked=(
+                    attrib.get("checked") == "true"
+                    if "checked" in attrib
+                    else None
+                ),
+                selected=attrib.get("selected") == "true",
+                scrollable=attrib.get("scrollable") == "true",
+                long_clickable=attrib.get("long-clickable") == "true",
+                index=int(attrib.get("index", 0)),
+                depth=depth,
+            )
+            key = (
+                fields["package"],
+                fields["resource_id"],
+                fields["text"],
+                fields["content_desc"],
+                bounds,
+                fields["class_name"],
+            )
+            # Identical nodes are told apart by their order of appearance
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+            key += (occurrence,)
+
+            prior = previous.get(key)
+            if prior is not None:
+                element = ElementInfo(ref=prior.ref, **fields)
+                if element == prior:
+                    element = prior
+            else:
+                number = next(counter)
+                ref = _REF_IDS[number] if number < len(_REF_IDS) else f"e{number}"
+                element = ElementInfo(ref=ref, **fields)
+            interned[key] = element
+            refs[element.ref] = element
 
         try:
-            # Use defusedxml to prevent XXE attacks
-            root = DefusedET.fromstring(xml_content)
-            # Handle both <hierarchy> and direct <node> roots
-            if root.tag == "hierarchy":
-                for child in root:
-                    traverse(child)
+            # Use defusedxml to prevent XXE attacks. Nodes are visited in a flat
+            # loop on "start" events (document order, attributes already
+            # parsed) and cleared on "end", so the full tree is never held.
+            if isinstance(xml_content, bytes):
+                source = io.BytesIO(xml_content)
+                if digest is not None:
+                    source = _HashingReader(source, digest)
             else:
-                traverse(root)
+                source = io.StringIO(xml_content)
+            depth = -1
+            for event, node in DefusedET.iterparse(
+                source, events=("start", "end")
+            ):
+                if event == "end":
+                    depth -= 1
+                    node.clear()
+                    continue
+                depth += 1
+                # Handle both <hierarchy> and direct <node> roots
+                if depth == 0 and node.tag == "hierarchy":
+                    depth = -1  # its children are the top-level nodes
+                    continue
+                visit(node.attrib, depth)
         except ET.ParseError as e:
             raise ValueError(f"Invalid XML: {e}")
         except Exception as e:
             # defusedxml may raise different exceptions for malicious XML
-            logger.warning(f"XML parsing rejected (possible security issue): {e}")
+            logger.warning("XML parsing rejected (possible security issue): %s", e)
             raise ValueError(f"Invalid or potentially malicious XML: {e}")
 
+        if device_id is not None:
+            self._interned[device_id] = interned
         return refs
 
     def get_current_snapshot(self, device_id: str) -> Optional[Snapshot]:
-        """Get the current active snapshot for a device."""
-        with self._lock:
-            snapshot_id = self._current.get(device_id)
-            if not snapshot_id:
-                return None
-            return self._snapshots.get(device_id, {}).get(snapshot_id)
+        """Get the current active snapshot for a device.
+
+        Lock-free: snapshots are never mutated after creation and are published
+        with a single dict assignment, which is atomic in CPython, so a reader
+        sees either the previous or the new snapshot, never a partial one.
+        """
+        return self._current_snapshot.get(device_id)
+
+    def get_snapshot(self, device_id: str, snapshot_id: str) -> Optional[Snapshot]:
+        """Get one of a device's recent snapshots by ID."""
+        for snapshot in self._history.get(device_id, ()):
+            if snapshot is not None and snapshot.snapshot_id == snapshot_id:
+                return snapshot
+        return None
 
     def resolve_ref(
         self,
@@ -347,9 +669,14 @@ class SnapshotManager:
             raise RefNotFoundError(ref, [])
 
         if validate_staleness:
-            max_age = max_stale_seconds or self._default_stale_seconds
-            if snapshot.is_stale(max_age):
-                raise StaleRefError(ref, snapshot.age_seconds)
+            max_age = (
+                self._default_stale_seconds
+                if max_stale_seconds is None
+                else max_stale_seconds
+            )
+            age = snapshot.age_seconds
+            if age > max_age:
+                raise StaleRefError(ref, age)
 
         element = snapshot.get_element(ref)
         if not element:
@@ -363,6 +690,44 @@ class SnapshotManager:
         element = self.resolve_ref(device_id, ref)
         return element.center
 
+    def get_positions(
+        self,
+        device_id: str,
+        refs: Sequence[str],
+        max_stale_seconds: Optional[float] = None,
+    ) -> List[Tuple[int, int]]:
+        """Get center positions for several refs against one snapshot.
+
+        The current snapshot is looked up and age-checked once (against
+        max_stale_seconds, default the manager's limit), and every ref
+        resolves against that same snapshot even if a newer one is published
+        meanwhile.
+
+        Raises:
+            RefNotFoundError: If no snapshot or a ref is not found
+            StaleRefError: If snapshot is too old
+        """
+        if not refs:
+            return []
+        snapshot = self.get_current_snapshot(device_id)
+        if not snapshot:
+            raise RefNotFoundError(refs[0], [])
+
+        if max_stale_seconds is None:
+            max_stale_seconds = self._default_stale_seconds
+        age = snapshot.age_seconds
+        if age > max_stale_seconds:
+            raise StaleRefError(refs[0], age)
+
+        lookup = snapshot.refs.get
+        positions = []
+        for ref in refs:
+            element = lookup(ref)
+            if element is None:
+                raise RefNotFoundError(ref, list(snapshot.refs.keys()))
+            positions.append(element.center)
+        return positions
+
     def find_elements(self, device_id: str, **criteria) -> List[ElementInfo]:
         """Find elements matching criteria in current snapshot."""
         snapshot = self.get_current_snapshot(device_id)
@@ -370,19 +735,41 @@ class SnapshotManager:
             return []
         return snapshot.find_elements(**criteria)
 
+    def expire_current(self, device_id: str):
+        """Stop serving refs from a device's current snapshot.
+
+        For actions that may change the screen (taps, typing, swipes,
+        navigation, rotation): ref lookups fail with RefNotFoundError until the next snapshot,
+        instead of resolving to positions from the previous screen. History
+        and the parse caches are kept, unlike invalidate().
+        """
+        self._current_snapshot.pop(device_id, None)
+
     def invalidate(self, device_id: str):
         """Invalidate all snapshots for a device."""
-        with self._lock:
-            self._snapshots.pop(device_id, None)
-            self._snapshot_order.pop(device_id, None)
-            self._current.pop(device_id, None)
+        with self._device_lock(device_id):
+            self._history.pop(device_id, None)
+            self._head.pop(device_id, None)
+            self._current_snapshot.pop(device_id, None)
+            self._interned.pop(device_id, None)
+            self._ref_counters.pop(device_id, None)
 
     def clear_all(self):
         """Clear all snapshots for all devices."""
-        with self._lock:
-            self._snapshots.clear()
-            self._snapshot_order.clear()
-            self._current.clear()
+        with self._locks_lock:
+            # Acquire in a fixed order so concurrent clear_all calls can't deadlock
+            locks = [self._locks[device_id] for device_id in sorted(self._locks)]
+            for lock in locks:
+                lock.acquire()
+            try:
+                self._history.clear()
+                self._head.clear()
+                self._current_snapshot.clear()
+                self._interned.clear()
+                self._ref_counters.clear()
+            finally:
+                for lock in reversed(locks):
+                    lock.release()
 
 
 # Global singleton
@@ -393,6 +780,9 @@ _manager_lock = threading.Lock()
 def get_snapshot_manager() -> SnapshotManager:
     """Get the global SnapshotManager instance."""
     global _snapshot_manager
+    instance = _snapshot_manager
+    if instance is not None:
+        return instance
     with _manager_lock:
         if _snapshot_manager is None:
             _snapshot_manager = SnapshotManager()
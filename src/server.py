@@ -37,96 +37,36 @@ Tools Available:
         - device_snapshot: UI snapshot with refs (core tool)
         - screenshot: Capture screen image
         - find_element: Search for elements
+        - find_elements: Run several searches against one snapshot
 
     Interactions:
         - device_tap: Tap on element
+        - device_tap_many: Tap several elements in order
+        - device_batch: Run several gestures/keys in one shell round trip
         - device_double_tap: Double tap
         - device_long_press: Long press
         - device_type: Type text
         - device_swipe: Swipe gesture
+        - scroll_to_top: Fling a scrollable list to its beginning
         - clear_text: Clear text field
 """
+import importlib
 import logging
-from typing import Optional
-
-from mcp.server.fastmcp import FastMCP
+import os
+import stat
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 
 # Import core modules for validation
 from .core import get_device_manager, validate_device_id
 
-# Import tool implementations
-from .tools.device import (
-    device_info as _device_info,
-    device_list as _device_list,
-    device_select as _device_select,
-    device_unlock as _device_unlock,
-)
-from .tools.interaction import (
-    clear_text as _clear_text,
-    device_double_tap as _device_double_tap,
-    device_long_press as _device_long_press,
-    device_swipe as _device_swipe,
-    device_tap as _device_tap,
-    device_type as _device_type,
-)
-from .tools.navigation import (
-    app_current as _app_current,
-    app_start as _app_start,
-    app_stop as _app_stop,
-    go_back as _go_back,
-    go_home as _go_home,
-    open_notification as _open_notification,
-    open_quick_settings as _open_quick_settings,
-    press_key as _press_key,
-    set_orientation as _set_orientation,
-)
-from .tools.snapshot import (
-    device_snapshot as _device_snapshot,
-    find_element as _find_element,
-    screenshot as _screenshot,
-)
-from .tools.wait import (
-    wait as _wait,
-    wait_for_activity as _wait_for_activity,
-    wait_for_element as _wait_for_element,
-    wait_for_element_gone as _wait_for_element_gone,
-    wait_for_text as _wait_for_text,
-)
-from .tools.watcher import (
-    watcher_add as _watcher_add,
-    watcher_list as _watcher_list,
-    watcher_remove as _watcher_remove,
-    watcher_start as _watcher_start,
-    watcher_stop as _watcher_stop,
-    watcher_trigger_once as _watcher_trigger_once,
-)
-from .tools.recording import (
-    add_gesture_event as _add_gesture_event,
-    delete_gesture_recording as _delete_gesture_recording,
-    export_gesture_recording as _export_gesture_recording,
-    import_gesture_recording as _import_gesture_recording,
-    list_gesture_recordings as _list_gesture_recordings,
-    play_gesture_recording as _play_gesture_recording,
-    start_gesture_recording as _start_gesture_recording,
-    stop_gesture_recording as _stop_gesture_recording,
-)
-from .tools.performance import (
-    get_performance_metrics as _get_performance_metrics,
-    start_performance_monitor as _start_performance_monitor,
-    stop_performance_monitor as _stop_performance_monitor,
-)
-
-# MCP Server
-mcp = FastMCP("android-ui-agent")
-
-# Re-export cache lock for backwards compatibility with tests
-_cache_lock = get_device_manager()._cache_lock
-
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
 
-# === Tool registrations ===
-
-def _register_tool(func, name: Optional[str] = None):
-    return mcp.tool(name=name)(func)
+# FastMCP and the tool modules are imported on first use (see get_mcp and
+# __getattr__): importing FastMCP alone takes a large share of cold start,
+# and nothing needs it until the server actually runs.
 
 
 # Backwards compatibility alias
@@ -135,8 +75,10 @@ def capture_screenshot(device_id: Optional[str] = None) -> str:
 
     Deprecated: Use screenshot() instead.
     """
-    if not validate_device_id(device_id):
+    if device_id is not None and not validate_device_id(device_id):
         raise ValueError(f"Invalid device_id format: {device_id}")
+    from .tools.snapshot import screenshot as _screenshot
+
     result = _screenshot(device_id)
     return result["image"]
 
@@ -147,7 +89,7 @@ def dump_ui_hierarchy(device_id: Optional[str] = None, pretty: bool = False) ->
 
     Deprecated: Use device_snapshot() for ref-based workflow.
     """
-    if not validate_device_id(device_id):
+    if device_id is not None and not validate_device_id(device_id):
         raise ValueError(f"Invalid device_id format: {device_id}")
 
     device_manager = get_device_manager()
@@ -157,87 +99,148 @@ def dump_ui_hierarchy(device_id: Optional[str] = None, pretty: bool = False) ->
 
 # === Tool Registrations ===
 
-_TOOL_SECTIONS = (
-    {
-        # Device Management Tools
-        "device_list": _device_list,
-        "device_select": _device_select,
-        "device_info": _device_info,
-        "device_unlock": _device_unlock,
-    },
-    {
-        # Snapshot & Element Tools
-        "device_snapshot": _device_snapshot,
-        "screenshot": _screenshot,
-        "find_element": _find_element,
-    },
-    {
-        # Interaction Tools
-        "device_tap": _device_tap,
-        "device_double_tap": _device_double_tap,
-        "device_long_press": _device_long_press,
-        "device_type": _device_type,
-        "device_swipe": _device_swipe,
-        "clear_text": _clear_text,
-    },
-    {
-        # Navigation Tools
-        "app_start": _app_start,
-        "app_stop": _app_stop,
-        "app_current": _app_current,
-        "go_back": _go_back,
-        "go_home": _go_home,
-        "press_key": _press_key,
-        "open_notification": _open_notification,
-        "open_quick_settings": _open_quick_settings,
-        "set_orientation": _set_orientation,
-    },
-    {
-        # Wait Tools
-        "wait_seconds": _wait,
-        "wait_for_element": _wait_for_element,
-        "wait_for_text": _wait_for_text,
-        "wait_for_activity": _wait_for_activity,
-        "wait_for_element_gone": _wait_for_element_gone,
-    },
-    {
-        # Watcher Tools
-        "watcher_add": _watcher_add,
-        "watcher_remove": _watcher_remove,
-        "watcher_list": _watcher_list,
-        "watcher_start": _watcher_start,
-        "watcher_stop": _watcher_stop,
-        "watcher_trigger_once": _watcher_trigger_once,
-    },
-    {
-        # Recording Tools
-        "start_gesture_recording": _start_gesture_recording,
-        "add_gesture_event": _add_gesture_event,
-        "stop_gesture_recording": _stop_gesture_recording,
-        "play_gesture_recording": _play_gesture_recording,
-        "list_gesture_recordings": _list_gesture_recordings,
-        "export_gesture_recording": _export_gesture_recording,
-        "import_gesture_recording": _import_gesture_recording,
-        "delete_gesture_recording": _delete_gesture_recording,
-    },
-    {
-        # Performance Tools
-        "get_performance_metrics": _get_performance_metrics,
-        "start_performance_monitor": _start_performance_monitor,
-        "stop_performance_monitor": _stop_performance_monitor,
-    },
+# (tool name, module under src.tools, function name), in registration order
+_TOOLS = (
+    # Device Management Tools
+    ("device_list", "device", "device_list"),
+    ("device_select", "device", "device_select"),
+    ("device_info", "device", "device_info"),
+    ("device_unlock", "device", "device_unlock"),
+    # Snapshot & Element Tools
+    ("device_snapshot", "snapshot", "device_snapshot"),
+    ("screenshot", "snapshot", "screenshot"),
+    ("find_element", "snapshot", "find_element"),
+    ("find_elements", "snapshot", "find_elements"),
+    # Interaction Tools
+    ("device_tap", "interaction", "device_tap"),
+    ("device_tap_many", "interaction", "device_tap_many"),
+    ("device_batch", "interaction", "device_batch"),
+    ("device_double_tap", "interaction", "device_double_tap"),
+    ("device_long_press", "interaction", "device_long_press"),
+    ("device_type", "interaction", "device_type"),
+    ("device_swipe", "interaction", "device_swipe"),
+    ("scroll_to_top", "interaction", "scroll_to_top"),
+    ("clear_text", "interaction", "clear_text"),
+    # Navigation Tools
+    ("app_start", "navigation", "app_start"),
+    ("app_stop", "navigation", "app_stop"),
+    ("app_current", "navigation", "app_current"),
+    ("go_back", "navigation", "go_back"),
+    ("go_home", "navigation", "go_home"),
+    ("press_key", "navigation", "press_key"),
+    ("open_notification", "navigation", "open_notification"),
+    ("open_quick_settings", "navigation", "open_quick_settings"),
+    ("set_orientation", "navigation", "set_orientation"),
+    # Wait Tools
+    ("wait_seconds", "wait", "wait"),
+    ("wait_for_element", "wait", "wait_for_element"),
+    ("wait_for_text", "wait", "wait_for_text"),
+    ("wait_for_any_text", "wait", "wait_for_any_text"),
+    ("device_tap_and_wait", "wait", "device_tap_and_wait"),
+    ("swipe_element_and_check", "wait", "swipe_element_and_check"),
+    ("wait_for_activity", "wait", "wait_for_activity"),
+    ("wait_for_element_gone", "wait", "wait_for_element_gone"),
+    # Watcher Tools
+    ("watcher_add", "watcher", "watcher_add"),
+    ("watcher_remove", "watcher", "watcher_remove"),
+    ("watcher_list", "watcher", "watcher_list"),
+    ("watcher_start", "watcher", "watcher_start"),
+    ("watcher_stop", "watcher", "watcher_stop"),
+    ("watcher_trigger_once", "watcher", "watcher_trigger_once"),
+    # Recording Tools
+    ("start_gesture_recording", "recording", "start_gesture_recording"),
+    ("add_gesture_event", "recording", "add_gesture_event"),
+    ("stop_gesture_recording", "recording", "stop_gesture_recording"),
+    ("play_gesture_recording", "recording", "play_gesture_recording"),
+    ("list_gesture_recordings", "recording", "list_gesture_recordings"),
+    ("export_gesture_recording", "recording", "export_gesture_recording"),
+    ("import_gesture_recording", "recording", "import_gesture_recording"),
+    ("delete_gesture_recording", "recording", "delete_gesture_recording"),
+    # Performance Tools
+    ("get_performance_metrics", "performance", "get_performance_metrics"),
+    ("start_performance_monitor", "performance", "start_performance_monitor"),
+    ("stop_performance_monitor", "performance", "stop_performance_monitor"),
 )
 
-for _section in _TOOL_SECTIONS:
-    for _name, _func in _section.items():
-        globals()[_name] = _register_tool(_func, name=_name)
+# tool name -> (module, function name)
+_TOOL_OWNERS = {name: (module_name, func_name) for name, module_name, func_name in _TOOLS}
+
+_mcp: Optional["FastMCP"] = None
+_mcp_lock = threading.Lock()
+
+
+def _import_tool(module_name: str, func_name: str):
+    module = importlib.import_module(f".tools.{module_name}", __package__)
+    return getattr(module, func_name)
+
+
+def _load_tool(name: str):
+    """Import a tool's module and cache the function as a module global."""
+    func = globals()[name] = _import_tool(*_TOOL_OWNERS[name])
+    return func
+
+
+def get_mcp() -> "FastMCP":
+    """Get the MCP server, creating it and registering all tools on first use."""
+    global _mcp
+    with _mcp_lock:
+        if _mcp is None:
+            from mcp.server.fastmcp import FastMCP
+
+            server = FastMCP("android-ui-agent")
+            tool = server.tool
+            namespace = globals()
+            for name, module_name, func_name in _TOOLS:
+                func = namespace[name] = _import_tool(module_name, func_name)
+                tool(name=name)(func)
+            _mcp = server
+        return _mcp
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the server and tool functions lazily (PEP 562)."""
+    if name == "mcp":
+        return get_mcp()
+    if name == "_cache_lock":
+        # Re-export cache lock for backwards compatibility with tests
+        return get_device_manager()._cache_lock
+    if name in _TOOL_OWNERS:
+        return _load_tool(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # === Entry Point ===
 
+# Pipe capacity for the stdio transport (Linux default is 64 KiB)
+_STDIO_PIPE_SIZE = 1 << 20
+
+
+def _enlarge_stdio_pipes(size: int = _STDIO_PIPE_SIZE) -> None:
+    """Grow stdin/stdout pipe buffers so large tool results need fewer wakeups.
+
+    Best effort: only Linux supports F_SETPIPE_SZ, and the kernel may refuse
+    sizes above /proc/sys/fs/pipe-max-size for unprivileged processes.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return
+    set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", None)
+    if set_pipe_size is None:
+        return
+    for stream in (sys.stdin, sys.stdout):
+        try:
+            fd = stream.fileno()
+            if stat.S_ISFIFO(os.fstat(fd).st_mode):
+                fcntl.fcntl(fd, set_pipe_size, size)
+        except (AttributeError, OSError, ValueError) as exc:
+            logging.getLogger(__name__).debug("Could not resize stdio pipe: %s", exc)
+
+
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
-    mcp.run()
+    _enlarge_stdio_pipes()
+    get_mcp().run()
@@ -3,14 +3,27 @@
 This package contains all MCP tool implementations organized by functionality.
 """
 from .device import device_list, device_select, device_info, device_unlock
-from .snapshot import device_snapshot, screenshot, find_element
+from .snapshot import device_snapshot, screenshot, find_element, find_elements
 from .interaction import (
     device_tap,
+    device_tap_many,
+    device_batch,
     device_double_tap,
     device_long_press,
     device_type,
     device_swipe,
+    scroll_to_top,
     clear_text,
+    device_tap_async,
+    device_tap_many_async,
+    device_batch_async,
+    device_double_tap_async,
+    device_long_press_async,
+    device_type_async,
+    device_swipe_async,
+    scroll_to_top_async,
+    clear_text_async,
+    SwipeDirection,
 )
 from .navigation import (
     app_start,
@@ -22,11 +35,15 @@ from .navigation import (
     open_notification,
     open_quick_settings,
     set_orientation,
+    Orientation,
 )
 from .wait import (
     wait,
     wait_for_element,
     wait_for_text,
+    wait_for_any_text,
+    device_tap_and_wait,
+    swipe_element_and_check,
     wait_for_activity,
     wait_for_element_gone,
 )
@@ -67,13 +84,28 @@ __all__ = [
     "device_snapshot",
     "screenshot",
     "find_element",
+    "find_elements",
     # Interaction tools
     "device_tap",
+    "device_tap_many",
+    "device_batch",
     "device_double_tap",
     "device_long_press",
     "device_type",
     "device_swipe",
+    "scroll_to_top",
     "clear_text",
+    # Interaction tools, awaitable (not registered as MCP tools)
+    "device_tap_async",
+    "device_tap_many_async",
+    "device_batch_async",
+    "device_double_tap_async",
+    "device_long_press_async",
+    "device_type_async",
+    "device_swipe_async",
+    "scroll_to_top_async",
+    "clear_text_async",
+    "SwipeDirection",
     # Navigation tools
     "app_start",
     "app_stop",
@@ -84,10 +116,14 @@ __all__ = [
     "open_notification",
     "open_quick_settings",
     "set_orientation",
+    "Orientation",
     # Wait tools
     "wait",
     "wait_for_element",
     "wait_for_text",
+    "wait_for_any_text",
+    "device_tap_and_wait",
+    "swipe_element_and_check",
     "wait_for_activity",
     "wait_for_element_gone",
     # Watcher tools
@@ -0,0 +1,26 @@
+"""Coroutine variants of the synchronous tool functions."""
+from __future__ import annotations
+
+import asyncio
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def async_variant(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Wrap a blocking tool so it runs in a worker thread when awaited.
+
+    uiautomator2 is synchronous, so the device call still blocks a thread,
+    but one event loop can drive several devices concurrently with
+    asyncio.gather. The caller's contextvars (e.g. a device_session) are
+    carried into the thread.
+    """
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    wrapper.__name__ = f"{func.__name__}_async"
+    wrapper.__qualname__ = f"{func.__qualname__}_async"
+    return wrapper
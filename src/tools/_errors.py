@@ -8,6 +8,9 @@ from ..core import DeviceConnectionError
 
 F = TypeVar("F", bound=Callable[..., object])
 
+# Shared by every decorator site that adds no pass-through types of its own
+_DEFAULT_PASS_THROUGH = (DeviceConnectionError,)
+
 
 def wrap_tool_errors(
     logger,
@@ -15,21 +18,25 @@ def wrap_tool_errors(
     *,
     pass_through: Iterable[type[BaseException]] = (),
 ) -> Callable[[F], F]:
-    """Wrap tool errors to log and raise RuntimeError with a consistent message."""
-    pass_through_exceptions = tuple(pass_through)
+    """Wrap tool errors to log and raise RuntimeError with a consistent message.
+
+    DeviceConnectionError and the pass_through types propagate unchanged.
+    The original exception is chained as the RuntimeError's __cause__.
+    """
+    pass_through_exceptions = (
+        (DeviceConnectionError, *pass_through) if pass_through else _DEFAULT_PASS_THROUGH
+    )
 
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except DeviceConnectionError:
-                raise
             except pass_through_exceptions:
                 raise
             except Exception as exc:
-                logger.error(f"{message}: {exc}")
-                raise RuntimeError(f"{message}: {exc}")
+                logger.error("%s: %s", message, exc)
+                raise RuntimeError(f"{message}: {exc}") from exc
 
         return wrapper  # type: ignore[return-value]
 
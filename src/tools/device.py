@@ -3,13 +3,128 @@
 Provides device listing, selection, and information retrieval.
 """
 import logging
-from typing import Any, Dict, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
-from ..core import DeviceNotFoundError, InvalidDeviceIdError, get_device_manager
+from ..core import DeviceInfo, DeviceNotFoundError, InvalidDeviceIdError, get_device_manager
 from ._errors import wrap_tool_errors
 
 logger = logging.getLogger(__name__)
 
+# Process-wide singleton, bound once instead of looked up on every call
+_DEVICE_MANAGER = get_device_manager()
+
+
+# "  level: 85" / "  status: 2" lines of `dumpsys battery`
+_BATTERY_RE = re.compile(r"^\s*(level|status):[ \t]*(\S*)", re.MULTILINE)
+
+
+def _parse_battery(output: Any) -> Optional[Dict[str, Any]]:
+    """Extract level and status from `dumpsys battery` output.
+
+    Accepts the plain string or uiautomator2's ShellResponse.
+    """
+    output = getattr(output, "output", output)
+    fields = dict(match.groups() for match in _BATTERY_RE.finditer(output))
+    level = fields.get("level", "")
+    if not (level.isascii() and level.isdigit()):
+        return None
+    return {"level": int(level), "status": fields.get("status")}
+
+
+_SHELL_SECTION = "---SECTION---"
+# Fields read from plain shell output, with the command each one needs.
+_SHELL_INFO_COMMANDS = (
+    ("screen_size", "wm size; dumpsys display | grep orientation="),
+    ("current_app", "dumpsys window windows | grep mCurrentFocus"),
+    ("battery", "dumpsys battery"),
+)
+_SHELL_INFO_FIELDS = frozenset(name for name, _ in _SHELL_INFO_COMMANDS)
+_WM_SIZE_RE = re.compile(r"(Override|Physical) size: (\d+)x(\d+)")
+_ORIENTATION_RE = re.compile(r"orientation=(\d+)")
+_FOCUS_RE = re.compile(r"mCurrentFocus=Window\{.*\s+(?P<package>[^\s]+)/(?P<activity>[^\s]+)\}")
+
+
+def _parse_screen_size(output: str) -> Optional[Dict[str, int]]:
+    """Extract the rotated screen size from `wm size` + display orientation.
+
+    Mirrors adbutils' window_size: the override size wins over the physical
+    one, and width/height swap for 90/270 degree rotations.
+    """
+    sizes = {kind: (int(w), int(h)) for kind, w, h in _WM_SIZE_RE.findall(output)}
+    size = sizes.get("Override") or sizes.get("Physical")
+    orientation = _ORIENTATION_RE.search(output)
+    if size is None or orientation is None:
+        return None
+    width, height = size
+    if int(orientation.group(1)) % 2 == 1:
+        width, height = height, width
+    return {"width": width, "height": height}
+
+
+def _parse_current_app(output: str) -> Optional[Dict[str, str]]:
+    """Extract the focused package/activity from `dumpsys window windows`."""
+    match = _FOCUS_RE.search(output)
+    if match is None:
+        return None
+    return {"package": match.group("package"), "activity": match.group("activity")}
+
+
+def _collect_device_info_shell(device, wanted: FrozenSet[str]) -> Dict[str, Any]:
+    """Fetch screen_size, current_app and battery in one shell round trip.
+
+    uiautomator2 would spend a shell call per query (two for window_size).
+    Here the needed commands run as one script with a sentinel echoed between
+    them. A section whose output does not parse falls back to the
+    uiautomator2 call, so unusual ROMs still get an answer.
+    """
+    commands = [(name, command) for name, command in _SHELL_INFO_COMMANDS if name in wanted]
+    script = f"; echo {_SHELL_SECTION}; ".join(command for _, command in commands)
+    try:
+        response = device.shell(script)
+        chunks = getattr(response, "output", response).split(_SHELL_SECTION)
+    except Exception:
+        chunks = []
+    chunks += [""] * (len(commands) - len(chunks))
+
+    values: Dict[str, Any] = {}
+    for (name, _), chunk in zip(commands, chunks):
+        if name == "battery":
+            values["battery"] = _parse_battery(chunk)
+        elif name == "screen_size":
+            screen_size = _parse_screen_size(chunk)
+            if screen_size is None:
+                window = device.window_size()
+                screen_size = {"width": window[0], "height": window[1]}
+            values["screen_size"] = screen_size
+        else:
+            current_app = _parse_current_app(chunk)
+            if current_app is None:
+                app = device.app_current()
+                current_app = {"package": app.get("package"), "activity": app.get("activity")}
+            values["current_app"] = current_app
+    return values
+
+
+# Entries stay plain dicts: the tool result is JSON, so a record type would
+# only be converted back per device.
+def _device_record(device: DeviceInfo) -> Dict[str, Any]:
+    """Build one device_list entry from an `adb devices -l` entry.
+
+    DeviceInfo is fully populated by the ADB listing, so this makes no
+    device calls.
+    """
+    return {
+        "serial": device.serial,
+        "state": device.state,
+        "model": device.model,
+        "product": device.product,
+        "transport_id": device.transport_id,
+        "available": device.is_available,
+    }
+
 
 def device_list() -> Dict[str, Any]:
     """List all connected Android devices.
@@ -34,30 +149,20 @@ def device_list() -> Dict[str, Any]:
         ...     if device["available"]:
         ...         print(f"{device['serial']}: {device['model']}")
     """
-    device_manager = get_device_manager()
+    device_manager = _DEVICE_MANAGER
 
     devices = device_manager.list_devices()
     selected = device_manager.get_selected_device()
 
-    device_list = [
-        {
-            "serial": d.serial,
-            "state": d.state,
-            "model": d.model,
-            "product": d.product,
-            "transport_id": d.transport_id,
-            "available": d.is_available,
-        }
-        for d in devices
-    ]
-
-    available_count = sum(1 for d in devices if d.is_available)
-    logger.info(f"Found {len(devices)} devices ({available_count} available)")
+    records = [_device_record(d) for d in devices]
+    # Count from the built records rather than re-checking each device
+    available_count = sum(record["available"] for record in records)
+    logger.info("Found %s devices (%s available)", len(devices), available_count)
 
     return {
         "count": len(devices),
         "available_count": available_count,
-        "devices": device_list,
+        "devices": records,
         "selected": selected,
     }
 
@@ -94,12 +199,15 @@ def device_select(device_id: str) -> Dict[str, Any]:
         InvalidDeviceIdError: Invalid device ID format
         DeviceNotFoundError: Device not found or not available
     """
-    device_manager = get_device_manager()
+    device_manager = _DEVICE_MANAGER
 
     previous = device_manager.get_selected_device()
     device_manager.select_device(device_id)
+    # Re-read metadata for the newly selected device on its next device_info
+    with _STATIC_INFO_LOCK:
+        _STATIC_INFO_CACHE.pop(device_id, None)
 
-    logger.info(f"Selected device: {device_id} (previous: {previous})")
+    logger.info("Selected device: %s (previous: %s)", device_id, previous)
 
     return {
         "success": True,
@@ -108,18 +216,143 @@ def device_select(device_id: str) -> Dict[str, Any]:
     }
 
 
-@wrap_tool_errors(logger, "Failed to get device info")
-def device_info(device_id: Optional[str] = None) -> Dict[str, Any]:
+# device_info fields, in response order
+_DEVICE_INFO_FIELDS = (
+    "serial",
+    "sdk_version",
+    "android_version",
+    "product_name",
+    "screen_size",
+    "display_density",
+    "orientation",
+    "screen_on",
+    "battery",
+    "current_app",
+)
+# device_info fields read from the device.info RPC -> its keys
+_INFO_RPC_FIELDS = {
+    "sdk_version": "sdkInt",
+    "android_version": "platformVersion",
+    "product_name": "productName",
+    "display_density": "displaySizeDpX",
+    "orientation": "displayRotation",
+    "screen_on": "screenOn",
+}
+# Of those, the ones that never change while a device stays connected
+# (display_density is the width in dp, which changes with rotation)
+_STATIC_INFO_FIELDS = frozenset(("sdk_version", "android_version", "product_name"))
+
+# serial -> static device.info fields, filled on the first device_info call
+_STATIC_INFO_CACHE: Dict[str, Dict[str, Any]] = {}
+_STATIC_INFO_LOCK = threading.Lock()
+
+# Runs the device queries of device_info_stream; shared instead of a pool per call
+_INFO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="device-info")
+
+
+def _resolve_info_fields(fields: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Validate requested device_info fields (None means all)."""
+    if fields is None:
+        return frozenset(_DEVICE_INFO_FIELDS)
+    wanted = frozenset(fields)
+    unknown = wanted.difference(_DEVICE_INFO_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown device_info fields: {', '.join(sorted(unknown))}. "
+            f"Valid fields: {', '.join(_DEVICE_INFO_FIELDS)}"
+        )
+    return wanted
+
+
+def _info_sections(device, wanted: FrozenSet[str]) -> List[Callable[[], Dict[str, Any]]]:
+    """Build one fetcher per device query that the wanted fields need."""
+    sections: List[Callable[[], Dict[str, Any]]] = []
+    serial = device.serial
+
+    if "serial" in wanted:
+        sections.append(lambda: {"serial": serial})
+
+    with _STATIC_INFO_LOCK:
+        static = _STATIC_INFO_CACHE.get(serial)
+    rpc_fields = wanted.intersection(_INFO_RPC_FIELDS)
+    if static is not None:
+        rpc_fields -= _STATIC_INFO_FIELDS
+        cached = {name: static[name] for name in wanted & _STATIC_INFO_FIELDS}
+        if cached:
+            sections.append(lambda: cached)
+
+    if rpc_fields:
+        def fetch_info() -> Dict[str, Any]:
+            info_get = device.info.get
+            rpc_keys = _INFO_RPC_FIELDS
+            if static is None:
+                with _STATIC_INFO_LOCK:
+                    _STATIC_INFO_CACHE[serial] = {
+                        name: info_get(rpc_keys[name]) for name in _STATIC_INFO_FIELDS
+                    }
+            return {name: info_get(rpc_keys[name]) for name in rpc_fields}
+
+        sections.append(fetch_info)
+
+    shell_fields = wanted.intersection(_SHELL_INFO_FIELDS)
+    if shell_fields:
+        sections.append(lambda: _collect_device_info_shell(device, shell_fields))
+
+    return sections
+
+
+def device_info_stream(
+    device_id: Optional[str] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """Yield (field, value) pairs of device_info as each device query finishes.
+
+    The device queries (device.info and the combined shell call) run in
+    parallel, so the first fields arrive without waiting for the
+    slowest query and the total wait is that of the slowest one rather than
+    their sum. Field order follows completion order.
+
+    Sharing the uiautomator2 device between the two threads is safe here:
+    it opens a separate adb connection for every JSON-RPC call and every
+    shell command, and neither query changes its state.
+
+    Raises:
+        DeviceConnectionError: Failed to connect to device
+        DeviceNotFoundError: No devices available
+        ValueError: Unknown field name
+    """
+    wanted = _resolve_info_fields(fields)
+
+    with _DEVICE_MANAGER.get_device(device_id) as device:
+        sections = _info_sections(device, wanted)
+        if len(sections) <= 1:
+            for fetch in sections:
+                yield from fetch().items()
+            return
+        futures = [_INFO_POOL.submit(fetch) for fetch in sections]
+        for future in as_completed(futures):
+            yield from future.result().items()
+
+
+@wrap_tool_errors(logger, "Failed to get device info", pass_through=(ValueError,))
+def device_info(
+    device_id: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """Get detailed information about a device.
 
     Returns comprehensive device information including screen size,
-    Android version, and current state.
+    Android version, and current state. Pass fields to fetch only some of
+    it; device queries that no requested field needs are skipped (battery
+    in particular costs a separate shell round trip). SDK, Android
+    version and product name are cached per serial after the first call. The device queries run in parallel (see device_info_stream).
 
     Args:
         device_id: Device serial (None for default/selected device)
+        fields: Names of the fields to return (None for all)
 
     Returns:
-        Dictionary containing:
+        Dictionary containing (the requested subset of):
         - serial: Device serial number
         - sdk_version: Android SDK version (e.g., 33)
         - android_version: Android version string (e.g., "13")
@@ -131,54 +364,19 @@ def device_info(device_id: Optional[str] = None) -> Dict[str, Any]:
         - battery: Battery info (if available)
         - current_app: Current foreground app
 
+    Example:
+        >>> device_info(fields=["screen_size", "current_app"])
+
     Raises:
         DeviceConnectionError: Failed to connect to device
         DeviceNotFoundError: No devices available
+        ValueError: Unknown field name
     """
-    device_manager = get_device_manager()
-
-    with device_manager.get_device(device_id) as device:
-        # Basic device info
-        info = device.info
-        window = device.window_size()
-
-        # Current app
-        current_app = device.app_current()
-
-        # Try to get battery info
-        battery = None
-        try:
-            battery_info = device.shell("dumpsys battery")
-            level = None
-            status = None
-            for line in battery_info.split("\n"):
-                if "level:" in line:
-                    level = int(line.split(":")[1].strip())
-                elif "status:" in line:
-                    status = line.split(":")[1].strip()
-            if level is not None:
-                battery = {"level": level, "status": status}
-        except Exception:
-            pass
-
-        result = {
-            "serial": device.serial,
-            "sdk_version": info.get("sdkInt"),
-            "android_version": info.get("platformVersion"),
-            "product_name": info.get("productName"),
-            "screen_size": {"width": window[0], "height": window[1]},
-            "display_density": info.get("displaySizeDpX"),
-            "orientation": info.get("displayRotation"),
-            "screen_on": info.get("screenOn"),
-            "battery": battery,
-            "current_app": {
-                "package": current_app.get("package"),
-                "activity": current_app.get("activity"),
-            },
-        }
+    values = dict(device_info_stream(device_id, fields))
+    result = {name: values[name] for name in _DEVICE_INFO_FIELDS if name in values}
 
-        logger.info(f"Device info retrieved: {device.serial}")
-        return result
+    logger.info("Device info retrieved: %s", result.get("serial", device_id))
+    return result
 
 
 @wrap_tool_errors(logger, "Device unlock failed")
@@ -204,7 +402,7 @@ def device_unlock(
     Raises:
         DeviceConnectionError: Failed to connect to device
     """
-    device_manager = get_device_manager()
+    device_manager = _DEVICE_MANAGER
 
     with device_manager.get_device(device_id) as device:
         # Check screen state
@@ -228,8 +426,9 @@ def device_unlock(
 
         # Security: Only log that password was used, not the value
         logger.info(
-            "Device unlock attempted "
-            f"(screen was off: {screen_was_off}, password_used: {password_entered})"
+            "Device unlock attempted (screen was off: %s, password_used: %s)",
+            screen_was_off,
+            password_entered,
         )
 
         return {
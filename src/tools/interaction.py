@@ -3,11 +3,18 @@
 Provides UI interaction capabilities using Playwright-style ref system.
 """
 import logging
+import re
+import shlex
 import time
-from typing import Any, Dict, Optional, Tuple
+from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from ..core import RefNotFoundError, StaleRefError, get_device_manager, get_snapshot_manager
+from ._async import async_variant
 from ._errors import wrap_tool_errors
+from .snapshot import _capture_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +50,145 @@ def _resolve_position(
         raise ValueError("Either 'ref' or both 'x' and 'y' must be provided")
 
 
+def _resolve_positions(
+    device_id: str,
+    targets: List[Tuple[Optional[str], Optional[int], Optional[int]]],
+    max_stale_seconds: Optional[float] = None,
+) -> List[Tuple[int, int]]:
+    """Resolve several (ref, x, y) targets, all refs against one snapshot.
+
+    Raises:
+        Same as _resolve_position
+    """
+    refs = [ref for ref, _, _ in targets if ref is not None]
+    if not refs:
+        # Coordinates only: no snapshot involved
+        return [_resolve_position(device_id, None, x, y) for _, x, y in targets]
+    ref_positions = iter(
+        get_snapshot_manager().get_positions(device_id, refs, max_stale_seconds)
+    )
+    return [
+        next(ref_positions) if ref is not None else _resolve_position(device_id, None, x, y)
+        for ref, x, y in targets
+    ]
+
+
+# Upper bound on waiting for a tapped field to take focus
+_FOCUS_TIMEOUT = 0.3
+_FOCUS_POLL_INTERVAL = 0.05
+
+
+def _wait_for_focus(device, pos: Tuple[int, int], timeout: float = _FOCUS_TIMEOUT) -> bool:
+    """Poll until the focused element contains pos, up to timeout.
+
+    Returns False on timeout; callers go ahead anyway, as they did after the
+    fixed sleep this replaces.
+    """
+    x, y = pos
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            bounds = device(focused=True).info["bounds"]
+            if bounds["left"] <= x <= bounds["right"] and bounds["top"] <= y <= bounds["bottom"]:
+                return True
+        except Exception:
+            pass  # nothing focused yet
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(_FOCUS_POLL_INTERVAL)
+
+
+# How long a window size is reused; set_orientation drops the entry early
+WINDOW_SIZE_TTL_SECONDS = 2.0
+
+# device_id -> (time.monotonic() when read, (width, height))
+_WINDOW_SIZES: Dict[str, Tuple[float, Tuple[int, int]]] = {}
+
+
+def _window_size(device, device_id: str) -> Tuple[int, int]:
+    """Return the device's window size, reusing a recent reading.
+
+    uiautomator2's window_size costs two shell calls (`wm size` and
+    `dumpsys display`); rotations are rare and set_orientation invalidates.
+    """
+    now = time.monotonic()
+    cached = _WINDOW_SIZES.get(device_id)
+    if cached is not None and now - cached[0] < WINDOW_SIZE_TTL_SECONDS:
+        return cached[1]
+    window = device.window_size()
+    size = (window[0], window[1])
+    _WINDOW_SIZES[device_id] = (now, size)
+    return size
+
+
+def _invalidate_window_size(device_id: str) -> None:
+    """Drop the cached window size for a device (e.g. after rotating it)."""
+    _WINDOW_SIZES.pop(device_id, None)
+
+
+class SwipeDirection(str, Enum):
+    """Direction shortcuts accepted by device_swipe (plain strings work too)."""
+
+    UP = "up"
+    DOWN = "down"
+    LEFT = "left"
+    RIGHT = "right"
+
+
+# Lower-cased name -> member; members are str, so they look themselves up
+_SWIPE_DIRECTIONS = {direction.value: direction for direction in SwipeDirection}
+
+
+@lru_cache(maxsize=8)
+def _direction_map(
+    width: int, height: int
+) -> Mapping[SwipeDirection, Tuple[int, int, int, int]]:
+    """Swipe coordinates (sx, sy, ex, ey) for each direction shortcut."""
+    center_x = width // 2
+    center_y = height // 2
+    offset = min(width, height) // 3
+    return MappingProxyType({
+        SwipeDirection.UP: (center_x, center_y + offset, center_x, center_y - offset),
+        SwipeDirection.DOWN: (center_x, center_y - offset, center_x, center_y + offset),
+        SwipeDirection.LEFT: (center_x + offset, center_y, center_x - offset, center_y),
+        SwipeDirection.RIGHT: (center_x - offset, center_y, center_x + offset, center_y),
+    })
+
+
+# Oldest snapshot allow_stale callers still accept refs from
+STALE_REF_BOUND_SECONDS = 120.0
+
+
+def _expire_refs(device_id: str) -> None:
+    """Stop resolving refs after an action that may have moved elements.
+
+    Like navigation, the next ref lookup fails with RefNotFoundError until
+    the caller takes a new snapshot, instead of hitting an old position.
+    """
+    get_snapshot_manager().expire_current(device_id)
+
+
+def _resolve_positions_allowing_stale(
+    device_id: str,
+    targets: List[Tuple[Optional[str], Optional[int], Optional[int]]],
+    allow_stale: bool,
+) -> Tuple[List[Tuple[int, int]], bool]:
+    """Resolve targets like _resolve_positions, optionally from an aged snapshot.
+
+    With allow_stale, a snapshot past the normal staleness limit is still
+    used up to STALE_REF_BOUND_SECONDS. Returns the positions and whether
+    the stale snapshot was used.
+    """
+    try:
+        return _resolve_positions(device_id, targets), False
+    except StaleRefError:
+        if not allow_stale:
+            raise
+    positions = _resolve_positions(device_id, targets, STALE_REF_BOUND_SECONDS)
+    logger.warning("Resolved refs from a stale snapshot (allow_stale)")
+    return positions, True
+
+
 def _redact_text(text: str) -> str:
     """Return a safe description for logs without exposing content."""
     return f"<{len(text)} chars>"
@@ -64,9 +210,82 @@ def _describe_target(
     return default
 
 
+# Tool results stay plain dicts: FastMCP serialises the return value as is,
+# and a NamedTuple would reach clients as a JSON array instead of an object.
+def _attach_snapshot(
+    result: Dict[str, Any],
+    device_id: Optional[str],
+    return_snapshot: bool,
+) -> Dict[str, Any]:
+    """Add a snapshot of the resulting screen to an action result if requested."""
+    if return_snapshot:
+        result["snapshot"] = _capture_snapshot(device_id).to_dict()
+    return result
+
+
 _INTERACTION_PASSTHROUGH = (ValueError, RefNotFoundError, StaleRefError)
 
 
+# kind -> (log verb, press(device, x, y, seconds)); seconds is the double-tap
+# interval or the long-press duration
+_TAP_DISPATCH = {
+    "tap": ("Tapped", lambda device, x, y, seconds: device.click(x, y)),
+    "double_tap": (
+        "Double-tapped",
+        lambda device, x, y, seconds: device.double_click(x, y, duration=seconds),
+    ),
+    "long_press": (
+        "Long-pressed",
+        lambda device, x, y, seconds: device.long_click(x, y, duration=seconds),
+    ),
+}
+
+
+def _tap_impl(
+    kind: str,
+    ref: Optional[str],
+    x: Optional[int],
+    y: Optional[int],
+    device_id: Optional[str],
+    element: Optional[str],
+    seconds: Optional[float],
+    return_snapshot: bool,
+    allow_stale: bool = False,
+) -> Dict[str, Any]:
+    """Shared body of device_tap, device_double_tap and device_long_press."""
+    verb, press = _TAP_DISPATCH[kind]
+    device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
+
+    # Resolve position (plain coordinates skip the snapshot machinery)
+    if ref is None and x is not None and y is not None:
+        pos_x, pos_y, stale = x, y, False
+    else:
+        ((pos_x, pos_y),), stale = _resolve_positions_allowing_stale(
+            resolved_id, [(ref, x, y)], allow_stale
+        )
+
+    with device_manager.get_device(resolved_id) as device:
+        press(device, pos_x, pos_y, seconds)
+    _expire_refs(resolved_id)
+
+    if logger.isEnabledFor(logging.INFO):
+        description = _describe_target(element, ref, (pos_x, pos_y))
+        logger.info("%s at (%s, %s): %s", verb, pos_x, pos_y, description)
+
+    result = {
+        "success": True,
+        "position": {"x": pos_x, "y": pos_y},
+        "element": element,
+        "ref": ref,
+    }
+    if kind == "long_press":
+        result["duration"] = seconds
+    if stale:
+        result["stale_ref"] = True
+    return _attach_snapshot(result, resolved_id, return_snapshot)
+
+
 @wrap_tool_errors(logger, "Tap failed", pass_through=_INTERACTION_PASSTHROUGH)
 def device_tap(
     ref: Optional[str] = None,
@@ -74,6 +293,8 @@ def device_tap(
     y: Optional[int] = None,
     device_id: Optional[str] = None,
     element: Optional[str] = None,
+    return_snapshot: bool = False,
+    allow_stale: bool = False,
 ) -> Dict[str, Any]:
     """Tap on an element or coordinate.
 
@@ -86,6 +307,9 @@ def device_tap(
         y: Y coordinate (alternative to ref)
         device_id: Device serial (None for default/selected device)
         element: Human-readable element description (for logging only)
+        return_snapshot: Capture and return a snapshot after the action
+        allow_stale: Accept a ref from a snapshot past the staleness limit
+            (up to STALE_REF_BOUND_SECONDS old) instead of failing
 
     Returns:
         Dictionary containing:
@@ -93,6 +317,7 @@ def device_tap(
         - position: {x, y} coordinates tapped
         - element: Description of element tapped
         - ref: The ref used (if applicable)
+        - stale_ref: True if the ref came from a stale snapshot (only then)
 
     Example:
         >>> # Using ref from snapshot
@@ -108,25 +333,223 @@ def device_tap(
         StaleRefError: Snapshot is too old (take new snapshot)
         DeviceConnectionError: Failed to connect to device
     """
+    return _tap_impl("tap", ref, x, y, device_id, element, None, return_snapshot, allow_stale)
+
+
+@wrap_tool_errors(logger, "Tap sequence failed", pass_through=_INTERACTION_PASSTHROUGH)
+def device_tap_many(
+    taps: List[Dict[str, Any]],
+    device_id: Optional[str] = None,
+    interval: float = 0.1,
+) -> Dict[str, Any]:
+    """Tap several elements or coordinates in order with one call.
+
+    All targets are resolved before the first tap, so a bad ref fails the
+    call without leaving the sequence half done.
+
+    Args:
+        taps: List of targets, each {"ref": ..., "element": ...} or {"x": ..., "y": ...}
+        device_id: Device serial (None for default/selected device)
+        interval: Delay between taps in seconds
+
+    Returns:
+        Dictionary containing:
+        - success: True if all taps were dispatched
+        - count: Number of taps performed
+        - taps: Per-tap {position, element, ref} in order
+
+    Raises:
+        ValueError: Empty taps, a target without ref or x/y, or negative interval
+        RefNotFoundError: Ref not found in snapshot
+        StaleRefError: Snapshot is too old
+        DeviceConnectionError: Failed to connect to device
+    """
+    if not taps:
+        raise ValueError("taps must not be empty")
+    if interval < 0:
+        raise ValueError("interval must be 0 or greater")
+
     device_manager = get_device_manager()
     resolved_id = device_manager.resolve_device_id_or_default(device_id)
 
-    # Resolve position
-    pos_x, pos_y = _resolve_position(resolved_id, ref, x, y)
+    positions = _resolve_positions(
+        resolved_id, [(tap.get("ref"), tap.get("x"), tap.get("y")) for tap in taps]
+    )
 
-    # Execute tap
-    with device_manager.get_device(device_id) as device:
-        device.click(pos_x, pos_y)
+    with device_manager.get_device(resolved_id) as device:
+        for i, (pos_x, pos_y) in enumerate(positions):
+            if i:
+                time.sleep(interval)
+            device.click(pos_x, pos_y)
+    _expire_refs(resolved_id)
 
-    description = _describe_target(element, ref, (pos_x, pos_y))
-    logger.info(f"Tapped at ({pos_x}, {pos_y}): {description}")
+    logger.info("Tapped %s targets", len(positions))
 
     return {
         "success": True,
-        "position": {"x": pos_x, "y": pos_y},
-        "element": element,
-        "ref": ref,
+        "count": len(positions),
+        "taps": [
+            {
+                "position": {"x": pos_x, "y": pos_y},
+                "element": tap.get("element"),
+                "ref": tap.get("ref"),
+            }
+            for tap, (pos_x, pos_y) in zip(taps, positions)
+        ],
+    }
+
+
+# press_key names that differ from their KEYCODE_* constant
+_KEYCODE_ALIASES = {
+    "recent": "APP_SWITCH",
+    "delete": "DEL",
+    "up": "DPAD_UP",
+    "down": "DPAD_DOWN",
+    "left": "DPAD_LEFT",
+    "right": "DPAD_RIGHT",
+    "center": "DPAD_CENTER",
+}
+_KEY_RE = re.compile(r"\w+")
+_BATCH_TARGET_ACTIONS = ("tap", "long_press")
+
+
+def _keyevent_arg(key: Any) -> str:
+    """Translate a press_key style key name to an `input keyevent` argument."""
+    key = str(key)
+    if not _KEY_RE.fullmatch(key):
+        raise ValueError(f"Invalid key: {key!r}")
+    if key.isdigit():
+        return key
+    return "KEYCODE_" + _KEYCODE_ALIASES.get(key.lower(), key.upper())
+
+
+def _millis(seconds: Any) -> int:
+    """Convert a non-negative duration in seconds to whole milliseconds."""
+    seconds = float(seconds)
+    if seconds < 0:
+        raise ValueError("durations must be 0 or greater")
+    return int(seconds * 1000)
+
+
+def _run_input_script(device, commands: List[str]) -> None:
+    """Run shell commands chained with `&&` in one round trip.
+
+    Raises:
+        RuntimeError: A command exited non-zero (the rest did not run)
+    """
+    response = device.shell(" && ".join(commands))
+    exit_code = getattr(response, "exit_code", 0)
+    if exit_code:
+        output = getattr(response, "output", response)
+        raise RuntimeError(f"input command exited with {exit_code}: {output.strip()}")
+
+
+# Text `input text` types verbatim once shell-quoted: printable ASCII, no
+# "%" (it reads "%s" as a space)
+_INPUT_TEXT_RE = re.compile(r"[\x20-\x24\x26-\x7e]+")
+
+
+def _input_text_arg(text: str) -> Optional[str]:
+    """Encode text for `input text`, or None if it cannot be typed that way."""
+    if not _INPUT_TEXT_RE.fullmatch(text):
+        return None
+    return shlex.quote(text.replace(" ", "%s"))
+
+
+@wrap_tool_errors(logger, "Batch failed", pass_through=_INTERACTION_PASSTHROUGH)
+def device_batch(
+    actions: List[Dict[str, Any]],
+    device_id: Optional[str] = None,
+    return_snapshot: bool = False,
+) -> Dict[str, Any]:
+    """Run a sequence of gestures and key presses in one shell round trip.
+
+    The actions become `input` commands chained with `&&` and sent as a
+    single `adb shell` call, so the sequence pays the connection overhead
+    once instead of per gesture. Execution stops at the first failing
+    command. All refs are resolved against one snapshot before anything
+    runs.
+
+    Args:
+        actions: Actions in order, each a dict with an "action" key:
+            - {"action": "tap", "ref": ...} or {"action": "tap", "x": ..., "y": ...}
+            - {"action": "long_press", "ref" or "x"/"y", "duration": 1.0}
+            - {"action": "swipe", "start_ref" or "start_x"/"start_y",
+               "end_ref" or "end_x"/"end_y", "duration": 0.5}
+            - {"action": "key", "key": "back"} (press_key names or keycodes)
+            - {"action": "wait", "seconds": 0.5}
+        device_id: Device serial (None for default/selected device)
+        return_snapshot: Capture and return a snapshot after the batch
+
+    Returns:
+        Dictionary containing:
+        - success: True if every command succeeded
+        - count: Number of actions performed
+
+    Example:
+        >>> device_batch([
+        ...     {"action": "tap", "ref": "e3"},
+        ...     {"action": "key", "key": "back"},
+        ...     {"action": "swipe", "start_x": 500, "start_y": 1500, "end_x": 500, "end_y": 500},
+        ... ])
+
+    Raises:
+        ValueError: Empty actions, unknown action, or missing/invalid parameters
+        RefNotFoundError: Ref not found in snapshot
+        StaleRefError: Snapshot is too old
+        DeviceConnectionError: Failed to connect to device
+    """
+    if not actions:
+        raise ValueError("actions must not be empty")
+
+    device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
+
+    # Gather every target first so all refs resolve against one snapshot
+    targets = []
+    for action in actions:
+        kind = action.get("action")
+        if kind in _BATCH_TARGET_ACTIONS:
+            targets.append((action.get("ref"), action.get("x"), action.get("y")))
+        elif kind == "swipe":
+            targets.append((action.get("start_ref"), action.get("start_x"), action.get("start_y")))
+            targets.append((action.get("end_ref"), action.get("end_x"), action.get("end_y")))
+        elif kind not in ("key", "wait"):
+            raise ValueError(
+                f"Invalid action: {kind}. Use 'tap', 'long_press', 'swipe', 'key', or 'wait'"
+            )
+    positions = iter(_resolve_positions(resolved_id, targets))
+
+    commands = []
+    for action in actions:
+        kind = action["action"]
+        if kind == "tap":
+            x, y = next(positions)
+            commands.append(f"input tap {int(x)} {int(y)}")
+        elif kind == "long_press":
+            x, y = next(positions)
+            ms = _millis(action.get("duration", 1.0))
+            commands.append(f"input swipe {int(x)} {int(y)} {int(x)} {int(y)} {ms}")
+        elif kind == "swipe":
+            (sx, sy), (ex, ey) = next(positions), next(positions)
+            ms = _millis(action.get("duration", 0.5))
+            commands.append(f"input swipe {int(sx)} {int(sy)} {int(ex)} {int(ey)} {ms}")
+        elif kind == "key":
+            commands.append(f"input keyevent {_keyevent_arg(action.get('key'))}")
+        else:
+            commands.append(f"sleep {_millis(action.get('seconds', 0)) / 1000:g}")
+
+    with device_manager.get_device(resolved_id) as device:
+        _run_input_script(device, commands)
+    _expire_refs(resolved_id)
+
+    logger.info("Ran batch of %s actions", len(actions))
+
+    result = {
+        "success": True,
+        "count": len(actions),
     }
+    return _attach_snapshot(result, resolved_id, return_snapshot)
 
 
 @wrap_tool_errors(logger, "Double tap failed", pass_through=_INTERACTION_PASSTHROUGH)
@@ -137,6 +560,7 @@ def device_double_tap(
     device_id: Optional[str] = None,
     element: Optional[str] = None,
     interval: float = 0.1,
+    return_snapshot: bool = False,
 ) -> Dict[str, Any]:
     """Double tap on an element or coordinate.
 
@@ -147,6 +571,7 @@ def device_double_tap(
         device_id: Device serial (None for default/selected device)
         element: Human-readable element description
         interval: Time between taps in seconds
+        return_snapshot: Capture and return a snapshot after the action
 
     Returns:
         Dictionary with success status and position info
@@ -154,23 +579,7 @@ def device_double_tap(
     Raises:
         Same as device_tap
     """
-    device_manager = get_device_manager()
-    resolved_id = device_manager.resolve_device_id_or_default(device_id)
-
-    pos_x, pos_y = _resolve_position(resolved_id, ref, x, y)
-
-    with device_manager.get_device(device_id) as device:
-        device.double_click(pos_x, pos_y, duration=interval)
-
-    description = _describe_target(element, ref, (pos_x, pos_y))
-    logger.info(f"Double-tapped at ({pos_x}, {pos_y}): {description}")
-
-    return {
-        "success": True,
-        "position": {"x": pos_x, "y": pos_y},
-        "element": element,
-        "ref": ref,
-    }
+    return _tap_impl("double_tap", ref, x, y, device_id, element, interval, return_snapshot)
 
 
 @wrap_tool_errors(logger, "Long press failed", pass_through=_INTERACTION_PASSTHROUGH)
@@ -181,6 +590,7 @@ def device_long_press(
     device_id: Optional[str] = None,
     element: Optional[str] = None,
     duration: float = 1.0,
+    return_snapshot: bool = False,
 ) -> Dict[str, Any]:
     """Long press on an element or coordinate.
 
@@ -191,6 +601,7 @@ def device_long_press(
         device_id: Device serial (None for default/selected device)
         element: Human-readable element description
         duration: Press duration in seconds (default 1.0)
+        return_snapshot: Capture and return a snapshot after the action
 
     Returns:
         Dictionary with success status and position info
@@ -198,24 +609,7 @@ def device_long_press(
     Raises:
         Same as device_tap
     """
-    device_manager = get_device_manager()
-    resolved_id = device_manager.resolve_device_id_or_default(device_id)
-
-    pos_x, pos_y = _resolve_position(resolved_id, ref, x, y)
-
-    with device_manager.get_device(device_id) as device:
-        device.long_click(pos_x, pos_y, duration=duration)
-
-    description = _describe_target(element, ref, (pos_x, pos_y))
-    logger.info(f"Long-pressed at ({pos_x}, {pos_y}) for {duration}s: {description}")
-
-    return {
-        "success": True,
-        "position": {"x": pos_x, "y": pos_y},
-        "element": element,
-        "ref": ref,
-        "duration": duration,
-    }
+    return _tap_impl("long_press", ref, x, y, device_id, element, duration, return_snapshot)
 
 
 @wrap_tool_errors(logger, "Type failed", pass_through=_INTERACTION_PASSTHROUGH)
@@ -226,6 +620,8 @@ def device_type(
     element: Optional[str] = None,
     clear_first: bool = False,
     submit: bool = False,
+    return_snapshot: bool = False,
+    fast_path: bool = False,
 ) -> Dict[str, Any]:
     """Type text into an input field.
 
@@ -239,6 +635,10 @@ def device_type(
         element: Human-readable element description
         clear_first: Clear existing text before typing
         submit: Press Enter after typing
+        return_snapshot: Capture and return a snapshot after the action
+        fast_path: Tap, type and submit with one `adb shell` call. Applies
+            to printable ASCII text without "%" when clear_first is off;
+            anything else takes the regular path.
 
     Returns:
         Dictionary containing:
@@ -261,31 +661,42 @@ def device_type(
         DeviceConnectionError: Failed to connect to device
     """
     device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
 
-    with device_manager.get_device(device_id) as device:
-        # Focus element if ref provided
-        if ref:
-            resolved_id = device_manager.resolve_device_id_or_default(device_id)
-            pos_x, pos_y = _resolve_position(resolved_id, ref)
-            device.click(pos_x, pos_y)
-            time.sleep(0.3)  # Wait for focus
+    pos = _resolve_position(resolved_id, ref) if ref else None
+    text_arg = _input_text_arg(text) if fast_path and not clear_first else None
+
+    with device_manager.get_device(resolved_id) as device:
+        if text_arg is not None:
+            commands = []
+            if pos is not None:
+                commands += [f"input tap {pos[0]} {pos[1]}", "sleep 0.05"]
+            commands.append(f"input text {text_arg}")
+            if submit:
+                commands.append("input keyevent KEYCODE_ENTER")
+            _run_input_script(device, commands)
+        else:
+            # Focus element if ref provided
+            if pos is not None:
+                device.click(*pos)
+                _wait_for_focus(device, pos)
 
-        # Clear existing text if requested
-        if clear_first:
-            device.clear_text()
-            time.sleep(0.1)
+            # Clear existing text if requested (returns once the field is cleared)
+            if clear_first:
+                device.clear_text()
 
-        # Type text
-        device.send_keys(text)
+            # Type text
+            device.send_keys(text)
 
-        # Submit if requested
-        if submit:
-            device.press("enter")
+            # Submit if requested
+            if submit:
+                device.press("enter")
+    _expire_refs(resolved_id)
 
-    description = _describe_target(element, ref)
-    logger.info(f"Typed {_redact_text(text)} into {description}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Typed %s into %s", _redact_text(text), _describe_target(element, ref))
 
-    return {
+    result = {
         "success": True,
         "text": text,
         "ref": ref,
@@ -293,6 +704,7 @@ def device_type(
         "cleared": clear_first,
         "submitted": submit,
     }
+    return _attach_snapshot(result, resolved_id, return_snapshot)
 
 
 @wrap_tool_errors(logger, "Swipe failed", pass_through=_INTERACTION_PASSTHROUGH)
@@ -306,6 +718,8 @@ def device_swipe(
     device_id: Optional[str] = None,
     duration: float = 0.5,
     direction: Optional[str] = None,
+    return_snapshot: bool = False,
+    allow_stale: bool = False,
 ) -> Dict[str, Any]:
     """Swipe from one point to another.
 
@@ -321,6 +735,10 @@ def device_swipe(
         device_id: Device serial (None for default/selected device)
         duration: Swipe duration in seconds
         direction: Shortcut for common swipes: "up", "down", "left", "right"
+        return_snapshot: Capture and return a snapshot after the action
+        allow_stale: Accept refs from a snapshot past the staleness limit
+            (up to STALE_REF_BOUND_SECONDS old); the result then has
+            stale_ref=True
 
     Returns:
         Dictionary with success status and swipe info
@@ -337,61 +755,95 @@ def device_swipe(
         DeviceConnectionError: Failed to connect to device
     """
     device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
 
-    with device_manager.get_device(device_id) as device:
-        window = device.window_size()
-        width, height = window[0], window[1]
+    direction_key = _SWIPE_DIRECTIONS.get(direction.lower()) if direction else None
+    if direction and direction_key is None:
+        raise ValueError(
+            f"Invalid direction: {direction}. "
+            "Use 'up', 'down', 'left', or 'right'"
+        )
 
+    stale = False
+    with device_manager.get_device(resolved_id) as device:
         # Handle direction shortcuts
-        if direction:
-            center_x = width // 2
-            center_y = height // 2
-            offset = min(width, height) // 3
-
-            direction_map = {
-                "up": (center_x, center_y + offset, center_x, center_y - offset),
-                "down": (center_x, center_y - offset, center_x, center_y + offset),
-                "left": (center_x + offset, center_y, center_x - offset, center_y),
-                "right": (center_x - offset, center_y, center_x + offset, center_y),
-            }
-
-            if direction.lower() not in direction_map:
-                raise ValueError(
-                    f"Invalid direction: {direction}. "
-                    "Use 'up', 'down', 'left', or 'right'"
-                )
-
-            sx, sy, ex, ey = direction_map[direction.lower()]
+        if direction_key is not None:
+            width, height = _window_size(device, resolved_id)
+            sx, sy, ex, ey = _direction_map(width, height)[direction_key]
         else:
-            # Resolve start position
-            resolved_id = device_manager.resolve_device_id_or_default(device_id)
-            if start_ref:
-                sx, sy = _resolve_position(resolved_id, start_ref)
-            elif start_x is not None and start_y is not None:
-                sx, sy = start_x, start_y
-            else:
+            if not start_ref and (start_x is None or start_y is None):
                 raise ValueError("Provide start_ref or start_x/start_y")
-
-            # Resolve end position
-            if end_ref:
-                ex, ey = _resolve_position(resolved_id, end_ref)
-            elif end_x is not None and end_y is not None:
-                ex, ey = end_x, end_y
-            else:
+            if not end_ref and (end_x is None or end_y is None):
                 raise ValueError("Provide end_ref or end_x/end_y")
 
+            # Resolve both ends against the same snapshot
+            ((sx, sy), (ex, ey)), stale = _resolve_positions_allowing_stale(
+                resolved_id,
+                [(start_ref or None, start_x, start_y), (end_ref or None, end_x, end_y)],
+                allow_stale,
+            )
+
         # Execute swipe
         device.swipe(sx, sy, ex, ey, duration=duration)
+    _expire_refs(resolved_id)
 
-    logger.info(f"Swiped from ({sx}, {sy}) to ({ex}, {ey})")
+    logger.info("Swiped from (%s, %s) to (%s, %s)", sx, sy, ex, ey)
 
-    return {
+    result = {
         "success": True,
         "start": {"x": sx, "y": sy},
         "end": {"x": ex, "y": ey},
         "direction": direction,
         "duration": duration,
     }
+    if stale:
+        result["stale_ref"] = True
+    return _attach_snapshot(result, resolved_id, return_snapshot)
+
+
+@wrap_tool_errors(logger, "Scroll to top failed", pass_through=(ValueError,))
+def scroll_to_top(
+    device_id: Optional[str] = None,
+    max_swipes: int = 20,
+) -> Dict[str, Any]:
+    """Fling the first scrollable container back to its beginning.
+
+    Stops as soon as the container reports it cannot scroll further, so it
+    is cheap to call when the list is already at the top.
+
+    Args:
+        device_id: Device serial (None for default/selected device)
+        max_swipes: Upper bound on flings before giving up
+
+    Returns:
+        Dictionary containing:
+        - success: True if the call completed
+        - scrolled: False if there was no scrollable container on screen
+
+    Raises:
+        ValueError: max_swipes is not positive
+        DeviceConnectionError: Failed to connect to device
+    """
+    if max_swipes <= 0:
+        raise ValueError("max_swipes must be greater than 0")
+
+    device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
+
+    with device_manager.get_device(resolved_id) as device:
+        scrollable = device(scrollable=True)
+        scrolled = bool(scrollable.exists)
+        if scrolled:
+            scrollable.fling.vert.toBeginning(max_swipes=max_swipes)
+    if scrolled:
+        _expire_refs(resolved_id)
+
+    logger.info("Scrolled to top (scrollable found: %s)", scrolled)
+
+    return {
+        "success": True,
+        "scrolled": scrolled,
+    }
 
 
 @wrap_tool_errors(logger, "Clear text failed", pass_through=_INTERACTION_PASSTHROUGH)
@@ -414,22 +866,37 @@ def clear_text(
         DeviceConnectionError: Failed to connect to device
     """
     device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
+
+    # Resolve before taking the device so an expired ref fails first
+    pos = _resolve_position(resolved_id, ref) if ref else None
 
-    with device_manager.get_device(device_id) as device:
+    with device_manager.get_device(resolved_id) as device:
         # Focus element if ref provided
-        if ref:
-            resolved_id = device_manager.resolve_device_id_or_default(device_id)
-            pos_x, pos_y = _resolve_position(resolved_id, ref)
-            device.click(pos_x, pos_y)
-            time.sleep(0.3)
+        if pos is not None:
+            device.click(*pos)
+            _wait_for_focus(device, pos)
 
         device.clear_text()
+    _expire_refs(resolved_id)
 
-    description = _describe_target(element, ref)
-    logger.info(f"Cleared text from {description}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Cleared text from %s", _describe_target(element, ref))
 
     return {
         "success": True,
         "ref": ref,
         "element": element,
     }
+
+
+# Awaitable variants for driving several devices from one event loop
+device_tap_async = async_variant(device_tap)
+device_tap_many_async = async_variant(device_tap_many)
+device_batch_async = async_variant(device_batch)
+device_double_tap_async = async_variant(device_double_tap)
+device_long_press_async = async_variant(device_long_press)
+device_type_async = async_variant(device_type)
+device_swipe_async = async_variant(device_swipe)
+scroll_to_top_async = async_variant(scroll_to_top)
+clear_text_async = async_variant(clear_text)
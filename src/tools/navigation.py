@@ -4,13 +4,53 @@ Provides app lifecycle and navigation control.
 """
 import logging
 import time
+from enum import Enum
+from operator import methodcaller
 from typing import Any, Dict, Optional
 
-from ..core import DeviceConnectionError, get_device_manager
+from ..core import DeviceConnectionError, get_device_manager, get_snapshot_manager
 from ._errors import wrap_tool_errors
+from .interaction import _expire_refs, _invalidate_window_size
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on waiting for a force-stopped app to leave the foreground
+_STOP_TIMEOUT = 0.5
+_STOP_POLL_INTERVAL = 0.02
+
+
+def _wait_until_not_foreground(device, package: str, timeout: float = _STOP_TIMEOUT) -> None:
+    """Poll the foreground app until it is no longer package, up to timeout."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if device.app_current().get("package") != package:
+                return
+        except Exception:
+            return  # nothing focused, so the app is gone
+        if time.monotonic() >= deadline:
+            return
+        time.sleep(_STOP_POLL_INTERVAL)
+
+
+# press_key keys (names and keycodes) that leave the current screen
+_NAVIGATION_KEYS = frozenset({"back", "home", "recent", "power", "3", "4", "26", "187"})
+
+
+def _screen_changed(device_id: str) -> None:
+    """Drop screen-dependent caches after an action that replaces the screen.
+
+    Refs from the current snapshot stop resolving (a new snapshot is needed)
+    and the cached window size is re-read, since apps may force a rotation.
+    """
+    get_snapshot_manager().expire_current(device_id)
+    _invalidate_window_size(device_id)
+
+
+# Panel openers for _open_panel, built once instead of a lambda per call
+_OPEN_NOTIFICATION = methodcaller("open_notification")
+_OPEN_QUICK_SETTINGS = methodcaller("open_quick_settings")
+
 
 def _press_simple(
     label: str,
@@ -21,17 +61,19 @@ def _press_simple(
     device_manager = get_device_manager()
 
     try:
-        with device_manager.get_device(device_id) as device:
+        resolved_id = device_manager.resolve_device_id_or_default(device_id)
+        with device_manager.get_device(resolved_id) as device:
             device.press(key)
+            _screen_changed(resolved_id)
 
-            logger.info(f"Pressed {label}")
+            logger.info("Pressed %s", label)
 
             return {"success": True}
 
     except DeviceConnectionError:
         raise
     except Exception as e:
-        logger.error(f"Failed to press {label}: {e}")
+        logger.error("Failed to press %s: %s", label, e)
         raise RuntimeError(f"Failed to press {label}: {e}")
 
 
@@ -47,14 +89,14 @@ def _open_panel(
         with device_manager.get_device(device_id) as device:
             open_fn(device)
 
-            logger.info(f"Opened {label}")
+            logger.info("Opened %s", label)
 
             return {"success": True}
 
     except DeviceConnectionError:
         raise
     except Exception as e:
-        logger.error(f"Failed to open {label}: {e}")
+        logger.error("Failed to open %s: %s", label, e)
         raise RuntimeError(f"Failed to open {label}: {e}")
 
 @wrap_tool_errors(logger, "Failed to start app")
@@ -84,18 +126,20 @@ def app_start(
         DeviceConnectionError: Failed to connect to device
     """
     device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
 
-    with device_manager.get_device(device_id) as device:
+    with device_manager.get_device(resolved_id) as device:
         if stop_first:
             device.app_stop(package)
-            time.sleep(0.5)
+            _wait_until_not_foreground(device, package)
 
         if activity:
             device.app_start(package, activity, wait=wait)
         else:
             device.app_start(package, wait=wait)
+        _screen_changed(resolved_id)
 
-        logger.info(f"Started app: {package}")
+        logger.info("Started app: %s", package)
 
         return {
             "success": True,
@@ -122,11 +166,13 @@ def app_stop(
         DeviceConnectionError: Failed to connect to device
     """
     device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
 
-    with device_manager.get_device(device_id) as device:
+    with device_manager.get_device(resolved_id) as device:
         device.app_stop(package)
+        _screen_changed(resolved_id)
 
-        logger.info(f"Stopped app: {package}")
+        logger.info("Stopped app: %s", package)
 
         return {
             "success": True,
@@ -216,11 +262,17 @@ def press_key(
         DeviceConnectionError: Failed to connect to device
     """
     device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
 
-    with device_manager.get_device(device_id) as device:
+    with device_manager.get_device(resolved_id) as device:
         device.press(key)
+        if str(key).lower() in _NAVIGATION_KEYS:
+            _screen_changed(resolved_id)
+        else:
+            # Like device_type's submit: the screen may change, the window won't
+            _expire_refs(resolved_id)
 
-        logger.info(f"Pressed key: {key}")
+        logger.info("Pressed key: %s", key)
 
         return {
             "success": True,
@@ -240,7 +292,7 @@ def open_notification(device_id: Optional[str] = None) -> Dict[str, Any]:
     Raises:
         DeviceConnectionError: Failed to connect to device
     """
-    return _open_panel("notification panel", lambda dev: dev.open_notification(), device_id)
+    return _open_panel("notification panel", _OPEN_NOTIFICATION, device_id)
 
 
 def open_quick_settings(device_id: Optional[str] = None) -> Dict[str, Any]:
@@ -255,7 +307,19 @@ def open_quick_settings(device_id: Optional[str] = None) -> Dict[str, Any]:
     Raises:
         DeviceConnectionError: Failed to connect to device
     """
-    return _open_panel("quick settings", lambda dev: dev.open_quick_settings(), device_id)
+    return _open_panel("quick settings", _OPEN_QUICK_SETTINGS, device_id)
+
+
+class Orientation(str, Enum):
+    """Orientations accepted by set_orientation (plain strings work too)."""
+
+    NATURAL = "natural"
+    LEFT = "left"
+    RIGHT = "right"
+    UPSIDEDOWN = "upsidedown"
+
+
+_ORIENTATIONS = {orientation.value: orientation for orientation in Orientation}
 
 
 @wrap_tool_errors(logger, "Failed to set orientation", pass_through=(ValueError,))
@@ -276,21 +340,23 @@ def set_orientation(
         ValueError: Invalid orientation value
         DeviceConnectionError: Failed to connect to device
     """
-    device_manager = get_device_manager()
-
-    valid_orientations = ["natural", "left", "right", "upsidedown"]
-    if orientation.lower() not in valid_orientations:
+    orientation_key = _ORIENTATIONS.get(orientation.lower())
+    if orientation_key is None:
         raise ValueError(
             f"Invalid orientation: {orientation}. "
-            f"Must be one of: {valid_orientations}"
+            f"Must be one of: {list(_ORIENTATIONS)}"
         )
 
-    with device_manager.get_device(device_id) as device:
-        device.set_orientation(orientation.lower())
+    device_manager = get_device_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
+
+    with device_manager.get_device(resolved_id) as device:
+        device.set_orientation(orientation_key.value)
+        _screen_changed(resolved_id)
 
-        logger.info(f"Set orientation: {orientation}")
+        logger.info("Set orientation: %s", orientation)
 
         return {
             "success": True,
-            "orientation": orientation.lower(),
+            "orientation": orientation_key.value,
         }
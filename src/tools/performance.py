@@ -6,10 +6,13 @@ from __future__ import annotations
 
 import logging
 import re
+import subprocess
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from itertools import count
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 from ..core import DeviceConnectionError, get_device_manager
 
@@ -20,11 +23,22 @@ MAX_MONITORING_SESSIONS = 10
 # Security: Max snapshots per session to limit memory
 MAX_SNAPSHOTS_PER_SESSION = 1000
 _MAX_PACKAGE_NAME_LENGTH = 256
+# Monitoring samples FPS (and waits for frames) on every Nth poll only
+_FPS_CADENCE = 2
 _PACKAGE_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*(\.[a-zA-Z][a-zA-Z0-9_]*)*$")
-_CPU_MEM_RE = re.compile(r"(\d+\.?\d*)\s+(\d+\.?\d*)\s+\d+:\d+\.\d+\s+")
-_MEMINFO_TOTAL_RE = re.compile(r"TOTAL:\s+(\d+)")
-_BATTERY_LEVEL_RE = re.compile(r"level:\s*(\d+)")
-_BATTERY_TEMP_RE = re.compile(r"temperature:\s*(\d+)")
+_CPU_MEM_RE = re.compile(r"(\d+\.?\d*)\s+(\d+\.?\d*)\s+\d+:\d+\.\d+\s+", re.ASCII)
+_MEMINFO_TOTAL_RE = re.compile(r"TOTAL:\s+(\d+)", re.ASCII)
+_BATTERY_LEVEL_RE = re.compile(r"level:\s*(\d+)", re.ASCII)
+_BATTERY_TEMP_RE = re.compile(r"temperature:\s*(\d+)", re.ASCII)
+_VMRSS_RE = re.compile(r"VmRSS:\s+(\d+)", re.ASCII)
+_MEMTOTAL_RE = re.compile(r"MemTotal:\s+(\d+)", re.ASCII)
+# /proc/net/dev interface line (loopback excluded): rx bytes, 7 more rx fields, tx bytes
+_NETDEV_RE = re.compile(
+    r"^\s*(?!lo:)[^\s:]+:\s*(\d+)(?:\s+\d+){7}\s+(\d+)", re.MULTILINE | re.ASCII
+)
+# Precedes each command's output in the combined metrics shell call
+_SECTION_MARK = "__METRICS_"
+_SECTION_RE = re.compile(rf"^{_SECTION_MARK}(\w+?)__\r?$\n?", re.MULTILINE)
 
 
 def _validate_package_name(package: str) -> bool:
@@ -48,82 +62,244 @@ def _validate_package_name(package: str) -> bool:
     return bool(_PACKAGE_RE.match(package)) and len(package) <= _MAX_PACKAGE_NAME_LENGTH
 
 
-def _populate_cpu_memory(
+def _parse_cpu(snapshot: PerformanceSnapshot, output: str) -> None:
+    """Parse CPU and memory percentages from a `top` line."""
+    match = _CPU_MEM_RE.search(output)
+    if match:
+        snapshot.cpu_percent = float(match.group(1))
+        snapshot.memory_percent = float(match.group(2))
+
+
+def _proc_cpu_sample(output: str) -> Optional[Tuple[int, int, int, int]]:
+    """Parse a procfs CPU sample: an app's /proc/<pid>/stat plus /proc/stat cpu lines.
+
+    Returns:
+        (pid, app jiffies, total jiffies, cpu count), or None if incomplete
+    """
+    pid = app_jiffies = total_jiffies = None
+    cpus = 0
+    for line in output.splitlines():
+        if line.startswith("cpu "):
+            # user nice system idle iowait irq softirq steal (guest is in user)
+            total_jiffies = sum(int(value) for value in line.split()[1:9])
+        elif line.startswith("cpu"):
+            cpus += 1
+        elif line[:1].isdigit() and ")" in line:
+            # comm may contain spaces and parens; fields resume after the last ")"
+            fields = line.rsplit(")", 1)[1].split()
+            pid = int(line.split(" ", 1)[0])
+            app_jiffies = int(fields[11]) + int(fields[12])  # utime + stime
+    if pid is None or total_jiffies is None:
+        return None
+    return pid, app_jiffies, total_jiffies, max(cpus, 1)
+
+
+def _parse_cpu_procfs(
     snapshot: PerformanceSnapshot,
+    start: Tuple[int, int, int, int],
+    output: str,
+) -> Optional[Tuple[int, int, int, int]]:
+    """Compute CPU and memory metrics from two procfs samples.
+
+    CPU is scaled by the core count to match top's per-core percentages.
+    Memory is the process's resident set (VmRSS).
+
+    Returns:
+        The end sample parsed from output, usable as the next start sample
+    """
+    rss_match = _VMRSS_RE.search(output)
+    if rss_match:
+        rss_kb = int(rss_match.group(1))
+        snapshot.memory_mb = rss_kb / 1024  # KB to MB
+        total_match = _MEMTOTAL_RE.search(output)
+        if total_match:
+            snapshot.memory_percent = round(100.0 * rss_kb / int(total_match.group(1)), 1)
+
+    end = _proc_cpu_sample(output)
+    if end is None or end[0] != start[0]:
+        return end  # Process exited or restarted in between
+    _, start_app, start_total, _ = start
+    _, end_app, end_total, cpus = end
+    if end_total > start_total:
+        snapshot.cpu_percent = round(
+            100.0 * (end_app - start_app) / (end_total - start_total) * cpus, 1
+        )
+    return end
+
+
+def _parse_meminfo(snapshot: PerformanceSnapshot, output: str) -> None:
+    """Parse total PSS from `dumpsys meminfo`."""
+    match = _MEMINFO_TOTAL_RE.search(output)
+    if match:
+        snapshot.memory_mb = float(match.group(1)) / 1024  # KB to MB
+
+
+def _parse_battery(snapshot: PerformanceSnapshot, output: str) -> None:
+    """Parse battery level and temperature from `dumpsys battery`."""
+    level_match = _BATTERY_LEVEL_RE.search(output)
+    temp_match = _BATTERY_TEMP_RE.search(output)
+    if level_match:
+        snapshot.battery_level = int(level_match.group(1))
+    if temp_match:
+        snapshot.battery_temperature = int(temp_match.group(1)) / 10.0
+
+
+def _network_totals(output: str) -> Tuple[int, int]:
+    """Sum received/transmitted bytes over non-loopback interfaces."""
+    rx_total = 0
+    tx_total = 0
+    for match in _NETDEV_RE.finditer(output):
+        rx_total += int(match.group(1))
+        tx_total += int(match.group(2))
+    return rx_total, tx_total
+
+
+def _parse_network(snapshot: PerformanceSnapshot, output: str) -> None:
+    """Parse network byte counters from /proc/net/dev."""
+    snapshot.network_rx_bytes, snapshot.network_tx_bytes = _network_totals(output)
+
+
+def _parse_fps(snapshot: PerformanceSnapshot, output: str) -> None:
+    """Approximate FPS from SurfaceFlinger frame latency data."""
+    lines = [line for line in output.strip().split("\n") if line.strip()]
+    if len(lines) > 2:
+        valid_frames = sum(1 for line in lines[1:] if line.split()[0] != "0")
+        snapshot.fps = valid_frames * 2  # Approximate FPS
+
+
+# Section name -> parser, for the output of _collect_raw. "cpu" is parsed by
+# _parse_cpu_procfs instead when a starting procfs sample was taken.
+_PARSERS = {
+    "cpu": _parse_cpu,
+    "meminfo": _parse_meminfo,
+    "battery": _parse_battery,
+    "network": _parse_network,
+    "fps": _parse_fps,
+}
+
+
+def _run_sections(device, commands: List[Tuple[str, str]]) -> Dict[str, str]:
+    """Run (section name, command) pairs in one adb shell call.
+
+    Each command's output is preceded by a marker line naming its section,
+    so the combined output can be split back up per parser.
+
+    Returns:
+        Dict of section name -> raw output
+    """
+    script = "; ".join(f"echo {_SECTION_MARK}{name}__; {cmd}" for name, cmd in commands)
+    response = device.shell(script)
+    output = getattr(response, "output", response)
+
+    # re.split yields [preamble, name, body, name, body, ...]
+    parts = _SECTION_RE.split(output)
+    return dict(zip(parts[1::2], parts[2::2]))
+
+
+def _collect_raw(
     device,
     package: Optional[str],
-) -> None:
-    """Populate CPU and memory metrics for a package."""
-    if not package:
-        return
-
-    valid_package = _validate_package_name(package)
-    if not valid_package:
-        logger.warning(f"Invalid package name rejected: {package[:50]}")
-        return
-
-    try:
-        output = device.shell(f"top -n 1 -b | grep -F '{package}'")
-        match = _CPU_MEM_RE.search(output)
-        if match:
-            snapshot.cpu_percent = float(match.group(1))
-            snapshot.memory_percent = float(match.group(2))
-    except Exception as e:
-        logger.debug(f"Failed to get CPU metrics: {e}")
-
-    try:
-        output = device.shell(f"dumpsys meminfo '{package}' | head -20")
-        match = _MEMINFO_TOTAL_RE.search(output)
-        if match:
-            snapshot.memory_mb = float(match.group(1)) / 1024  # KB to MB
-    except Exception as e:
-        logger.debug(f"Failed to get memory metrics: {e}")
-
-
-def _populate_battery(snapshot: PerformanceSnapshot, device) -> None:
-    """Populate battery metrics for device."""
-    try:
-        output = device.shell("dumpsys battery")
-        level_match = _BATTERY_LEVEL_RE.search(output)
-        temp_match = _BATTERY_TEMP_RE.search(output)
-        if level_match:
-            snapshot.battery_level = int(level_match.group(1))
-        if temp_match:
-            snapshot.battery_temperature = int(temp_match.group(1)) / 10.0
-    except Exception:
-        pass
-
-
-def _populate_network(snapshot: PerformanceSnapshot, device) -> None:
-    """Populate network metrics for device."""
-    try:
-        output = device.shell("cat /proc/net/dev")
-        rx_total = 0
-        tx_total = 0
-        for line in output.split("\n"):
-            if ":" in line and "lo:" not in line:
-                parts = line.split()
-                if len(parts) >= 10:
-                    rx_total += int(parts[1])
-                    tx_total += int(parts[9])
-        snapshot.network_rx_bytes = rx_total
-        snapshot.network_tx_bytes = tx_total
-    except Exception:
-        pass
-
-
-def _populate_fps(snapshot: PerformanceSnapshot, device) -> None:
-    """Populate FPS metrics for device."""
-    try:
-        device.shell("dumpsys SurfaceFlinger --latency-clear")
-        time.sleep(0.5)
-        output = device.shell("dumpsys SurfaceFlinger --latency SurfaceView")
-        lines = [line for line in output.strip().split("\n") if line.strip()]
-        if len(lines) > 2:
-            valid_frames = sum(1 for line in lines[1:] if line.split()[0] != "0")
-            snapshot.fps = valid_frames * 2  # Approximate FPS
-    except Exception:
-        pass
+    pid: Optional[int] = None,
+    measure_fps: bool = True,
+) -> Dict[str, str]:
+    """Run every metric command in one adb shell call.
+
+    With the app's pid, CPU and memory come from procfs; otherwise from top
+    and `dumpsys meminfo`.
+
+    Returns:
+        Dict of section name -> raw output
+    """
+    commands = []
+    if package:
+        if pid is not None:
+            commands.append((
+                "cpu",
+                f"cat /proc/{pid}/stat; grep VmRSS /proc/{pid}/status; "
+                "grep '^cpu' /proc/stat; grep MemTotal /proc/meminfo",
+            ))
+        else:
+            commands.append(("cpu", f"top -n 1 -b | grep -F '{package}'"))
+            commands.append(("meminfo", f"dumpsys meminfo '{package}' | head -20"))
+    commands.append(("battery", "dumpsys battery"))
+    commands.append(("network", "cat /proc/net/dev"))
+    if measure_fps:
+        commands.append(("fps", "dumpsys SurfaceFlinger --latency SurfaceView"))
+    return _run_sections(device, commands)
+
+
+def _populate_metrics(
+    snapshot: PerformanceSnapshot,
+    device,
+    package: Optional[str],
+    measure_fps: bool = True,
+    cpu_start: Optional[Tuple[int, int, int, int]] = None,
+) -> Optional[Tuple[int, int, int, int]]:
+    """Populate all metrics for a device (and package, if given).
+
+    Args:
+        measure_fps: Whether to sample frame stats, which costs a 0.5 s wait
+        cpu_start: procfs CPU sample from an earlier call to measure against
+
+    Returns:
+        This call's procfs CPU sample, for use as the next cpu_start
+    """
+    if package and not _validate_package_name(package):
+        logger.warning("Invalid package name rejected: %s", package[:50])
+        package = None
+
+    # Frame stats need a cleared window and a short wait before the read.
+    # Without an earlier CPU sample, the app's CPU time is sampled at the
+    # start of that wait and again in the batch after it, which avoids top
+    # and its own one-second sample.
+    commands = []
+    if measure_fps:
+        commands.append(("fps_clear", "dumpsys SurfaceFlinger --latency-clear"))
+    if package and cpu_start is None:
+        commands.append((
+            "cpu",
+            f"p=$(pidof -s '{package}') && cat /proc/$p/stat && grep '^cpu' /proc/stat",
+        ))
+    if commands:
+        try:
+            first = _run_sections(device, commands)
+            time.sleep(0.5)
+            if "cpu" in first:
+                cpu_start = _proc_cpu_sample(first["cpu"])
+        except Exception as e:
+            logger.debug("Failed to start frame/CPU sampling: %s", e)
+
+    cpu_end = None
+    sections = _collect_raw(
+        device, package, cpu_start[0] if cpu_start else None, measure_fps
+    )
+    for name, output in sections.items():
+        try:
+            if name == "cpu" and cpu_start:
+                cpu_end = _parse_cpu_procfs(snapshot, cpu_start, output)
+            else:
+                _PARSERS[name](snapshot, output)
+        except Exception as e:
+            logger.debug("Failed to parse %s metrics: %s", name, e)
+    return cpu_end
+
+
+def _summarize(values: Iterable[Optional[float]]) -> Dict[str, Optional[float]]:
+    """Summarize one metric across snapshots, ignoring missing samples.
+
+    A single sort yields min, max and the percentiles together.
+    """
+    ordered = sorted(value for value in values if value is not None)
+    if not ordered:
+        return {"avg": None, "max": None, "min": None, "p50": None, "p95": None}
+    last = len(ordered) - 1
+    return {
+        "avg": sum(ordered) / len(ordered),
+        "max": ordered[-1],
+        "min": ordered[0],
+        "p50": ordered[round(last * 0.5)],
+        "p95": ordered[round(last * 0.95)],
+    }
 
 
 @dataclass
@@ -132,7 +308,7 @@ class PerformanceSnapshot:
 
     timestamp: float
     cpu_percent: Optional[float] = None
-    memory_mb: Optional[float] = None
+    memory_mb: Optional[float] = None  # VmRSS, or PSS when the pid is unknown
     memory_percent: Optional[float] = None
     fps: Optional[float] = None
     network_rx_bytes: Optional[int] = None
@@ -150,8 +326,101 @@ class MonitoringSession:
     package: str
     start_time: float
     poll_interval: float
-    snapshots: List[PerformanceSnapshot] = field(default_factory=list)
+    # Oldest snapshots drop off once the per-session limit is reached
+    snapshots: Deque[PerformanceSnapshot] = field(
+        default_factory=lambda: deque(maxlen=MAX_SNAPSHOTS_PER_SESSION)
+    )
     is_running: bool = False
+    # Monitored process, once found; None until then or after it exits
+    pid: Optional[int] = None
+
+
+class PersistentShell:
+    """A long-lived `adb shell` that runs commands without a new transaction each.
+
+    Each command is followed by a unique end marker, and its output is read
+    up to that marker. Exposes shell() so it can stand in for a device in
+    the metric helpers. If the adb shell cannot start or dies, commands go
+    through the attached device's own shell() from then on. Not
+    thread-safe: use one per monitoring thread.
+    """
+
+    def __init__(self, timeout: float = 10.0):
+        self._timeout = timeout
+        self._device = None
+        self._serial: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._markers = count()
+        self._available = True
+
+    def attach(self, device) -> None:
+        """Target device's serial, and fall back to device.shell() on failure."""
+        serial = getattr(device, "serial", None)
+        if serial != self._serial:
+            self.close()
+            self._serial = serial
+        self._device = device
+
+    def shell(self, command: str):
+        """Run a command and return its output."""
+        if self._available and self._serial:
+            try:
+                return self._run(command)
+            except (OSError, ValueError, RuntimeError) as e:
+                logger.warning(
+                    "Persistent adb shell for %s failed; using device shell: %s",
+                    self._serial, e,
+                )
+                self._available = False
+                self.close()
+        return self._device.shell(command)
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            # -T: no PTY, so the input is not echoed back into the output
+            self._process = subprocess.Popen(
+                ["adb", "-s", self._serial, "shell", "-T"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        return self._process
+
+    def _run(self, command: str) -> str:
+        """Run a command in the adb shell process.
+
+        Raises:
+            RuntimeError: The shell exited or timed out
+        """
+        process = self._ensure_started()
+        marker_id = next(self._markers)
+        marker = f"__EOF_{marker_id}__"
+        # A hung device would block readline forever; killing the shell ends it
+        watchdog = threading.Timer(self._timeout, process.kill)
+        watchdog.start()
+        try:
+            # Quoted so an echoed input line (legacy PTY shells) never matches
+            process.stdin.write(f'{command}; echo __EOF_""{marker_id}__\n'.encode())
+            lines = []
+            for raw in iter(process.stdout.readline, b""):
+                line = raw.decode(errors="replace")
+                end = line.find(marker)
+                if end != -1:
+                    # Output without a trailing newline shares the marker's line
+                    lines.append(line[:end])
+                    return "".join(lines)
+                lines.append(line)
+        finally:
+            watchdog.cancel()
+        raise RuntimeError("adb shell exited before the command finished")
+
+    def close(self):
+        """Terminate the shell process, if running."""
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
 
 
 class PerformanceMonitor:
@@ -162,7 +431,6 @@ class PerformanceMonitor:
         self._running: Dict[str, bool] = {}
         self._threads: Dict[str, threading.Thread] = {}
         self._lock = threading.Lock()
-        self._poll_interval = 1.0
 
     def get_metrics_snapshot(
         self,
@@ -178,8 +446,23 @@ class PerformanceMonitor:
         Returns:
             PerformanceSnapshot with current metrics
         """
+        return self._collect(device_id, package)[0]
+
+    def _collect(
+        self,
+        device_id: str,
+        package: Optional[str],
+        measure_fps: bool = True,
+        cpu_start: Optional[Tuple[int, int, int, int]] = None,
+        shell: Optional[PersistentShell] = None,
+    ) -> Tuple[PerformanceSnapshot, Optional[Tuple[int, int, int, int]]]:
+        """Collect a snapshot, returning it with its procfs CPU sample.
+
+        Metric commands go through shell, attached to the device, when given.
+        """
         device_manager = get_device_manager()
         snapshot = PerformanceSnapshot(timestamp=time.time())
+        cpu_end = None
 
         try:
             with device_manager.get_device(device_id) as device:
@@ -187,17 +470,20 @@ class PerformanceMonitor:
                     current = device.app_current()
                     package = current.get("package")
 
-                _populate_cpu_memory(snapshot, device, package)
-                _populate_battery(snapshot, device)
-                _populate_network(snapshot, device)
-                _populate_fps(snapshot, device)
+                source = device
+                if shell is not None:
+                    shell.attach(device)
+                    source = shell
+                cpu_end = _populate_metrics(
+                    snapshot, source, package, measure_fps, cpu_start
+                )
 
         except DeviceConnectionError:
             raise
         except Exception as e:
-            logger.warning(f"Error collecting metrics: {e}")
+            logger.warning("Error collecting metrics: %s", e)
 
-        return snapshot
+        return snapshot, cpu_end
 
     def _monitor_loop(
         self,
@@ -206,29 +492,64 @@ class PerformanceMonitor:
         package: str,
         poll_interval: float,
     ):
-        """Background monitoring loop."""
-        logger.info(f"Monitoring started for session '{session_id}'")
+        """Background monitoring loop.
 
-        while self._running.get(session_id, False):
-            try:
-                snapshot = self.get_metrics_snapshot(device_id, package)
+        Samples are scheduled on fixed monotonic ticks so collection time does
+        not stretch the interval. Ticks missed by more than a full interval are
+        skipped rather than sampled back to back.
 
-                with self._lock:
-                    session = self._sessions.get(session_id)
+        CPU is measured from one poll's procfs sample to the next, so only
+        every _FPS_CADENCE-th poll pays the 0.5 s frame-stats wait; the
+        polls in between carry the last FPS reading forward. Commands run
+        in one persistent adb shell for the life of the loop.
+        """
+        logger.info("Monitoring started for session '%s'", session_id)
+        next_tick = time.monotonic() + poll_interval
+        session = self._sessions.get(session_id)
+        shell = PersistentShell()
+        polls = 0
+        cpu_sample = None
+        fps = None
+
+        try:
+            while self._running.get(session_id, False):
+                try:
+                    measure_fps = polls % _FPS_CADENCE == 0
+                    polls += 1
+                    snapshot, cpu_sample = self._collect(
+                        device_id, package, measure_fps, cpu_sample, shell
+                    )
+                    # The sample carries the pid into the next poll, which then
+                    # reads /proc/<pid> without pidof; a failed read clears it
+                    if session:
+                        session.pid = cpu_sample[0] if cpu_sample else None
+                    if measure_fps:
+                        fps = snapshot.fps
+                    else:
+                        snapshot.fps = fps
+                    # deque.append is atomic, so polls don't contend on self._lock
                     if session:
-                        # Limit snapshots per session to prevent memory overflow
-                        if len(session.snapshots) >= MAX_SNAPSHOTS_PER_SESSION:
-                            # Keep last 75% of snapshots
-                            keep_count = int(MAX_SNAPSHOTS_PER_SESSION * 0.75)
-                            session.snapshots = session.snapshots[-keep_count:]
                         session.snapshots.append(snapshot)
 
-            except Exception as e:
-                logger.warning(f"Monitoring error: {e}")
-
-            time.sleep(poll_interval)
-
-        logger.info(f"Monitoring stopped for session '{session_id}'")
+                except Exception as e:
+                    logger.warning("Monitoring error: %s", e)
+
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for < -poll_interval:
+                    logger.warning(
+                        "Session '%s' fell %.2fs behind; skipping missed samples",
+                        session_id, -sleep_for,
+                    )
+                    # Resync: the next sample is a full interval after this one
+                    next_tick = time.monotonic() + poll_interval
+                    sleep_for = poll_interval
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                next_tick += poll_interval
+        finally:
+            shell.close()
+
+        logger.info("Monitoring stopped for session '%s'", session_id)
 
     def start_monitoring(
         self,
@@ -284,7 +605,6 @@ class PerformanceMonitor:
 
             self._sessions[session_id] = session
             self._running[session_id] = True
-            self._poll_interval = poll_interval
 
         thread = threading.Thread(
             target=self._monitor_loop,
@@ -320,8 +640,8 @@ class PerformanceMonitor:
         if not session:
             return None
 
-        # Calculate summary
-        snapshots = session.snapshots
+        # Calculate summary over a copy, in case the thread outlived the join
+        snapshots = list(session.snapshots)
         if not snapshots:
             return {
                 "session_id": session_id,
@@ -329,31 +649,14 @@ class PerformanceMonitor:
                 "sample_count": 0,
             }
 
-        # Aggregate metrics
-        cpu_values = [s.cpu_percent for s in snapshots if s.cpu_percent is not None]
-        mem_values = [s.memory_mb for s in snapshots if s.memory_mb is not None]
-        fps_values = [s.fps for s in snapshots if s.fps is not None]
-
         summary = {
             "session_id": session_id,
             "package": session.package,
             "duration": time.time() - session.start_time,
             "sample_count": len(snapshots),
-            "cpu": {
-                "avg": sum(cpu_values) / len(cpu_values) if cpu_values else None,
-                "max": max(cpu_values) if cpu_values else None,
-                "min": min(cpu_values) if cpu_values else None,
-            },
-            "memory_mb": {
-                "avg": sum(mem_values) / len(mem_values) if mem_values else None,
-                "max": max(mem_values) if mem_values else None,
-                "min": min(mem_values) if mem_values else None,
-            },
-            "fps": {
-                "avg": sum(fps_values) / len(fps_values) if fps_values else None,
-                "max": max(fps_values) if fps_values else None,
-                "min": min(fps_values) if fps_values else None,
-            },
+            "cpu": _summarize(s.cpu_percent for s in snapshots),
+            "memory_mb": _summarize(s.memory_mb for s in snapshots),
+            "fps": _summarize(s.fps for s in snapshots),
         }
 
         return summary
@@ -372,6 +675,9 @@ _monitor_lock = threading.Lock()
 def get_performance_monitor() -> PerformanceMonitor:
     """Get the global PerformanceMonitor instance."""
     global _performance_monitor
+    instance = _performance_monitor
+    if instance is not None:
+        return instance
     with _monitor_lock:
         if _performance_monitor is None:
             _performance_monitor = PerformanceMonitor()
@@ -394,8 +700,10 @@ def get_performance_metrics(
     Returns:
         Dictionary with performance metrics:
         - cpu_percent: CPU usage
-        - memory_mb: Memory usage in MB
-        - memory_percent: Memory usage percentage
+        - memory_mb: App memory in MB: resident set (VmRSS) when the app's
+          pid is found, else total PSS from `dumpsys meminfo`. RSS counts
+          shared pages in full, so it reads higher than PSS.
+        - memory_percent: Resident memory as a percentage of device RAM
         - fps: Frames per second (approximate)
         - battery_level: Battery percentage
         - battery_temperature: Battery temperature
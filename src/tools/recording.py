@@ -113,7 +113,7 @@ class RecordingManager:
                     # Remove oldest until under limit
                     for rid, _ in completed[:len(self._recordings) - MAX_RECORDINGS + 1]:
                         self._recordings.pop(rid, None)
-                        logger.debug(f"Evicted old recording: {rid}")
+                        logger.debug("Evicted old recording: %s", rid)
                 else:
                     logger.warning(
                         "Recording limit reached; no completed recordings to evict"
@@ -133,7 +133,7 @@ class RecordingManager:
             self._recordings[recording_id] = recording
             self._active[device_id] = recording_id
 
-        logger.info(f"Started recording '{recording_id}' for device '{device_id}'")
+        logger.info("Started recording '%s' for device '%s'", recording_id, device_id)
         return recording
 
     def add_event(
@@ -160,7 +160,9 @@ class RecordingManager:
             # Limit events per recording to prevent memory overflow
             if len(recording.events) >= MAX_EVENTS_PER_RECORDING:
                 logger.warning(
-                    f"Recording {recording_id} reached max events ({MAX_EVENTS_PER_RECORDING})"
+                    "Recording %s reached max events (%s)",
+                    recording_id,
+                    MAX_EVENTS_PER_RECORDING,
                 )
                 return False
 
@@ -171,7 +173,7 @@ class RecordingManager:
             )
             recording.events.append(event)
 
-        logger.debug(f"Added {event_type} event to recording '{recording_id}'")
+        logger.debug("Added %s event to recording '%s'", event_type, recording_id)
         return True
 
     def stop_recording(self, recording_id: str) -> Optional[GestureRecording]:
@@ -197,7 +199,9 @@ class RecordingManager:
                 del self._active[recording.device_id]
 
         logger.info(
-            f"Stopped recording '{recording_id}' with {len(recording.events)} events"
+            "Stopped recording '%s' with %s events",
+            recording_id,
+            len(recording.events),
         )
         return recording
 
@@ -236,8 +240,8 @@ class RecordingManager:
                 return True
         return False
 
-    def export_recording(self, recording_id: str) -> Optional[str]:
-        """Export recording to JSON string."""
+    def export_recording(self, recording_id: str, compact: bool = False) -> Optional[str]:
+        """Export recording to JSON string (indented unless compact)."""
         with self._lock:
             recording = self._recordings.get(recording_id)
             if not recording:
@@ -248,15 +252,14 @@ class RecordingManager:
                 "device_id": recording.device_id,
                 "metadata": recording.metadata,
                 "events": [
-                    {
-                        "type": e.type,
-                        "timestamp": e.timestamp,
-                        "params": e.params,
-                    }
+                    {"type": e.type, "timestamp": e.timestamp, "params": e.params}
                     for e in recording.events
                 ],
             }
-            return json.dumps(data, indent=2)
+
+        if compact:
+            return json.dumps(data, separators=(",", ":"))
+        return json.dumps(data, indent=2)
 
     def import_recording(self, json_data: str) -> Optional[GestureRecording]:
         """Import recording from JSON string."""
@@ -286,7 +289,7 @@ class RecordingManager:
             return recording
 
         except Exception as e:
-            logger.error(f"Failed to import recording: {e}")
+            logger.error("Failed to import recording: %s", e)
             return None
 
     def play_recording(
@@ -351,7 +354,10 @@ class RecordingManager:
             raise
 
         logger.info(
-            f"Played recording '{recording_id}': {events_played}/{len(recording.events)} events"
+            "Played recording '%s': %s/%s events",
+            recording_id,
+            events_played,
+            len(recording.events),
         )
 
         return {
@@ -370,6 +376,9 @@ _manager_lock = threading.Lock()
 def get_recording_manager() -> RecordingManager:
     """Get the global RecordingManager instance."""
     global _recording_manager
+    instance = _recording_manager
+    if instance is not None:
+        return instance
     with _manager_lock:
         if _recording_manager is None:
             _recording_manager = RecordingManager()
@@ -601,17 +610,18 @@ def list_gesture_recordings() -> Dict[str, Any]:
     }
 
 
-def export_gesture_recording(recording_id: str) -> Dict[str, Any]:
+def export_gesture_recording(recording_id: str, compact: bool = False) -> Dict[str, Any]:
     """Export a recording to JSON.
 
     Args:
         recording_id: Recording to export
+        compact: Omit indentation and spaces for a smaller payload
 
     Returns:
         Dictionary with JSON data
     """
     manager = get_recording_manager()
-    json_data = manager.export_recording(recording_id)
+    json_data = manager.export_recording(recording_id, compact=compact)
 
     if not json_data:
         return {
@@ -3,12 +3,20 @@
 Provides UI snapshot with ref ID system, screenshot capture, and element finding.
 """
 import base64
+import json
 import logging
 from contextlib import closing
 from io import BytesIO
-from typing import Any, Dict, Optional
-
-from ..core import Snapshot, get_device_manager, get_snapshot_manager
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..core import (
+    ElementInfo,
+    RefNotFoundError,
+    Snapshot,
+    get_device_manager,
+    get_snapshot_manager,
+)
 from ._errors import wrap_tool_errors
 
 logger = logging.getLogger(__name__)
@@ -18,8 +26,9 @@ def _capture_snapshot(device_id: Optional[str] = None) -> Snapshot:
     """Capture a snapshot and return the Snapshot object."""
     device_manager = get_device_manager()
     snapshot_manager = get_snapshot_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
 
-    with device_manager.get_device(device_id) as device:
+    with device_manager.get_device(resolved_id) as device:
         current_app = device.app_current()
         package = current_app.get("package", "unknown")
         activity = current_app.get("activity", "unknown")
@@ -29,7 +38,6 @@ def _capture_snapshot(device_id: Optional[str] = None) -> Snapshot:
 
         xml_content = device.dump_hierarchy()
 
-        resolved_id = device_manager.resolve_device_id_or_default(device_id)
         return snapshot_manager.create_snapshot(
             device_id=resolved_id,
             xml_content=xml_content,
@@ -39,15 +47,72 @@ def _capture_snapshot(device_id: Optional[str] = None) -> Snapshot:
         )
 
 
-@wrap_tool_errors(logger, "Failed to capture snapshot")
-def device_snapshot(device_id: Optional[str] = None) -> Dict[str, Any]:
+def _select_ref_range(
+    snapshot: Snapshot,
+    elements: Iterable[ElementInfo],
+    start_ref: Optional[str],
+    end_ref: Optional[str],
+) -> Iterator[ElementInfo]:
+    """Keep elements between start_ref and end_ref (inclusive, snapshot order)."""
+    order = snapshot.positions
+    for ref in (start_ref, end_ref):
+        if ref is not None and ref not in order:
+            raise RefNotFoundError(ref, list(order))
+    low = order[start_ref] if start_ref is not None else 0
+    high = order[end_ref] if end_ref is not None else len(order)
+    return (elem for elem in elements if low <= order[elem.ref] <= high)
+
+
+def _trim_elements(
+    elements: List[Dict[str, Any]],
+    max_chars: int,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split elements into those fitting within max_chars of JSON and the rest.
+
+    The first element is always kept, so paging with start_ref makes progress
+    even when one element alone exceeds max_chars.
+    """
+    used = 0
+    for i, elem in enumerate(elements):
+        used += len(json.dumps(elem))
+        if used > max_chars and i > 0:
+            return elements[:i], elements[i:]
+    return elements, []
+
+
+def _search_snapshot(device_id: Optional[str], refresh_snapshot: bool) -> Snapshot:
+    """Return the snapshot to search, capturing one if needed or requested."""
+    device_manager = get_device_manager()
+    snapshot_manager = get_snapshot_manager()
+    resolved_id = device_manager.resolve_device_id_or_default(device_id)
+
+    # Refresh snapshot if needed
+    if refresh_snapshot or not snapshot_manager.get_current_snapshot(resolved_id):
+        device_snapshot(device_id)
+
+    # Get current snapshot
+    snapshot = snapshot_manager.get_current_snapshot(resolved_id)
+    if not snapshot:
+        raise RuntimeError("No snapshot available")
+    return snapshot
+
+
+@wrap_tool_errors(logger, "Failed to capture snapshot", pass_through=(ValueError,))
+def device_snapshot(
+    device_id: Optional[str] = None,
+    max_chars: Optional[int] = None,
+) -> Dict[str, Any]:
     """Capture UI snapshot with Playwright-style ref IDs.
 
     This is the core tool for UI automation. Each UI element gets a unique
     ref ID (e.g., "e0", "e1") that can be used for subsequent interactions.
 
+    Large screens can be capped with max_chars, as in find_element; the
+    trimmed refs can be fetched with find_element(start_ref=next_ref).
+
     Args:
         device_id: Device serial (None for default/selected device)
+        max_chars: Cap on the serialized size of the refs (None for no cap)
 
     Returns:
         Dictionary containing:
@@ -55,9 +120,12 @@ def device_snapshot(device_id: Optional[str] = None) -> Dict[str, Any]:
         - url: Current app package/activity (like browser URL)
         - screen_size: {width, height}
         - element_count: Total number of elements
+        - fingerprint: Content hash of element texts, IDs, classes and bounds
         - refs: Dictionary mapping ref IDs to element info
             - Each element has: class, text, content-desc, resource-id,
               bounds, center, clickable, enabled, etc.
+        - trimmed: "[refs eX-eY trimmed]" marker (only when max_chars cut the refs)
+        - next_ref: First trimmed ref, for find_element's start_ref (only when trimmed)
 
     Example:
         >>> snapshot = device_snapshot()
@@ -71,13 +139,32 @@ def device_snapshot(device_id: Optional[str] = None) -> Dict[str, Any]:
     Raises:
         DeviceConnectionError: Failed to connect to device
         RuntimeError: Failed to capture snapshot
+        ValueError: max_chars is not positive
     """
+    if max_chars is not None and max_chars <= 0:
+        raise ValueError("max_chars must be greater than 0")
+
     snapshot = _capture_snapshot(device_id)
     logger.info(
-        f"Snapshot created: {snapshot.snapshot_id} "
-        f"({len(snapshot.refs)} elements)"
+        "Snapshot created: %s (%s elements)",
+        snapshot.snapshot_id,
+        len(snapshot.refs),
     )
-    return snapshot.to_dict()
+    result = snapshot.to_dict()
+    if max_chars is None:
+        return result
+
+    refs = result["refs"]
+    kept, trimmed = _trim_elements(list(refs.values()), max_chars)
+    if not trimmed:
+        return result
+    names = list(refs)
+    return {
+        **result,
+        "refs": dict(zip(names, kept)),
+        "trimmed": f"[refs {names[len(kept)]}-{names[-1]} trimmed]",
+        "next_ref": names[len(kept)],
+    }
 
 
 @wrap_tool_errors(logger, "Failed to capture screenshot", pass_through=(ValueError,))
@@ -133,8 +220,10 @@ def screenshot(
             base64_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
 
         logger.info(
-            f"Screenshot captured: {img.width}x{img.height}, "
-            f"{len(base64_data)} bytes (base64)"
+            "Screenshot captured: %sx%s, %s bytes (base64)",
+            img.width,
+            img.height,
+            len(base64_data),
         )
 
         return {
@@ -157,12 +246,20 @@ def find_element(
     clickable: Optional[bool] = None,
     enabled: Optional[bool] = None,
     refresh_snapshot: bool = False,
+    max_chars: Optional[int] = None,
+    start_ref: Optional[str] = None,
+    end_ref: Optional[str] = None,
+    limit: Optional[int] = None,
+    root_ref: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Find elements matching criteria in current snapshot.
 
     Uses the most recent snapshot to find matching elements. If no snapshot
     exists or refresh_snapshot is True, takes a new snapshot first.
 
+    Large results can be capped with max_chars; the trimmed tail is reported
+    with a marker and can be fetched with a follow-up call using start_ref.
+
     Args:
         device_id: Device serial (None for default/selected device)
         text: Exact text match
@@ -174,32 +271,36 @@ def find_element(
         clickable: Filter by clickable state
         enabled: Filter by enabled state
         refresh_snapshot: Force new snapshot before searching
+        max_chars: Cap on the serialized size of returned elements (None for no cap)
+        start_ref: Only match elements from this ref onward (snapshot order)
+        end_ref: Only match elements up to and including this ref
+        limit: Stop after this many matches in hierarchy order (None for all)
+        root_ref: Only search this element and its descendants
 
     Returns:
         Dictionary containing:
-        - count: Number of matching elements
+        - count: Number of matching elements (at most limit)
         - elements: List of matching elements with their refs
         - snapshot_id: ID of the snapshot used
+        - fingerprint: Content hash of the snapshot (equal means unchanged screen)
+        - trimmed: "[refs eX-eY trimmed]" marker (only when max_chars cut the result)
+        - next_ref: First trimmed ref, for a follow-up start_ref (only when trimmed)
 
     Raises:
         DeviceConnectionError: Failed to connect to device
+        RefNotFoundError: start_ref, end_ref or root_ref is not in the snapshot
         ElementNotFoundError: No elements match criteria (if strict mode)
     """
-    device_manager = get_device_manager()
-    snapshot_manager = get_snapshot_manager()
-    resolved_id = device_manager.resolve_device_id_or_default(device_id)
+    if max_chars is not None and max_chars <= 0:
+        raise ValueError("max_chars must be greater than 0")
+    if limit is not None and limit <= 0:
+        raise ValueError("limit must be greater than 0")
 
-    # Refresh snapshot if needed
-    if refresh_snapshot or not snapshot_manager.get_current_snapshot(resolved_id):
-        device_snapshot(device_id)
-
-    # Get current snapshot
-    snapshot = snapshot_manager.get_current_snapshot(resolved_id)
-    if not snapshot:
-        raise RuntimeError("No snapshot available")
+    snapshot = _search_snapshot(device_id, refresh_snapshot)
 
     # Find matching elements
-    matches = snapshot.find_elements(
+    candidates: Iterable[ElementInfo] = snapshot.iter_elements(
+        root_ref=root_ref,
         text=text,
         text_contains=text_contains,
         resource_id=resource_id,
@@ -210,12 +311,101 @@ def find_element(
         enabled=enabled,
     )
 
-    logger.info(f"Found {len(matches)} elements matching criteria")
+    if start_ref is not None or end_ref is not None:
+        candidates = _select_ref_range(snapshot, candidates, start_ref, end_ref)
+    if limit is not None:
+        candidates = islice(candidates, limit)
+    matches = list(candidates)
 
-    return {
+    logger.info("Found %s elements matching criteria", len(matches))
+
+    elements = [{"ref": elem.ref, **elem.to_dict()} for elem in matches]
+    trimmed: List[Dict[str, Any]] = []
+    if max_chars is not None:
+        elements, trimmed = _trim_elements(elements, max_chars)
+
+    result = {
         "count": len(matches),
-        "elements": [
-            {"ref": elem.ref, **elem.to_dict()} for elem in matches
-        ],
+        "elements": elements,
+        "snapshot_id": snapshot.snapshot_id,
+        "fingerprint": snapshot.fingerprint,
+    }
+    if trimmed:
+        result["trimmed"] = f"[refs {trimmed[0]['ref']}-{trimmed[-1]['ref']} trimmed]"
+        result["next_ref"] = trimmed[0]["ref"]
+    return result
+
+
+# Criteria accepted in each find_elements query
+_QUERY_KEYS = frozenset({
+    "text",
+    "text_contains",
+    "resource_id",
+    "resource_id_contains",
+    "class_name",
+    "content_desc",
+    "clickable",
+    "enabled",
+})
+
+
+@wrap_tool_errors(
+    logger, "Failed to find elements", pass_through=(ValueError, RefNotFoundError)
+)
+def find_elements(
+    queries: List[Dict[str, Any]],
+    device_id: Optional[str] = None,
+    refresh_snapshot: bool = False,
+    limit: Optional[int] = None,
+    root_ref: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run several element searches against a single snapshot.
+
+    Each query takes the same criteria as find_element. Resolving a screen's
+    elements in one call avoids a round trip (and possibly a snapshot) per
+    element.
+
+    Args:
+        queries: List of criteria dicts, e.g. [{"text": "OK"}, {"resource_id": "..."}]
+        device_id: Device serial (None for default/selected device)
+        refresh_snapshot: Force new snapshot before searching
+        limit: Stop each query after this many matches (None for all)
+        root_ref: Only search this element and its descendants
+
+    Returns:
+        Dictionary containing:
+        - results: One {count, elements} entry per query, in query order
+        - snapshot_id: ID of the snapshot used
+        - fingerprint: Content hash of the snapshot (equal means unchanged screen)
+
+    Raises:
+        ValueError: Empty queries, unknown criteria or invalid limit
+        DeviceConnectionError: Failed to connect to device
+        RefNotFoundError: root_ref is not in the snapshot
+    """
+    if not queries:
+        raise ValueError("queries must not be empty")
+    for query in queries:
+        unknown = set(query) - _QUERY_KEYS
+        if unknown:
+            raise ValueError(f"Unknown criteria: {', '.join(sorted(unknown))}")
+    if limit is not None and limit <= 0:
+        raise ValueError("limit must be greater than 0")
+
+    snapshot = _search_snapshot(device_id, refresh_snapshot)
+
+    results = []
+    for query in queries:
+        candidates: Iterable[ElementInfo] = snapshot.iter_elements(root_ref, **query)
+        if limit is not None:
+            candidates = islice(candidates, limit)
+        matches = [{"ref": elem.ref, **elem.to_dict()} for elem in candidates]
+        results.append({"count": len(matches), "elements": matches})
+
+    logger.info("Resolved %s element queries in one snapshot", len(queries))
+
+    return {
+        "results": results,
         "snapshot_id": snapshot.snapshot_id,
+        "fingerprint": snapshot.fingerprint,
     }
@@ -3,15 +3,20 @@
 Provides various wait conditions for synchronization.
 """
 import logging
+import re
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from ..core import get_device_manager, get_snapshot_manager
+from ..core import RefNotFoundError, Snapshot, StaleRefError, get_device_manager
+from .interaction import _expire_refs, device_tap
 from .snapshot import _capture_snapshot
 from ._errors import wrap_tool_errors
 
 logger = logging.getLogger(__name__)
 
+# Growth factor applied to the sleep between checks when backoff is enabled
+_POLL_BACKOFF_FACTOR = 1.7
+
 
 def _build_element_criteria(
     text: Optional[str] = None,
@@ -38,27 +43,63 @@ def _build_element_criteria(
     return criteria
 
 
-def _validate_polling(timeout: float, poll_interval: float) -> None:
+def _validate_polling(
+    timeout: float,
+    poll_interval: float,
+    initial_poll_interval: Optional[float] = None,
+) -> None:
     """Validate polling configuration."""
     if timeout <= 0:
         raise ValueError("timeout must be greater than 0")
     if poll_interval <= 0:
         raise ValueError("poll_interval must be greater than 0")
+    if initial_poll_interval is not None and initial_poll_interval <= 0:
+        raise ValueError("initial_poll_interval must be greater than 0")
 
 
 def _poll_until(
     timeout: float,
     poll_interval: float,
     check,
+    initial_poll_interval: Optional[float] = None,
 ) -> tuple[bool, Any, float]:
-    """Poll until check returns a non-None result or timeout."""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    """Poll until check returns a non-None result or timeout.
+
+    If initial_poll_interval is given, the first sleep uses it and each
+    following sleep grows geometrically up to poll_interval, so fast UI
+    transitions are caught early without hammering slow ones.
+    """
+    if initial_poll_interval is None:
+        interval = poll_interval
+    else:
+        interval = min(initial_poll_interval, poll_interval)
+    start_time = time.monotonic()
+    while time.monotonic() - start_time < timeout:
         result = check()
         if result is not None:
-            return True, result, time.time() - start_time
-        time.sleep(poll_interval)
-    return False, None, time.time() - start_time
+            return True, result, time.monotonic() - start_time
+        time.sleep(interval)
+        interval = min(poll_interval, interval * _POLL_BACKOFF_FACTOR)
+    return False, None, time.monotonic() - start_time
+
+
+def _snapshot_if_changed(device_id: Optional[str]):
+    """Return a capture function that yields None while the screen is unchanged.
+
+    Lets wait loops skip re-matching a snapshot whose fingerprint equals the
+    previous tick's.
+    """
+    last_fingerprint = None
+
+    def capture() -> Optional[Snapshot]:
+        nonlocal last_fingerprint
+        snapshot = _capture_snapshot(device_id)
+        if snapshot.fingerprint == last_fingerprint:
+            return None
+        last_fingerprint = snapshot.fingerprint
+        return snapshot
+
+    return capture
 
 
 def wait(
@@ -79,7 +120,7 @@ def wait(
         - waited: Actual seconds waited
     """
     time.sleep(seconds)
-    logger.info(f"Waited {seconds} seconds")
+    logger.info("Waited %s seconds", seconds)
 
     return {
         "success": True,
@@ -98,6 +139,7 @@ def wait_for_element(
     content_desc: Optional[str] = None,
     timeout: float = 10.0,
     poll_interval: float = 0.5,
+    initial_poll_interval: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Wait for an element to appear.
 
@@ -112,7 +154,9 @@ def wait_for_element(
         class_name: Element class name
         content_desc: Content description
         timeout: Maximum wait time in seconds
-        poll_interval: Time between checks
+        poll_interval: Time between checks (upper bound when backing off)
+        initial_poll_interval: First time between checks; grows toward
+            poll_interval on each miss (None for a fixed interval)
 
     Returns:
         Dictionary with:
@@ -123,12 +167,9 @@ def wait_for_element(
 
     Raises:
         DeviceConnectionError: Failed to connect to device
-        ValueError: Invalid timeout or poll_interval
+        ValueError: Invalid timeout or poll interval
     """
-    device_manager = get_device_manager()
-    snapshot_manager = get_snapshot_manager()
-    resolved_id = device_manager.resolve_device_id_or_default(device_id)
-    _validate_polling(timeout, poll_interval)
+    _validate_polling(timeout, poll_interval, initial_poll_interval)
 
     criteria = _build_element_criteria(
         text=text,
@@ -138,17 +179,19 @@ def wait_for_element(
         class_name=class_name,
         content_desc=content_desc,
     )
+    capture = _snapshot_if_changed(device_id)
 
     def check():
-        _capture_snapshot(device_id)
-        matches = snapshot_manager.find_elements(resolved_id, **criteria)
-        return matches[0] if matches else None
+        snapshot = capture()
+        if snapshot is None:
+            return None
+        return next(snapshot.iter_elements(**criteria), None)
 
-    found, element, waited = _poll_until(timeout, poll_interval, check)
+    found, element, waited = _poll_until(
+        timeout, poll_interval, check, initial_poll_interval
+    )
     if found and element is not None:
-        logger.info(
-            f"Element found after {waited:.2f}s: ref={element.ref}"
-        )
+        logger.info("Element found after %.2fs: ref=%s", waited, element.ref)
         return {
             "found": True,
             "ref": element.ref,
@@ -156,7 +199,7 @@ def wait_for_element(
             "waited": waited,
         }
 
-    logger.info(f"Element not found after {waited:.2f}s timeout")
+    logger.info("Element not found after %.2fs timeout", waited)
     return {
         "found": False,
         "ref": None,
@@ -171,6 +214,7 @@ def wait_for_text(
     partial: bool = False,
     timeout: float = 10.0,
     poll_interval: float = 0.5,
+    initial_poll_interval: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Wait for text to appear on screen.
 
@@ -181,7 +225,9 @@ def wait_for_text(
         device_id: Device serial (None for default)
         partial: If True, match partial text
         timeout: Maximum wait time in seconds
-        poll_interval: Time between checks
+        poll_interval: Time between checks (upper bound when backing off)
+        initial_poll_interval: First time between checks; grows toward
+            poll_interval on each miss (None for a fixed interval)
 
     Returns:
         Dictionary with found status and element info
@@ -192,6 +238,7 @@ def wait_for_text(
             text_contains=text,
             timeout=timeout,
             poll_interval=poll_interval,
+            initial_poll_interval=initial_poll_interval,
         )
     else:
         return wait_for_element(
@@ -199,9 +246,263 @@ def wait_for_text(
             text=text,
             timeout=timeout,
             poll_interval=poll_interval,
+            initial_poll_interval=initial_poll_interval,
         )
 
 
+# The tap's own ref errors keep their documented types
+@wrap_tool_errors(
+    logger,
+    "Tap and wait failed",
+    pass_through=(ValueError, RefNotFoundError, StaleRefError),
+)
+def device_tap_and_wait(
+    text: str,
+    ref: Optional[str] = None,
+    x: Optional[int] = None,
+    y: Optional[int] = None,
+    device_id: Optional[str] = None,
+    element: Optional[str] = None,
+    partial: bool = False,
+    timeout: float = 10.0,
+    poll_interval: float = 0.5,
+    initial_poll_interval: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Tap an element or coordinate, then wait for text to appear.
+
+    Combines device_tap and wait_for_text in one call, e.g. to open a screen
+    and block until its landmark text shows up.
+
+    Args:
+        text: Text to wait for after the tap
+        ref: Element ref ID to tap (e.g., "e5")
+        x: X coordinate (alternative to ref)
+        y: Y coordinate (alternative to ref)
+        device_id: Device serial (None for default/selected device)
+        element: Human-readable element description (for logging only)
+        partial: If True, match partial text
+        timeout: Maximum wait time in seconds
+        poll_interval: Time between checks (upper bound when backing off)
+        initial_poll_interval: First time between checks; grows toward
+            poll_interval on each miss (None for a fixed interval)
+
+    Returns:
+        Dictionary with the wait_for_text result (found, ref, element,
+        waited) plus:
+        - tap: The device_tap result
+
+    Raises:
+        ValueError: Invalid target, timeout or poll interval
+        RefNotFoundError: Ref not found in snapshot
+        StaleRefError: Snapshot is too old
+        DeviceConnectionError: Failed to connect to device
+    """
+    # Validate before tapping so a bad wait never leaves a half-done action
+    _validate_polling(timeout, poll_interval, initial_poll_interval)
+    tap = device_tap(ref=ref, x=x, y=y, device_id=device_id, element=element)
+    result = wait_for_text(
+        text,
+        device_id=device_id,
+        partial=partial,
+        timeout=timeout,
+        poll_interval=poll_interval,
+        initial_poll_interval=initial_poll_interval,
+    )
+    return {**result, "tap": tap}
+
+
+# Horizontal swipe direction -> whether the finger moves right-to-left
+_SWIPE_LEFTWARD = {"left": True, "right": False}
+
+
+@wrap_tool_errors(logger, "Swipe element failed", pass_through=(ValueError,))
+def swipe_element_and_check(
+    text: str,
+    direction: str = "left",
+    expect_text: Optional[str] = None,
+    partial: bool = True,
+    device_id: Optional[str] = None,
+    padding: int = 10,
+    duration: float = 0.3,
+    timeout: float = 6.0,
+    poll_interval: float = 0.5,
+    initial_poll_interval: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Swipe an element by its text horizontally and report what happened.
+
+    Finds the element with the given text, swipes across its bounds, then
+    polls until expect_text appears or the element is gone (or timeout).
+    Covers swipe-to-dismiss style interactions in a single call.
+
+    Args:
+        text: Exact text of the element to swipe
+        direction: "left" or "right"
+        expect_text: Text expected after the swipe (optional)
+        partial: If True, match expect_text partially
+        device_id: Device serial (None for default/selected device)
+        padding: Inset from the element edges in pixels
+        duration: Swipe duration in seconds
+        timeout: Maximum wait after the swipe in seconds
+        poll_interval: Time between checks (upper bound when backing off)
+        initial_poll_interval: First time between checks; grows toward
+            poll_interval on each miss (None for a fixed interval)
+
+    Returns:
+        Dictionary with:
+        - found_before: True if the element was on screen before the swipe
+        - expect_seen: True if expect_text appeared (None if not requested)
+        - found_after: True if the element is still on screen
+        - waited: Seconds waited after the swipe
+
+    Raises:
+        DeviceConnectionError: Failed to connect to device
+        ValueError: Invalid direction, timeout or poll interval
+    """
+    leftward = _SWIPE_LEFTWARD.get(direction.lower())
+    if leftward is None:
+        raise ValueError(f"Invalid direction: {direction}. Use 'left' or 'right'")
+    _validate_polling(timeout, poll_interval, initial_poll_interval)
+
+    resolved_id = get_device_manager().resolve_device_id_or_default(device_id)
+    target = next(_capture_snapshot(resolved_id).iter_elements(text=text), None)
+    if target is None:
+        return {
+            "found_before": False,
+            "expect_seen": None if expect_text is None else False,
+            "found_after": False,
+            "waited": 0.0,
+        }
+
+    left, top, right, bottom = target.bounds
+    y = (top + bottom) // 2
+    start_x, end_x = (right - padding, left + padding)
+    if not leftward:
+        start_x, end_x = end_x, start_x
+    with get_device_manager().get_device(resolved_id) as device:
+        device.swipe(start_x, y, end_x, y, duration=duration)
+    _expire_refs(resolved_id)
+    logger.info("Swiped %s on %r from (%s, %s) to (%s, %s)", direction, text, start_x, y, end_x, y)
+
+    expect_key = "text_contains" if partial else "text"
+    capture = _snapshot_if_changed(resolved_id)
+    state = {"expect_seen": None if expect_text is None else False, "found_after": True}
+
+    def check():
+        snapshot = capture()
+        if snapshot is None:
+            return None
+        state["found_after"] = next(snapshot.iter_elements(text=text), None) is not None
+        if expect_text is not None:
+            state["expect_seen"] = (
+                next(snapshot.iter_elements(**{expect_key: expect_text}), None) is not None
+            )
+        if state["expect_seen"] or not state["found_after"]:
+            return True
+        return None
+
+    _, _, waited = _poll_until(timeout, poll_interval, check, initial_poll_interval)
+    return {"found_before": True, **state, "waited": waited}
+
+
+def _compile_text_matcher(texts: List[str], partial: bool):
+    """Build a matcher returning the needle found in a node text, or None.
+
+    Partial matching compiles all needles into a single alternation so each
+    node text is scanned once regardless of how many needles are waited on.
+    Longer needles come first so the most specific one wins at a position.
+    """
+    if not partial:
+        needles = frozenset(texts)
+        return lambda node_text: node_text if node_text in needles else None
+
+    pattern = re.compile(
+        "|".join(re.escape(t) for t in sorted(set(texts), key=len, reverse=True))
+    )
+
+    def match(node_text: str) -> Optional[str]:
+        found = pattern.search(node_text)
+        return found.group(0) if found else None
+
+    return match
+
+
+@wrap_tool_errors(logger, "Wait for text failed", pass_through=(ValueError,))
+def wait_for_any_text(
+    texts: List[str],
+    device_id: Optional[str] = None,
+    partial: bool = False,
+    timeout: float = 10.0,
+    poll_interval: float = 0.5,
+    initial_poll_interval: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Wait for any of several texts to appear on screen.
+
+    Each snapshot is scanned once for all texts, so waiting on alternatives
+    (e.g. a dialog button or the screen behind it) costs a single poll loop.
+
+    Args:
+        texts: Texts to wait for
+        device_id: Device serial (None for default)
+        partial: If True, match partial text
+        timeout: Maximum wait time in seconds
+        poll_interval: Time between checks (upper bound when backing off)
+        initial_poll_interval: First time between checks; grows toward
+            poll_interval on each miss (None for a fixed interval)
+
+    Returns:
+        Dictionary with:
+        - found: True if any text was found
+        - text: The text that matched (one of texts)
+        - ref: Ref ID of the first matching element in hierarchy order
+        - element: Element info
+        - waited: Seconds waited
+
+    Raises:
+        DeviceConnectionError: Failed to connect to device
+        ValueError: Empty texts, invalid timeout or poll interval
+    """
+    if not texts or any(not t for t in texts):
+        raise ValueError("texts must be a non-empty list of non-empty strings")
+    _validate_polling(timeout, poll_interval, initial_poll_interval)
+    match = _compile_text_matcher(texts, partial)
+
+    capture = _snapshot_if_changed(device_id)
+
+    def check():
+        snapshot = capture()
+        if snapshot is None:
+            return None
+        for i, node_text in enumerate(snapshot.texts):
+            if node_text:
+                needle = match(node_text)
+                if needle is not None:
+                    return needle, snapshot.elements[i]
+        return None
+
+    found, payload, waited = _poll_until(
+        timeout, poll_interval, check, initial_poll_interval
+    )
+    if found and payload is not None:
+        needle, element = payload
+        logger.info("Text %r found after %.2fs: ref=%s", needle, waited, element.ref)
+        return {
+            "found": True,
+            "text": needle,
+            "ref": element.ref,
+            "element": element.to_dict(),
+            "waited": waited,
+        }
+
+    logger.info("None of %s texts found after %.2fs timeout", len(texts), waited)
+    return {
+        "found": False,
+        "text": None,
+        "ref": None,
+        "element": None,
+        "waited": waited,
+    }
+
+
 @wrap_tool_errors(logger, "Wait for activity failed", pass_through=(ValueError,))
 def wait_for_activity(
     activity: str,
@@ -209,6 +510,7 @@ def wait_for_activity(
     package: Optional[str] = None,
     timeout: float = 10.0,
     poll_interval: float = 0.5,
+    initial_poll_interval: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Wait for a specific activity to become active.
 
@@ -217,7 +519,9 @@ def wait_for_activity(
         device_id: Device serial (None for default)
         package: Optional package filter
         timeout: Maximum wait time in seconds
-        poll_interval: Time between checks
+        poll_interval: Time between checks (upper bound when backing off)
+        initial_poll_interval: First time between checks; grows toward
+            poll_interval on each miss (None for a fixed interval)
 
     Returns:
         Dictionary with:
@@ -228,10 +532,10 @@ def wait_for_activity(
 
     Raises:
         DeviceConnectionError: Failed to connect to device
-        ValueError: Invalid timeout or poll_interval
+        ValueError: Invalid timeout or poll interval
     """
     device_manager = get_device_manager()
-    _validate_polling(timeout, poll_interval)
+    _validate_polling(timeout, poll_interval, initial_poll_interval)
 
     def check():
         with device_manager.get_device(device_id) as device:
@@ -247,12 +551,16 @@ def wait_for_activity(
 
         return None
 
-    found, payload, waited = _poll_until(timeout, poll_interval, check)
+    found, payload, waited = _poll_until(
+        timeout, poll_interval, check, initial_poll_interval
+    )
     if found and payload is not None:
         current_package, current_activity = payload
         logger.info(
-            f"Activity found after {waited:.2f}s: "
-            f"{current_package}/{current_activity}"
+            "Activity found after %.2fs: %s/%s",
+            waited,
+            current_package,
+            current_activity,
         )
         return {
             "found": True,
@@ -261,7 +569,7 @@ def wait_for_activity(
             "waited": waited,
         }
 
-    logger.info(f"Activity not found after {waited:.2f}s timeout")
+    logger.info("Activity not found after %.2fs timeout", waited)
     return {
         "found": False,
         "package": None,
@@ -278,6 +586,7 @@ def wait_for_element_gone(
     resource_id: Optional[str] = None,
     timeout: float = 10.0,
     poll_interval: float = 0.5,
+    initial_poll_interval: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Wait for an element to disappear.
 
@@ -287,7 +596,9 @@ def wait_for_element_gone(
         text_contains: Partial text match
         resource_id: Exact resource ID
         timeout: Maximum wait time in seconds
-        poll_interval: Time between checks
+        poll_interval: Time between checks (upper bound when backing off)
+        initial_poll_interval: First time between checks; grows toward
+            poll_interval on each miss (None for a fixed interval)
 
     Returns:
         Dictionary with:
@@ -296,33 +607,34 @@ def wait_for_element_gone(
 
     Raises:
         DeviceConnectionError: Failed to connect to device
-        ValueError: Invalid timeout or poll_interval
+        ValueError: Invalid timeout or poll interval
     """
-    device_manager = get_device_manager()
-    snapshot_manager = get_snapshot_manager()
-    resolved_id = device_manager.resolve_device_id_or_default(device_id)
-    _validate_polling(timeout, poll_interval)
+    _validate_polling(timeout, poll_interval, initial_poll_interval)
 
     criteria = _build_element_criteria(
         text=text,
         text_contains=text_contains,
         resource_id=resource_id,
     )
+    capture = _snapshot_if_changed(device_id)
 
     def check():
-        _capture_snapshot(device_id)
-        matches = snapshot_manager.find_elements(resolved_id, **criteria)
-        return True if not matches else None
+        snapshot = capture()
+        if snapshot is None:
+            return None
+        return True if next(snapshot.iter_elements(**criteria), None) is None else None
 
-    found, _, waited = _poll_until(timeout, poll_interval, check)
+    found, _, waited = _poll_until(
+        timeout, poll_interval, check, initial_poll_interval
+    )
     if found:
-        logger.info(f"Element gone after {waited:.2f}s")
+        logger.info("Element gone after %.2fs", waited)
         return {
             "gone": True,
             "waited": waited,
         }
 
-    logger.info(f"Element still present after {waited:.2f}s timeout")
+    logger.info("Element still present after %.2fs timeout", waited)
     return {
         "gone": False,
         "waited": waited,
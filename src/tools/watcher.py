@@ -122,7 +122,7 @@ class WatcherManager:
                 self._watchers[device_id] = {}
             self._watchers[device_id][name] = rule
 
-        logger.info(f"Added watcher '{name}' for device '{device_id}'")
+        logger.info("Added watcher '%s' for device '%s'", name, device_id)
         return rule
 
     def remove_watcher(self, device_id: str, name: str) -> bool:
@@ -134,7 +134,7 @@ class WatcherManager:
         with self._lock:
             if device_id in self._watchers and name in self._watchers[device_id]:
                 del self._watchers[device_id][name]
-                logger.info(f"Removed watcher '{name}' from device '{device_id}'")
+                logger.info("Removed watcher '%s' from device '%s'", name, device_id)
                 return True
         return False
 
@@ -215,19 +215,19 @@ class WatcherManager:
                             rule.trigger_count += 1
                             rule.last_triggered = time.time()
 
-                        logger.info(f"Watcher '{rule.name}' triggered on device '{device_id}'")
+                        logger.info("Watcher '%s' triggered on device '%s'", rule.name, device_id)
                         return rule.name
 
         except DeviceConnectionError:
-            logger.warning(f"Device disconnected during watcher check: {device_id}")
+            logger.warning("Device disconnected during watcher check: %s", device_id)
         except Exception as e:
-            logger.error(f"Watcher check failed: {e}")
+            logger.error("Watcher check failed: %s", e)
 
         return None
 
     def _watcher_loop(self, device_id: str, poll_interval: float):
         """Background loop that checks watchers."""
-        logger.info(f"Watcher loop started for device '{device_id}'")
+        logger.info("Watcher loop started for device '%s'", device_id)
         consecutive_errors = 0
         max_consecutive_errors = 10
 
@@ -236,16 +236,20 @@ class WatcherManager:
                 self._check_and_trigger(device_id)
                 consecutive_errors = 0  # Reset on success
             except DeviceConnectionError:
-                logger.warning(f"Device disconnected, stopping watcher: {device_id}")
+                logger.warning("Device disconnected, stopping watcher: %s", device_id)
                 break
             except Exception as e:
                 consecutive_errors += 1
                 logger.error(
-                    f"Watcher error ({consecutive_errors}/{max_consecutive_errors}): {e}"
+                    "Watcher error (%s/%s): %s",
+                    consecutive_errors,
+                    max_consecutive_errors,
+                    e,
                 )
                 if consecutive_errors >= max_consecutive_errors:
                     logger.critical(
-                        f"Too many consecutive errors, stopping watcher: {device_id}"
+                        "Too many consecutive errors, stopping watcher: %s",
+                        device_id,
                     )
                     break
 
@@ -254,7 +258,7 @@ class WatcherManager:
         # Cleanup on exit
         with self._lock:
             self._running[device_id] = False
-        logger.info(f"Watcher loop stopped for device '{device_id}'")
+        logger.info("Watcher loop stopped for device '%s'", device_id)
 
     def start(self, device_id: str, poll_interval: float = 1.0) -> bool:
         """Start watcher monitoring for a device.
@@ -283,7 +287,7 @@ class WatcherManager:
             self._threads[device_id] = thread
             thread.start()
 
-        logger.info(f"Watcher monitoring started for device '{device_id}'")
+        logger.info("Watcher monitoring started for device '%s'", device_id)
         return True
 
     def stop(self, device_id: str) -> Dict[str, Any]:
@@ -316,7 +320,7 @@ class WatcherManager:
                 ],
             }
 
-        logger.info(f"Watcher monitoring stopped for device '{device_id}'")
+        logger.info("Watcher monitoring stopped for device '%s'", device_id)
         return summary
 
     def is_running(self, device_id: str) -> bool:
@@ -340,6 +344,9 @@ _manager_lock = threading.Lock()
 def get_watcher_manager() -> WatcherManager:
     """Get the global WatcherManager instance."""
     global _watcher_manager
+    instance = _watcher_manager
+    if instance is not None:
+        return instance
     with _manager_lock:
         if _watcher_manager is None:
             _watcher_manager = WatcherManager()
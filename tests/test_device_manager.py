@@ -1,6 +1,20 @@
+import asyncio
+import logging
+import socket
+import sys
+import threading
+
 import pytest
 
-from src.core.device_manager import DeviceManager, DeviceInfo
+from src.core.device_manager import (
+    ADB_SERVER_PORT,
+    DeviceManager,
+    DeviceInfo,
+    _AdbProtocolError,
+    _adb_server_port,
+    _adb_socket_request,
+    _parse_device_lines,
+)
 from src.core.exceptions import MultipleDevicesError
 
 
@@ -49,3 +63,183 @@ def test_get_device_uses_single_device_serial(monkeypatch):
         assert device.info == {}
 
     assert called["device_id"] == "emulator-5554"
+
+
+def test_device_session_reuses_handle_for_nested_get_device(monkeypatch):
+    manager = DeviceManager()
+    connects = []
+    monkeypatch.setattr(
+        "src.core.device_manager.u2.connect",
+        lambda device_id: connects.append(device_id) or DummyDevice(),
+    )
+
+    with manager.device_session("emulator-5554") as session_device:
+        monkeypatch.setattr(
+            manager, "_resolve_device_id_with_policy",
+            lambda device_id: pytest.fail("session should skip resolution"),
+        )
+        with manager.get_device() as default_device:
+            pass
+        with manager.get_device("emulator-5554") as same_device:
+            pass
+        assert manager.resolve_device_id_or_default(None) == "emulator-5554"
+        monkeypatch.undo()
+
+    assert default_device is same_device is session_device
+    assert connects == ["emulator-5554"]
+
+
+def test_aget_device_yields_cached_device(monkeypatch):
+    manager = DeviceManager()
+    monkeypatch.setattr("src.core.device_manager.u2.connect", lambda device_id: DummyDevice())
+
+    async def use_twice():
+        async with manager.aget_device("emulator-5554") as first:
+            pass
+        async with manager.aget_device("emulator-5554") as second:
+            pass
+        return first, second
+
+    first, second = asyncio.run(use_twice())
+
+    assert first is second
+
+
+def test_get_device_evicts_least_recently_used(monkeypatch):
+    manager = DeviceManager()
+    monkeypatch.setattr("src.core.device_manager.MAX_CACHED_DEVICES", 2)
+    monkeypatch.setattr("src.core.device_manager.u2.connect", lambda device_id: DummyDevice())
+
+    for serial in ("device-1", "device-2", "device-1", "device-3"):
+        with manager.get_device(serial):
+            pass
+
+    assert list(manager._cache) == ["device-1", "device-3"]
+
+
+def test_cleanup_expired_cache_stops_at_first_live_entry(monkeypatch):
+    manager = DeviceManager()
+    monkeypatch.setattr("src.core.device_manager.u2.connect", lambda device_id: DummyDevice())
+    for serial in ("device-1", "device-2"):
+        with manager.get_device(serial):
+            pass
+    manager._cache["device-1"].last_used -= 10_000
+
+    with manager._cache_lock:
+        manager._cleanup_expired_cache()
+
+    assert list(manager._cache) == ["device-2"]
+
+
+def test_list_devices_queries_adb_server_socket(monkeypatch):
+    payload = (
+        b"emulator-5554          device product:sdk model:Pixel_7 transport_id:1\n"
+        b"R58M123456             unauthorized transport_id:2\n"
+    )
+    server = socket.create_server(("127.0.0.1", 0))
+    requests = []
+
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            length = int(conn.recv(4), 16)
+            requests.append(conn.recv(length))
+            conn.sendall(b"OKAY" + b"%04x" % len(payload) + payload)
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    monkeypatch.setenv("ANDROID_ADB_SERVER_PORT", str(server.getsockname()[1]))
+    monkeypatch.setattr(
+        "src.core.device_manager.subprocess.run",
+        lambda *args, **kwargs: pytest.fail("adb CLI should not run"),
+    )
+    try:
+        devices = DeviceManager().list_devices()
+    finally:
+        thread.join(timeout=5)
+        server.close()
+
+    assert requests == [b"host:devices-l"]
+    assert devices == [
+        DeviceInfo(serial="emulator-5554", state="device", model="Pixel_7",
+                   product="sdk", transport_id="1"),
+        DeviceInfo(serial="R58M123456", state="unauthorized", transport_id="2"),
+    ]
+
+
+@pytest.mark.parametrize("value", ["abc", "", "0", "70000"])
+def test_adb_server_port_ignores_invalid_override(monkeypatch, caplog, value):
+    monkeypatch.setenv("ANDROID_ADB_SERVER_PORT", value)
+
+    with caplog.at_level(logging.WARNING, logger="src.core.device_manager"):
+        port = _adb_server_port()
+
+    assert port == ADB_SERVER_PORT
+    assert "ANDROID_ADB_SERVER_PORT" in caplog.text
+
+
+def test_adb_socket_request_rejects_malformed_length(monkeypatch):
+    server = socket.create_server(("127.0.0.1", 0))
+
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            conn.recv(64)
+            conn.sendall(b"OKAYzzzz")
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    monkeypatch.setenv("ANDROID_ADB_SERVER_PORT", str(server.getsockname()[1]))
+    try:
+        with pytest.raises(_AdbProtocolError, match="bad length prefix"):
+            _adb_socket_request("host:devices-l")
+    finally:
+        thread.join(timeout=5)
+        server.close()
+
+
+def test_list_devices_falls_back_to_adb_cli(monkeypatch):
+    def unreachable(command):
+        raise ConnectionRefusedError
+
+    class Result:
+        stdout = "List of devices attached\nemulator-5554 device model:Pixel_7\n"
+
+    monkeypatch.setattr("src.core.device_manager._adb_socket_request", unreachable)
+    monkeypatch.setattr("src.core.device_manager.subprocess.run", lambda *a, **k: Result())
+
+    devices = DeviceManager().list_devices()
+
+    assert devices == [DeviceInfo(serial="emulator-5554", state="device", model="Pixel_7")]
+
+
+def test_parse_device_lines_interns_repeated_values():
+    lines = ["emulator-5554 device model:Pixel_7", "emulator-5556 device model:Pixel_7"]
+
+    first, second = _parse_device_lines(lines)
+
+    assert first.state is second.state is sys.intern("device")
+    assert first.model is second.model
+
+
+def test_get_device_skips_ping_within_ttl(monkeypatch):
+    pings = []
+
+    class CountingDevice:
+        @property
+        def info(self):
+            pings.append(1)
+            return {}
+
+    manager = DeviceManager()
+    monkeypatch.setattr("src.core.device_manager.u2.connect", lambda device_id: CountingDevice())
+
+    for _ in range(3):
+        with manager.get_device("device-1"):
+            pass
+    assert len(pings) == 1
+
+    manager._cache["device-1"].last_ping -= 10
+    with manager.get_device("device-1"):
+        pass
+    assert len(pings) == 2
@@ -0,0 +1,197 @@
+"""Tests for device information tools."""
+import contextlib
+import sys
+
+import pytest
+
+import src.tools  # noqa: F401  (loads src.tools.device)
+from uiautomator2.abstract import ShellResponse
+
+device_tools = sys.modules["src.tools.device"]
+
+
+@pytest.fixture(autouse=True)
+def _clear_static_info_cache():
+    device_tools._STATIC_INFO_CACHE.clear()
+    yield
+    device_tools._STATIC_INFO_CACHE.clear()
+
+BATTERY_DUMP = """Current Battery Service state:
+  AC powered: false
+  USB powered: true
+  status: 2
+  health: 2
+  level: 85
+  scale: 100
+"""
+
+
+def test_parse_battery_reads_level_and_status():
+    assert device_tools._parse_battery(BATTERY_DUMP) == {"level": 85, "status": "2"}
+
+
+def test_parse_battery_accepts_shell_response():
+    response = ShellResponse(output=BATTERY_DUMP, exit_code=0)
+
+    assert device_tools._parse_battery(response) == {"level": 85, "status": "2"}
+
+
+def test_parse_battery_without_level_is_none():
+    assert device_tools._parse_battery("Can't find service: battery\n") is None
+
+
+def test_parse_battery_with_non_numeric_level_is_none():
+    assert device_tools._parse_battery("  level: unknown\n  status: 2\n") is None
+
+
+class _InfoDevice:
+    serial = "emulator-5554"
+
+    def __init__(self):
+        self.calls = []
+
+    @property
+    def info(self):
+        self.calls.append("info")
+        return {"sdkInt": 34, "platformVersion": "14", "screenOn": True}
+
+    def window_size(self):
+        self.calls.append("window_size")
+        return (1080, 2400)
+
+    def shell(self, command):
+        self.calls.append("shell")
+        outputs = {
+            "wm size": "Physical size: 1080x2400\n",
+            "dumpsys display": "  mCurrentOrientation=0 orientation=0\n",
+            "dumpsys window": "  mCurrentFocus=Window{1a2b u0 com.app/.Main}\n",
+            "dumpsys battery": BATTERY_DUMP,
+        }
+        return "---SECTION---\n".join(
+            "".join(text for prefix, text in outputs.items() if prefix in part)
+            for part in command.split("; echo ---SECTION---; ")
+        )
+
+    def app_current(self):
+        self.calls.append("app_current")
+        return {"package": "com.app", "activity": ".Main"}
+
+
+class _FakeDeviceManager:
+    def __init__(self, device):
+        self.device = device
+
+    @contextlib.contextmanager
+    def get_device(self, device_id=None):
+        yield self.device
+
+
+def test_device_info_fetches_only_requested_fields(monkeypatch):
+    device = _InfoDevice()
+    monkeypatch.setattr(device_tools, "_DEVICE_MANAGER", _FakeDeviceManager(device))
+
+    result = device_tools.device_info(fields=["screen_size", "sdk_version"])
+
+    assert result == {"sdk_version": 34, "screen_size": {"width": 1080, "height": 2400}}
+    assert sorted(device.calls) == ["info", "shell"]
+
+
+def test_device_info_reads_shell_fields_in_one_call(monkeypatch):
+    device = _InfoDevice()
+    monkeypatch.setattr(device_tools, "_DEVICE_MANAGER", _FakeDeviceManager(device))
+
+    result = device_tools.device_info(fields=["screen_size", "current_app", "battery"])
+
+    assert result == {
+        "screen_size": {"width": 1080, "height": 2400},
+        "battery": {"level": 85, "status": "2"},
+        "current_app": {"package": "com.app", "activity": ".Main"},
+    }
+    assert device.calls == ["shell"]
+
+
+def test_device_info_shell_falls_back_to_uiautomator2(monkeypatch):
+    device = _InfoDevice()
+    device.shell = lambda command: ShellResponse("", 1)
+    monkeypatch.setattr(device_tools, "_DEVICE_MANAGER", _FakeDeviceManager(device))
+
+    result = device_tools.device_info(fields=["screen_size", "current_app", "battery"])
+
+    assert result["screen_size"] == {"width": 1080, "height": 2400}
+    assert result["current_app"] == {"package": "com.app", "activity": ".Main"}
+    assert result["battery"] is None
+
+
+def test_parse_screen_size_swaps_for_landscape():
+    output = "Physical size: 1080x2400\nOverride size: 720x1600\n  orientation=1\n"
+
+    assert device_tools._parse_screen_size(output) == {"width": 1600, "height": 720}
+
+
+def test_device_info_defaults_to_all_fields(monkeypatch):
+    device = _InfoDevice()
+    monkeypatch.setattr(device_tools, "_DEVICE_MANAGER", _FakeDeviceManager(device))
+
+    result = device_tools.device_info()
+
+    assert list(result) == list(device_tools._DEVICE_INFO_FIELDS)
+    assert result["battery"] == {"level": 85, "status": "2"}
+
+
+def test_device_info_stream_yields_each_field_once(monkeypatch):
+    monkeypatch.setattr(device_tools, "_DEVICE_MANAGER", _FakeDeviceManager(_InfoDevice()))
+
+    pairs = list(device_tools.device_info_stream(fields=["battery", "current_app", "serial"]))
+
+    assert sorted(name for name, _ in pairs) == ["battery", "current_app", "serial"]
+    assert dict(pairs)["current_app"] == {"package": "com.app", "activity": ".Main"}
+
+
+def test_device_info_rejects_unknown_fields(monkeypatch):
+    monkeypatch.setattr(device_tools, "_DEVICE_MANAGER", _FakeDeviceManager(_InfoDevice()))
+
+    with pytest.raises(ValueError, match="batery"):
+        device_tools.device_info(fields=["batery"])
+
+
+def test_device_info_caches_static_metadata(monkeypatch):
+    device = _InfoDevice()
+    monkeypatch.setattr(device_tools, "_DEVICE_MANAGER", _FakeDeviceManager(device))
+
+    first = device_tools.device_info(fields=["sdk_version", "screen_on"])
+    second = device_tools.device_info(fields=["sdk_version", "android_version"])
+
+    assert first == {"sdk_version": 34, "screen_on": True}
+    assert second == {"sdk_version": 34, "android_version": "14"}
+    assert device.calls == ["info"]
+
+
+def test_device_info_rereads_display_density(monkeypatch):
+    device = _InfoDevice()
+    monkeypatch.setattr(device_tools, "_DEVICE_MANAGER", _FakeDeviceManager(device))
+
+    device_tools.device_info(fields=["display_density"])
+    device_tools.device_info(fields=["display_density"])
+
+    assert device.calls == ["info", "info"]
+
+
+def test_device_list_counts_available_devices(monkeypatch):
+    class _ListingManager:
+        def list_devices(self):
+            return [
+                device_tools.DeviceInfo(serial="a", state="device"),
+                device_tools.DeviceInfo(serial="b", state="unauthorized"),
+                device_tools.DeviceInfo(serial="c", state="device"),
+            ]
+
+        def get_selected_device(self):
+            return "a"
+
+    monkeypatch.setattr(device_tools, "_DEVICE_MANAGER", _ListingManager())
+
+    result = device_tools.device_list()
+
+    assert result["count"] == 3
+    assert result["available_count"] == 2
+    assert [d["available"] for d in result["devices"]] == [True, False, True]
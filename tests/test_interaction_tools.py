@@ -0,0 +1,387 @@
+"""Tests for interaction tool result shaping."""
+import asyncio
+import contextlib
+import sys
+
+import pytest
+
+import src.tools  # noqa: F401  (loads src.tools.interaction)
+from src.core import RefNotFoundError, SnapshotManager
+from uiautomator2.abstract import ShellResponse
+
+interaction = sys.modules["src.tools.interaction"]
+
+
+class _FakeDevice:
+    def __init__(self):
+        self.clicks = []
+
+    def click(self, x, y):
+        self.clicks.append((x, y))
+
+
+class _FakeDeviceManager:
+    def __init__(self, device):
+        self.device = device
+
+    def resolve_device_id_or_default(self, device_id):
+        return device_id or "default"
+
+    @contextlib.contextmanager
+    def get_device(self, device_id=None):
+        yield self.device
+
+
+def test_device_tap_skips_snapshot_by_default(monkeypatch):
+    device = _FakeDevice()
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _FakeDeviceManager(device))
+
+    def _fail(device_id):
+        raise AssertionError("snapshot should not be captured")
+
+    monkeypatch.setattr(interaction, "_capture_snapshot", _fail)
+
+    result = interaction.device_tap(x=10, y=20)
+
+    assert device.clicks == [(10, 20)]
+    assert "snapshot" not in result
+
+
+def test_device_tap_returns_snapshot_on_request(monkeypatch):
+    device = _FakeDevice()
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _FakeDeviceManager(device))
+
+    class _Snapshot:
+        def to_dict(self):
+            return {"snapshot_id": "s1"}
+
+    monkeypatch.setattr(interaction, "_capture_snapshot", lambda device_id: _Snapshot())
+
+    result = interaction.device_tap(x=10, y=20, return_snapshot=True)
+
+    assert result["snapshot"] == {"snapshot_id": "s1"}
+
+
+def test_scroll_to_top_flings_only_when_scrollable(monkeypatch):
+    flings = []
+
+    class _Fling:
+        vert = property(lambda self: self)
+
+        def toBeginning(self, max_swipes):
+            flings.append(max_swipes)
+
+    class _Selector:
+        def __init__(self, exists):
+            self.exists = exists
+            self.fling = _Fling()
+
+    class _ScrollDevice:
+        def __init__(self, exists):
+            self.exists = exists
+
+        def __call__(self, **selector):
+            assert selector == {"scrollable": True}
+            return _Selector(self.exists)
+
+    monkeypatch.setattr(
+        interaction, "get_device_manager", lambda: _FakeDeviceManager(_ScrollDevice(True))
+    )
+    assert interaction.scroll_to_top(max_swipes=5)["scrolled"] is True
+    assert flings == [5]
+
+    monkeypatch.setattr(
+        interaction, "get_device_manager", lambda: _FakeDeviceManager(_ScrollDevice(False))
+    )
+    assert interaction.scroll_to_top()["scrolled"] is False
+    assert flings == [5]
+
+
+def test_device_tap_many_resolves_all_targets_before_tapping(monkeypatch):
+    device = _FakeDevice()
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _FakeDeviceManager(device))
+    monkeypatch.setattr(interaction.time, "sleep", lambda seconds: None)
+
+    result = interaction.device_tap_many([{"x": 1, "y": 2}, {"x": 3, "y": 4}])
+
+    assert device.clicks == [(1, 2), (3, 4)]
+    assert result["count"] == 2
+
+    with pytest.raises(ValueError):
+        interaction.device_tap_many([{"x": 5, "y": 6}, {"element": "no target"}])
+    assert device.clicks == [(1, 2), (3, 4)]
+
+
+def test_device_batch_sends_one_shell_command(monkeypatch):
+    commands = []
+
+    class _ShellDevice:
+        def shell(self, command):
+            commands.append(command)
+            return ShellResponse("", 0)
+
+    monkeypatch.setattr(
+        interaction, "get_device_manager", lambda: _FakeDeviceManager(_ShellDevice())
+    )
+
+    result = interaction.device_batch([
+        {"action": "tap", "x": 10, "y": 20},
+        {"action": "long_press", "x": 5, "y": 6, "duration": 0.8},
+        {"action": "wait", "seconds": 0.25},
+        {"action": "swipe", "start_x": 1, "start_y": 2, "end_x": 3, "end_y": 4},
+        {"action": "key", "key": "back"},
+        {"action": "key", "key": "66"},
+    ])
+
+    assert result == {"success": True, "count": 6}
+    assert commands == [
+        "input tap 10 20 && input swipe 5 6 5 6 800 && sleep 0.25"
+        " && input swipe 1 2 3 4 500 && input keyevent KEYCODE_BACK && input keyevent 66"
+    ]
+
+
+def test_device_batch_rejects_bad_actions_before_running(monkeypatch):
+    class _NoShellDevice:
+        def shell(self, command):
+            raise AssertionError("nothing should run")
+
+    monkeypatch.setattr(
+        interaction, "get_device_manager", lambda: _FakeDeviceManager(_NoShellDevice())
+    )
+
+    with pytest.raises(ValueError):
+        interaction.device_batch([{"action": "tap", "x": 1, "y": 2}, {"action": "fly"}])
+    with pytest.raises(ValueError):
+        interaction.device_batch([{"action": "key", "key": "back; reboot"}])
+    with pytest.raises(ValueError):
+        interaction.device_batch([{"action": "tap", "x": "1; reboot", "y": 2}])
+
+
+def test_device_batch_reports_failing_command(monkeypatch):
+    class _FailingDevice:
+        def shell(self, command):
+            return ShellResponse("Error: Unknown command\n", 1)
+
+    monkeypatch.setattr(
+        interaction, "get_device_manager", lambda: _FakeDeviceManager(_FailingDevice())
+    )
+
+    with pytest.raises(RuntimeError, match="exited with 1: Error: Unknown command"):
+        interaction.device_batch([{"action": "key", "key": "back"}])
+
+
+def test_wait_for_focus_returns_once_target_is_focused(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(interaction.time, "sleep", sleeps.append)
+
+    class _Focused:
+        def __init__(self, device):
+            self.device = device
+
+        @property
+        def info(self):
+            self.device.polls += 1
+            if self.device.polls < 3:
+                return {"bounds": {"left": 0, "top": 0, "right": 10, "bottom": 10}}
+            return {"bounds": {"left": 50, "top": 300, "right": 1030, "bottom": 400}}
+
+    class _FocusDevice:
+        polls = 0
+
+        def __call__(self, **selector):
+            assert selector == {"focused": True}
+            return _Focused(self)
+
+    device = _FocusDevice()
+
+    assert interaction._wait_for_focus(device, (540, 350)) is True
+    assert device.polls == 3
+    assert sleeps == [interaction._FOCUS_POLL_INTERVAL] * 2
+
+
+def test_device_swipe_direction_reuses_window_size(monkeypatch):
+    monkeypatch.setattr(interaction, "_WINDOW_SIZES", {})
+
+    class _SwipeDevice:
+        def __init__(self):
+            self.size_reads = 0
+            self.swipes = []
+
+        def window_size(self):
+            self.size_reads += 1
+            return (1080, 2400)
+
+        def swipe(self, sx, sy, ex, ey, duration):
+            self.swipes.append((sx, sy, ex, ey))
+
+    device = _SwipeDevice()
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _FakeDeviceManager(device))
+
+    interaction.device_swipe(direction="up")
+    interaction.device_swipe(direction="Left")
+
+    assert device.swipes == [(540, 1560, 540, 840), (900, 1200, 180, 1200)]
+    assert device.size_reads == 1
+
+    interaction._invalidate_window_size("default")
+    interaction.device_swipe(direction="down")
+    assert device.size_reads == 2
+
+    with pytest.raises(ValueError):
+        interaction.device_swipe(direction="sideways")
+
+
+class _TypingDevice:
+    def __init__(self):
+        self.shell_commands = []
+        self.sent = []
+
+    def shell(self, command):
+        self.shell_commands.append(command)
+        return ShellResponse("", 0)
+
+    def send_keys(self, text):
+        self.sent.append(text)
+
+
+def test_device_type_fast_path_uses_one_shell_call(monkeypatch):
+    device = _TypingDevice()
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _FakeDeviceManager(device))
+
+    interaction.device_type("it's me", submit=True, fast_path=True)
+
+    assert device.shell_commands == [
+        "input text 'it'\"'\"'s%sme' && input keyevent KEYCODE_ENTER"
+    ]
+    assert device.sent == []
+
+
+@pytest.mark.parametrize("text", ["héllo", "100%", ""])
+def test_device_type_fast_path_falls_back_for_untypable_text(monkeypatch, text):
+    device = _TypingDevice()
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _FakeDeviceManager(device))
+
+    interaction.device_type(text, fast_path=True)
+
+    assert device.shell_commands == []
+    assert device.sent == [text]
+
+
+def test_async_variants_drive_devices_concurrently(monkeypatch):
+    devices = {"a": _FakeDevice(), "b": _FakeDevice()}
+
+    class _PerDeviceManager(_FakeDeviceManager):
+        @contextlib.contextmanager
+        def get_device(self, device_id=None):
+            yield devices[device_id]
+
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _PerDeviceManager(None))
+
+    async def fan_out():
+        return await asyncio.gather(
+            interaction.device_tap_async(x=1, y=2, device_id="a"),
+            interaction.device_tap_async(x=3, y=4, device_id="b"),
+        )
+
+    results = asyncio.run(fan_out())
+
+    assert [result["position"] for result in results] == [{"x": 1, "y": 2}, {"x": 3, "y": 4}]
+    assert devices["a"].clicks == [(1, 2)]
+    assert devices["b"].clicks == [(3, 4)]
+    assert interaction.device_tap_async.__name__ == "device_tap_async"
+
+
+def test_device_tap_allow_stale_uses_aged_snapshot(monkeypatch):
+    device = _FakeDevice()
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _FakeDeviceManager(device))
+
+    class _AgedSnapshots:
+        def get_positions(self, device_id, refs, max_stale_seconds=None):
+            if max_stale_seconds is None:
+                raise interaction.StaleRefError(refs[0], 45.0)
+            return [(150, 125)] * len(refs)
+
+        def expire_current(self, device_id):
+            pass
+
+    monkeypatch.setattr(interaction, "get_snapshot_manager", lambda: _AgedSnapshots())
+
+    with pytest.raises(interaction.StaleRefError):
+        interaction.device_tap(ref="e0")
+
+    result = interaction.device_tap(ref="e0", allow_stale=True)
+
+    assert device.clicks == [(150, 125)]
+    assert result["stale_ref"] is True
+
+
+def test_coordinate_taps_skip_the_snapshot_manager(monkeypatch):
+    device = _FakeDevice()
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _FakeDeviceManager(device))
+
+    class _NoLookups:
+        def __init__(self):
+            self.expired = []
+
+        def get_positions(self, device_id, refs, max_stale_seconds=None):
+            pytest.fail("no snapshot lookup expected")
+
+        def expire_current(self, device_id):
+            self.expired.append(device_id)
+
+    snapshots = _NoLookups()
+    monkeypatch.setattr(interaction, "get_snapshot_manager", lambda: snapshots)
+    monkeypatch.setattr(interaction.time, "sleep", lambda seconds: None)
+
+    interaction.device_tap(x=7, y=8)
+    interaction.device_tap_many([{"x": 1, "y": 2}])
+
+    assert device.clicks == [(7, 8), (1, 2)]
+    assert snapshots.expired == ["default", "default"]
+
+
+_ONE_BUTTON_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<hierarchy rotation="0">
+  <node index="0" text="OK" class="android.widget.Button" bounds="[0,0][20,40]" clickable="true" enabled="true" />
+</hierarchy>
+"""
+
+
+def test_ref_tap_after_an_action_needs_a_new_snapshot(monkeypatch):
+    device = _FakeDevice()
+    monkeypatch.setattr(interaction, "get_device_manager", lambda: _FakeDeviceManager(device))
+    snapshots = SnapshotManager()
+    snapshots.create_snapshot("default", _ONE_BUTTON_XML, "com.app", ".Main", (1080, 2400))
+    monkeypatch.setattr(interaction, "get_snapshot_manager", lambda: snapshots)
+
+    def _fail(device_id):
+        raise AssertionError("no implicit re-capture expected")
+
+    monkeypatch.setattr(interaction, "_capture_snapshot", _fail)
+
+    interaction.device_tap(ref="e0")
+    with pytest.raises(RefNotFoundError):
+        interaction.device_tap(ref="e0")
+
+    assert device.clicks == [(10, 20)]
+
+
+def test_device_swipe_accepts_direction_enum(monkeypatch):
+    monkeypatch.setattr(interaction, "_WINDOW_SIZES", {})
+    swipes = []
+
+    class _SwipeDevice:
+        def window_size(self):
+            return (1080, 2400)
+
+        def swipe(self, sx, sy, ex, ey, duration):
+            swipes.append((sx, sy, ex, ey))
+
+    monkeypatch.setattr(
+        interaction, "get_device_manager", lambda: _FakeDeviceManager(_SwipeDevice())
+    )
+
+    interaction.device_swipe(direction=interaction.SwipeDirection.UP)
+    interaction.device_swipe(direction="UP")
+
+    assert swipes == [(540, 1560, 540, 840)] * 2
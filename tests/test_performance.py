@@ -0,0 +1,262 @@
+"""Tests for performance metric collection."""
+import shutil
+import sys
+
+import pytest
+
+import src.tools  # noqa: F401  (loads src.tools.performance)
+from uiautomator2.abstract import ShellResponse
+
+performance = sys.modules["src.tools.performance"]
+
+
+class _MetricsDevice:
+    def __init__(self):
+        self.commands = []
+
+    def shell(self, command):
+        self.commands.append(command)
+        if "--latency-clear" in command:
+            return ShellResponse("", 0)
+        return ShellResponse(
+            "__METRICS_cpu__\n"
+            " 1234 u0_a1 10 -10 2.1G 150M 80M S 12.5 3.4 0:01.23 com.app\n"
+            "__METRICS_meminfo__\n"
+            "          TOTAL:    204800\n"
+            "__METRICS_battery__\n"
+            "  level: 87\n"
+            "  temperature: 312\n"
+            "__METRICS_network__\n"
+            "    lo: 100 1 0 0 0 0 0 0 100 1\n"
+            "  wlan0: 5000 10 0 0 0 0 0 0 700 5\n"
+            "__METRICS_fps__\n"
+            "16666666\n"
+            "1 2 3\n"
+            "4 5 6\n",
+            0,
+        )
+
+
+def test_metrics_snapshot_uses_one_shell_call_after_clearing_frames(monkeypatch):
+    device = _MetricsDevice()
+    monkeypatch.setattr(performance.time, "sleep", lambda seconds: None)
+
+    snapshot = performance.PerformanceSnapshot(timestamp=0.0)
+    performance._populate_metrics(snapshot, device, "com.app")
+
+    assert len(device.commands) == 2
+    assert "--latency-clear" in device.commands[0]
+    assert snapshot.cpu_percent == 12.5
+    assert snapshot.memory_percent == 3.4
+    assert snapshot.memory_mb == 200.0
+    assert snapshot.battery_level == 87
+    assert snapshot.battery_temperature == 31.2
+    assert (snapshot.network_rx_bytes, snapshot.network_tx_bytes) == (5000, 700)
+    assert snapshot.fps == 4
+
+
+def test_monitor_loop_sleeps_to_fixed_ticks(monkeypatch):
+    clock = {"now": 100.0}
+    sleeps = []
+    collection_costs = iter([0.3, 0.2, 2.5, 0.1])
+    monitor = performance.PerformanceMonitor()
+    monitor._sessions["s"] = performance.MonitoringSession(
+        session_id="s", device_id="device", package="com.app", start_time=0.0, poll_interval=1.0
+    )
+    monitor._running["s"] = True
+
+    calls = []
+
+    def collect(device_id, package, measure_fps, cpu_start, shell):
+        calls.append((measure_fps, cpu_start and cpu_start[0]))
+        try:
+            clock["now"] += next(collection_costs)
+        except StopIteration:
+            monitor._running["s"] = False
+        snapshot = performance.PerformanceSnapshot(timestamp=clock["now"])
+        if measure_fps:
+            snapshot.fps = 60
+        return snapshot, (len(calls), 0, 0, 1)
+
+    def sleep(seconds):
+        sleeps.append(round(seconds, 6))
+        clock["now"] += seconds
+
+    monkeypatch.setattr(monitor, "_collect", collect)
+    monkeypatch.setattr(performance.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(performance.time, "sleep", sleep)
+
+    monitor._monitor_loop("s", "device", "com.app", 1.0)
+
+    # Collection time comes out of the sleep; after the 2.5 s stall the ticks
+    # resync, and the next sample still waits a full interval
+    assert sleeps == [0.7, 0.8, 1.0, 0.9, 1.0]
+    assert len(monitor._sessions["s"].snapshots) == 5
+    # Frame stats every other poll, CPU measured from the previous poll's sample
+    assert calls == [(True, None), (False, 1), (True, 2), (False, 3), (True, 4)]
+    assert monitor._sessions["s"].pid == 5
+    assert [snapshot.fps for snapshot in monitor._sessions["s"].snapshots] == [60] * 5
+
+
+def test_network_totals_skip_header_and_loopback():
+    output = (
+        "Inter-|   Receive                            |  Transmit\n"
+        " face |bytes    packets errs drop fifo frame compressed multicast|bytes\n"
+        "    lo:  100 1 0 0 0 0 0 0  100 1 0 0 0 0 0 0\n"
+        "rmnet_data0:123456789 10 0 0 0 0 0 0 4321 5 0 0 0 0 0 0\n"
+        "  wlan0: 5000 10 0 0 0 0 0 0 700 5 0 0 0 0 0 0\n"
+    )
+
+    assert performance._network_totals(output) == (123461789, 5021)
+
+
+def _proc_stat(utime, stime):
+    fields = ["S"] + ["0"] * 10 + [str(utime), str(stime)] + ["0"] * 8
+    return "4242 (com.app (main)) " + " ".join(fields)
+
+
+class _ProcfsDevice:
+    def __init__(self):
+        self.commands = []
+
+    def shell(self, command):
+        self.commands.append(command)
+        if "pidof" in command:
+            return ShellResponse(
+                "__METRICS_fps_clear__\n__METRICS_cpu__\n"
+                f"{_proc_stat(100, 50)}\ncpu  1000 0 1000 0 0 0 0 0 0 0\ncpu0 1\ncpu1 1\n",
+                0,
+            )
+        return ShellResponse(
+            "__METRICS_cpu__\n"
+            f"{_proc_stat(130, 70)}\nVmRSS:\t  102400 kB\n"
+            "cpu  1200 0 1200 0 0 0 0 0 0 0\ncpu0 1\ncpu1 1\n"
+            "MemTotal:        4096000 kB\n",
+            0,
+        )
+
+
+def test_later_polls_skip_the_frame_wait_given_a_cpu_sample(monkeypatch):
+    device = _ProcfsDevice()
+    sleeps = []
+    monkeypatch.setattr(performance.time, "sleep", sleeps.append)
+    start = (4242, 150, 2000, 2)
+
+    snapshot = performance.PerformanceSnapshot(timestamp=0.0)
+    end = performance._populate_metrics(
+        snapshot, device, "com.app", measure_fps=False, cpu_start=start
+    )
+
+    assert sleeps == []
+    assert len(device.commands) == 1
+    assert "SurfaceFlinger" not in device.commands[0]
+    assert "pidof" not in device.commands[0]
+    assert snapshot.cpu_percent == 25.0
+    assert end == (4242, 200, 2400, 2)
+
+
+def test_cpu_comes_from_procfs_deltas_when_pid_is_known(monkeypatch):
+    device = _ProcfsDevice()
+    monkeypatch.setattr(performance.time, "sleep", lambda seconds: None)
+
+    snapshot = performance.PerformanceSnapshot(timestamp=0.0)
+    performance._populate_metrics(snapshot, device, "com.app")
+
+    assert "top" not in device.commands[1]
+    assert "/proc/4242/stat" in device.commands[1]
+    # 50 app jiffies of 400 total, across 2 cores
+    assert "dumpsys meminfo" not in device.commands[1]
+    assert snapshot.cpu_percent == 25.0
+    assert snapshot.memory_mb == 100.0
+    assert snapshot.memory_percent == 2.5
+
+
+def test_summarize_skips_missing_samples():
+    summary = performance._summarize([None, *range(1, 21), None])
+
+    assert summary == {"avg": 10.5, "max": 20, "min": 1, "p50": 11, "p95": 19}
+    assert performance._summarize([None])["avg"] is None
+
+
+def test_session_keeps_only_the_latest_snapshots():
+    session = performance.MonitoringSession(
+        session_id="s", device_id="d", package="p", start_time=0.0, poll_interval=1.0
+    )
+
+    for i in range(performance.MAX_SNAPSHOTS_PER_SESSION + 5):
+        session.snapshots.append(performance.PerformanceSnapshot(timestamp=float(i)))
+
+    assert len(session.snapshots) == performance.MAX_SNAPSHOTS_PER_SESSION
+    assert session.snapshots[0].timestamp == 5.0
+
+
+class _SerialDevice:
+    serial = "emulator-5554"
+
+    def __init__(self):
+        self.commands = []
+
+    def shell(self, command):
+        self.commands.append(command)
+        return ShellResponse("fallback\n", 0)
+
+
+def _fake_adb(monkeypatch, script):
+    popen = performance.subprocess.Popen
+    spawned = []
+
+    def spawn(args, **kwargs):
+        spawned.append(args)
+        return popen(["sh", "-c", script], **kwargs)
+
+    monkeypatch.setattr(performance.subprocess, "Popen", spawn)
+    return spawned
+
+
+@pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX shell")
+def test_persistent_shell_reads_each_command_up_to_its_marker(monkeypatch):
+    # Echo every input line before running it, like a PTY-backed adb shell
+    spawned = _fake_adb(monkeypatch, "exec 3>&1; tee /dev/fd/3 | sh")
+    device = _SerialDevice()
+    shell = performance.PersistentShell()
+    shell.attach(device)
+
+    try:
+        assert shell.shell("echo one; echo two").endswith("one\ntwo\n")
+        assert shell.shell("printf partial").endswith("partial")
+        first = shell._process
+        assert shell.shell("echo again").endswith("again\n")
+        assert shell._process is first
+    finally:
+        shell.close()
+
+    assert spawned == [["adb", "-s", "emulator-5554", "shell", "-T"]]
+    assert device.commands == []
+
+
+@pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX shell")
+def test_persistent_shell_falls_back_to_device_shell_when_adb_dies(monkeypatch):
+    spawned = _fake_adb(monkeypatch, "exit 1")
+    device = _SerialDevice()
+    shell = performance.PersistentShell()
+    shell.attach(device)
+
+    assert getattr(shell.shell("echo one"), "output") == "fallback\n"
+    shell.shell("echo two")
+
+    assert len(spawned) == 1
+    assert device.commands == ["echo one", "echo two"]
+
+
+def test_persistent_shell_without_serial_uses_device_shell(monkeypatch):
+    monkeypatch.setattr(
+        performance.subprocess, "Popen", lambda *args, **kwargs: pytest.fail("no adb expected")
+    )
+    device = _SerialDevice()
+    device.serial = None
+    shell = performance.PersistentShell()
+    shell.attach(device)
+
+    shell.shell("echo one")
+
+    assert device.commands == ["echo one"]
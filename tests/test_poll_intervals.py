@@ -29,3 +29,54 @@ def test_watcher_start_rejects_invalid_poll_interval():
         assert False, "expected ValueError"
     except ValueError:
         assert True
+
+
+def test_poll_until_backs_off_toward_poll_interval(monkeypatch):
+    import sys
+
+    # src.tools re-exports a `wait` function that shadows the submodule name.
+    wait = sys.modules["src.tools.wait"]
+
+    sleeps = []
+    clock = {"now": 0.0}
+
+    class FakeTime:
+        @staticmethod
+        def monotonic():
+            return clock["now"]
+
+        @staticmethod
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock["now"] += seconds
+
+    monkeypatch.setattr(wait, "time", FakeTime)
+
+    found, result, _ = wait._poll_until(2.0, 0.5, lambda: None, initial_poll_interval=0.05)
+
+    assert found is False
+    assert result is None
+    assert sleeps[0] == 0.05
+    assert all(b >= a for a, b in zip(sleeps, sleeps[1:]))
+    assert max(sleeps) == 0.5
+
+
+def test_app_start_stop_first_polls_until_app_leaves(monkeypatch):
+    import sys
+
+    navigation = sys.modules["src.tools.navigation"]
+    sleeps = []
+    monkeypatch.setattr(navigation.time, "sleep", sleeps.append)
+
+    class StoppingDevice:
+        def __init__(self):
+            self.foreground = ["com.app", "com.app", "com.launcher"]
+
+        def app_current(self):
+            return {"package": self.foreground.pop(0)}
+
+    device = StoppingDevice()
+    navigation._wait_until_not_foreground(device, "com.app")
+
+    assert device.foreground == []
+    assert sleeps == [navigation._STOP_POLL_INTERVAL] * 2
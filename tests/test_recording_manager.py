@@ -1,3 +1,5 @@
+import pytest
+
 from src.tools import recording
 from src.tools.recording import RecordingManager, GestureEvent
 
@@ -43,3 +45,30 @@ def test_play_recording_reports_real_event_index(monkeypatch):
     result = manager.play_recording(rec.recording_id, device_id="device")
     assert len(result["errors"]) == 2
     assert result["errors"][1]["event_index"] == 1
+
+
+def test_export_round_trips_compact_json():
+    manager = RecordingManager()
+    rec = manager.start_recording("device")
+    rec.is_recording = False
+    rec.events = [GestureEvent(type="tap", timestamp=0.5, params={"x": 1, "y": 2})]
+
+    exported = manager.export_recording(rec.recording_id, compact=True)
+
+    assert "\n" not in exported
+    assert '"events":[{"type":"tap","timestamp":0.5,"params":{"x":1,"y":2}}]' in exported
+    imported = manager.import_recording(exported)
+    assert imported.events == rec.events
+
+
+def test_export_is_indented_by_default_and_rejects_unknown_objects():
+    manager = RecordingManager()
+    rec = manager.start_recording("device")
+    rec.is_recording = False
+    rec.events = [GestureEvent(type="tap", timestamp=0.5, params={"x": 1, "y": 2})]
+
+    assert '\n  "events": [' in manager.export_recording(rec.recording_id)
+
+    rec.metadata["note"] = GestureEvent(type="tap", timestamp=0.0)
+    with pytest.raises(TypeError):
+        manager.export_recording(rec.recording_id)
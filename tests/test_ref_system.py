@@ -2,6 +2,8 @@
 
 Unit tests for ElementInfo, Snapshot, and SnapshotManager.
 """
+import hashlib
+import sys
 import time
 
 import pytest
@@ -13,6 +15,8 @@ from src.core.ref_system import (
     ElementInfo,
     Snapshot,
     SnapshotManager,
+    _build_matcher,
+    _parse_bounds,
     get_snapshot_manager,
 )
 from src.core.exceptions import RefNotFoundError, StaleRefError
@@ -38,6 +42,26 @@ SIMPLE_XML = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
+# === Bounds Parsing Tests ===
+
+
+@pytest.mark.parametrize(
+    "bounds_str, expected",
+    [
+        ("[100,200][300,400]", (100, 200, 300, 400)),
+        ("[0,0][1080,2400]", (0, 0, 1080, 2400)),
+        ("[-5,0][10,20]", (-5, 0, 10, 20)),
+        ("[0,0][10]", (0, 0, 0, 0)),
+        ("100,200,300,400", (0, 0, 0, 0)),
+        ("[a,b][c,d]", (0, 0, 0, 0)),
+        ("", (0, 0, 0, 0)),
+    ],
+)
+def test_parse_bounds(bounds_str, expected):
+    """Bounds strings parse to int tuples; malformed ones to all zeros."""
+    assert _parse_bounds(bounds_str) == expected
+
+
 # === ElementInfo Tests ===
 
 
@@ -159,6 +183,38 @@ class TestElementInfo:
         assert element.matches(text="Login", clickable=True, enabled=True) is True
         assert element.matches(text="Login", clickable=False) is False
 
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            {},
+            {"clickable": True},
+            {"clickable": False},
+            {"text": "Login", "enabled": True},
+            {"text_contains": "og", "resource_id_contains": "btn"},
+            {"resource_id": "com.app:id/login_btn", "class_name": "android.widget.Button"},
+            {"content_desc": "Sign in", "text": None},
+            {"text_contains": "x"},
+        ],
+    )
+    def test_build_matcher_agrees_with_matches(self, criteria):
+        """The specialized matcher gives the same answer as matches()."""
+        elements = [
+            ElementInfo(
+                ref="e0", class_name="android.widget.Button", bounds=(0, 0, 100, 100),
+                text="Login", resource_id="com.app:id/login_btn",
+                content_desc="Sign in", clickable=True,
+            ),
+            ElementInfo(ref="e1", class_name="android.view.View", bounds=(0, 0, 1, 1)),
+        ]
+        match = _build_matcher(criteria)
+        for element in elements:
+            assert match(element) == element.matches(**criteria)
+
+    def test_build_matcher_rejects_unknown_criteria(self):
+        """Unknown criteria fail loudly, like matches()."""
+        with pytest.raises(TypeError):
+            _build_matcher({"txt": "Login"})
+
 
 # === Snapshot Tests ===
 
@@ -187,22 +243,35 @@ class TestSnapshot:
             activity=".MainActivity",
             timestamp=time.time() - 60,  # 60 seconds ago
             screen_size=(1080, 2400),
+            monotonic_timestamp=time.monotonic() - 60,
         )
         assert snapshot.is_stale(max_age_seconds=30.0) is True
 
     def test_age_seconds(self):
         """age_seconds returns correct value."""
-        timestamp = time.time() - 5
         snapshot = Snapshot(
             snapshot_id="test_123",
             device_id="default",
             package="com.app",
             activity=".MainActivity",
-            timestamp=timestamp,
+            timestamp=time.time() - 5,
             screen_size=(1080, 2400),
+            monotonic_timestamp=time.monotonic() - 5,
         )
         assert 4.9 < snapshot.age_seconds < 6.0
 
+    def test_age_ignores_wall_clock_timestamp(self):
+        """Staleness follows the monotonic clock, not the reported timestamp."""
+        snapshot = Snapshot(
+            snapshot_id="test_123",
+            device_id="default",
+            package="com.app",
+            activity=".MainActivity",
+            timestamp=time.time() - 3600,  # e.g. the wall clock jumped forward
+            screen_size=(1080, 2400),
+        )
+        assert snapshot.is_stale(max_age_seconds=30.0) is False
+
     def test_get_element(self):
         """get_element returns element by ref."""
         element = ElementInfo(
@@ -268,6 +337,103 @@ class TestSnapshot:
         assert len(ok_btn) == 1
         assert ok_btn[0].ref == "e0"
 
+        # Text criteria still combine with the remaining predicates
+        assert snapshot.find_elements(text_contains="n", clickable=True) == [btn2]
+        assert snapshot.find_elements(text="Info", clickable=True) == []
+
+    def test_columns_follow_element_order(self):
+        """Column arrays and text index line up with elements."""
+        first = ElementInfo(ref="e0", class_name="node", bounds=(0, 0, 10, 10), text="A")
+        second = ElementInfo(ref="e1", class_name="node", bounds=(0, 10, 10, 20), text="A")
+        third = ElementInfo(ref="e2", class_name="node", bounds=(0, 20, 10, 30))
+        snapshot = Snapshot(
+            snapshot_id="test_123",
+            device_id="default",
+            package="com.app",
+            activity=".MainActivity",
+            timestamp=time.time(),
+            screen_size=(1080, 2400),
+            refs={"e0": first, "e1": second, "e2": third},
+        )
+
+        assert snapshot.elements == [first, second, third]
+        assert snapshot.texts == ["A", "A", None]
+        assert snapshot.bounds == [(0, 0, 10, 10), (0, 10, 10, 20), (0, 20, 10, 30)]
+        assert snapshot.text_index == {"A": [0, 1]}
+        with pytest.raises(AttributeError):
+            first.text = "B"
+
+    def test_find_elements_narrows_by_resource_id_and_clickable(self):
+        """Resource ID and clickable lookups go through the column indexes."""
+        button = ElementInfo(
+            ref="e0", class_name="Button", bounds=(0, 0, 10, 10),
+            resource_id="app:id/ok", clickable=True,
+        )
+        label = ElementInfo(
+            ref="e1", class_name="TextView", bounds=(0, 10, 10, 20), resource_id="app:id/ok"
+        )
+        other = ElementInfo(ref="e2", class_name="Button", bounds=(0, 20, 10, 30), clickable=True)
+        snapshot = Snapshot(
+            snapshot_id="test_123",
+            device_id="default",
+            package="com.app",
+            activity=".MainActivity",
+            timestamp=time.time(),
+            screen_size=(1080, 2400),
+            refs={"e0": button, "e1": label, "e2": other},
+        )
+
+        assert snapshot.resource_id_index == {"app:id/ok": [0, 1]}
+        assert snapshot.clickable_positions == [0, 2]
+        assert snapshot.find_elements(resource_id="app:id/ok", clickable=True) == [button]
+        assert snapshot.find_elements(resource_id_contains="ok") == [button, label]
+        assert snapshot.find_elements(clickable=True, class_name="Button") == [button, other]
+
+    def test_text_contains_positions_in_hierarchy_order(self):
+        """Partial text lookup returns positions in order, skipping short texts."""
+        texts = ["Item 10", "Item 2", "Go", "Item 10", None]
+        refs = {
+            f"e{i}": ElementInfo(
+                ref=f"e{i}", class_name="node", bounds=(0, i, 10, i + 1), text=text
+            )
+            for i, text in enumerate(texts)
+        }
+        snapshot = Snapshot(
+            snapshot_id="s",
+            device_id="default",
+            package="com.app",
+            activity=".Main",
+            timestamp=time.time(),
+            screen_size=(1080, 2400),
+            refs=refs,
+        )
+
+        assert list(snapshot.text_contains_positions("Item 1")) == [0, 3]
+        assert list(snapshot.text_contains_positions("Item")) == [0, 1, 3]
+        assert list(snapshot.text_contains_positions("Item 100")) == []
+        assert [e.ref for e in snapshot.find_elements(text_contains="o")] == ["e2"]
+
+    def test_fingerprint_tracks_lookup_fields(self):
+        """fingerprint changes with texts/bounds but not with state flags."""
+
+        def snapshot_of(**overrides):
+            fields = dict(ref="e0", class_name="node", bounds=(0, 0, 10, 10), text="A")
+            fields.update(overrides)
+            return Snapshot(
+                snapshot_id="s",
+                device_id="default",
+                package="com.app",
+                activity=".Main",
+                timestamp=time.time(),
+                screen_size=(1080, 2400),
+                refs={"e0": ElementInfo(**fields)},
+            )
+
+        base = snapshot_of().fingerprint
+        assert snapshot_of(checked=True).fingerprint == base
+        assert snapshot_of(text="B").fingerprint != base
+        assert snapshot_of(bounds=(0, 0, 10, 11)).fingerprint != base
+
     def test_to_dict(self):
         """to_dict returns expected structure."""
         element = ElementInfo(
@@ -333,6 +499,40 @@ class TestSnapshotManager:
         assert "e0" in refs
         assert "e1" in refs
 
+    def test_create_snapshot_records_depth_in_document_order(self, manager):
+        """Refs follow document order and depth counts from the top-level node."""
+        snapshot = manager.create_snapshot(
+            device_id="test_device",
+            xml_content=SAMPLE_UI_XML,
+            package="com.example.app",
+            activity=".MainActivity",
+            screen_size=(1080, 2400),
+        )
+
+        assert [e.depth for e in snapshot.elements] == [0, 1, 1, 1, 1]
+        assert snapshot.elements[1].text == "Login"
+
+    def test_create_snapshot_accepts_bytes(self, manager):
+        """Bytes and str XML produce the same elements and hash."""
+        kwargs = dict(package="com.app", activity=".Activity", screen_size=(1080, 2400))
+        from_str = manager.create_snapshot(device_id="d1", xml_content=SAMPLE_UI_XML, **kwargs)
+        from_bytes = manager.create_snapshot(
+            device_id="d2", xml_content=SAMPLE_UI_XML.encode(), **kwargs
+        )
+
+        assert from_bytes.xml_hash == from_str.xml_hash
+        expected = hashlib.blake2b(SAMPLE_UI_XML.encode(), digest_size=16).hexdigest()
+        assert from_str.xml_hash == expected
+        assert [e.text for e in from_bytes.elements] == [e.text for e in from_str.elements]
+
+    def test_parse_hierarchy_accepts_node_root(self, manager):
+        """A bare <node> root is parsed like a <hierarchy> child."""
+        xml = '<node text="Solo" bounds="[0,0][10,10]"><node text="Child" bounds="[1,1][5,5]"/></node>'
+
+        refs = manager._parse_hierarchy(xml)
+
+        assert [(e.text, e.depth) for e in refs.values()] == [("Solo", 0), ("Child", 1)]
+
     def test_create_snapshot_extracts_element_properties(self, manager):
         """Element properties are extracted from XML."""
         snapshot = manager.create_snapshot(
@@ -420,7 +620,7 @@ class TestSnapshotManager:
             screen_size=(1080, 2400),
         )
         # Manually make it old
-        snapshot.timestamp = time.time() - 60
+        snapshot.monotonic_timestamp = time.monotonic() - 60
 
         with pytest.raises(StaleRefError):
             manager.resolve_ref("test_device", "e0", validate_staleness=True, max_stale_seconds=30)
@@ -440,6 +640,58 @@ class TestSnapshotManager:
         assert x == 150
         assert y == 125
 
+    def test_get_positions_resolves_against_one_snapshot(self, manager):
+        """get_positions returns centers in order and reports the missing ref."""
+        manager.create_snapshot(
+            device_id="test_device",
+            xml_content=SAMPLE_UI_XML,
+            package="com.app",
+            activity=".Activity",
+            screen_size=(1080, 2400),
+        )
+
+        assert manager.get_positions("test_device", ["e1", "e0", "e1"]) == [
+            (200, 240), (540, 1200), (200, 240),
+        ]
+        assert manager.get_positions("test_device", []) == []
+        with pytest.raises(RefNotFoundError) as info:
+            manager.get_positions("test_device", ["e0", "e99"])
+        assert info.value.ref == "e99"
+
+    def test_zero_max_stale_seconds_is_not_the_default(self, manager):
+        """An explicit max_stale_seconds=0 rejects any aged snapshot."""
+        snapshot = manager.create_snapshot(
+            device_id="test_device",
+            xml_content=SIMPLE_XML,
+            package="com.app",
+            activity=".Activity",
+            screen_size=(1080, 2400),
+        )
+        snapshot.monotonic_timestamp = time.monotonic() - 1
+
+        assert manager.get_positions("test_device", ["e0"]) == [(150, 125)]
+        with pytest.raises(StaleRefError):
+            manager.get_positions("test_device", ["e0"], max_stale_seconds=0)
+        with pytest.raises(StaleRefError):
+            manager.resolve_ref("test_device", "e0", max_stale_seconds=0)
+
+    def test_expire_current_keeps_history(self, manager):
+        """expire_current stops ref resolution but keeps the snapshot by ID."""
+        snapshot = manager.create_snapshot(
+            device_id="test_device",
+            xml_content=SIMPLE_XML,
+            package="com.app",
+            activity=".Activity",
+            screen_size=(1080, 2400),
+        )
+
+        manager.expire_current("test_device")
+
+        assert manager.get_current_snapshot("test_device") is None
+        assert manager.get_snapshot("test_device", snapshot.snapshot_id) is snapshot
+        with pytest.raises(RefNotFoundError):
+            manager.get_position("test_device", "e0")
+
     def test_find_elements(self, manager):
         """find_elements returns matching elements from current snapshot."""
         manager.create_snapshot(
@@ -461,7 +713,7 @@ class TestSnapshotManager:
     def test_max_snapshots_limit(self, manager):
         """Old snapshots are removed when limit is exceeded."""
         # Create more snapshots than limit (3)
-        for i in range(5):
+        snapshots = [
             manager.create_snapshot(
                 device_id="test_device",
                 xml_content=SIMPLE_XML,
@@ -469,10 +721,113 @@ class TestSnapshotManager:
                 activity=f".Activity{i}",
                 screen_size=(1080, 2400),
             )
+            for i in range(5)
+        ]
 
         # Should only keep 3 most recent
-        with manager._lock:
-            assert len(manager._snapshots["test_device"]) == 3
+        with manager._device_lock("test_device"):
+            assert len(manager._history["test_device"]) == 3
+        for old in snapshots[:2]:
+            assert manager.get_snapshot("test_device", old.snapshot_id) is None
+        for recent in snapshots[2:]:
+            assert manager.get_snapshot("test_device", recent.snapshot_id) is recent
+        assert manager.get_current_snapshot("test_device") is snapshots[-1]
+
+    def test_find_elements_under_root_ref(self, manager):
+        """root_ref limits the search to that element's subtree."""
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+<hierarchy rotation="0">
+  <node text="" class="android.widget.FrameLayout" bounds="[0,0][1080,2400]">
+    <node text="" class="android.widget.LinearLayout" bounds="[0,0][1080,1200]">
+      <node text="OK" class="android.widget.Button" bounds="[0,0][100,100]" />
+    </node>
+    <node text="OK" class="android.widget.Button" bounds="[0,1200][100,1300]" />
+  </node>
+</hierarchy>
+"""
+        snapshot = manager.create_snapshot(
+            device_id="test_device",
+            xml_content=xml,
+            package="com.app",
+            activity=".Activity",
+            screen_size=(1080, 2400),
+        )
+
+        assert snapshot.subtree_span("e1") == (1, 3)
+        assert [e.ref for e in snapshot.find_elements(text="OK")] == ["e2", "e3"]
+        assert [e.ref for e in snapshot.find_elements("e1", text="OK")] == ["e2"]
+        with pytest.raises(RefNotFoundError):
+            snapshot.find_elements("e99", text="OK")
+
+    def test_unchanged_elements_keep_refs_across_snapshots(self, manager):
+        """Re-parsing the same screen reuses refs and ElementInfo objects."""
+        first = manager.create_snapshot(
+            device_id="test_device",
+            xml_content=SAMPLE_UI_XML,
+            package="com.example.app",
+            activity=".LoginActivity",
+            screen_size=(1080, 2400),
+        )
+        changed_xml = SAMPLE_UI_XML.replace('checked="true"', 'checked="false"')
+        second = manager.create_snapshot(
+            device_id="test_device",
+            xml_content=changed_xml,
+            package="com.example.app",
+            activity=".LoginActivity",
+            screen_size=(1080, 2400),
+        )
+
+        assert list(second.refs) == list(first.refs)
+        login = first.find_elements(text="Login")[0]
+        assert second.refs[login.ref] is login
+
+        checkbox = first.find_elements(text="Remember me")[0]
+        assert second.refs[checkbox.ref] is not checkbox
+        assert second.refs[checkbox.ref].checked is False
+
+    def test_to_dict_is_built_once_and_shared_by_reused_elements(self, manager):
+        """Snapshot and element dicts are memoized; unchanged elements share theirs."""
+        kwargs = dict(package="com.app", activity=".Activity", screen_size=(1080, 2400))
+        first = manager.create_snapshot(device_id="d", xml_content=SAMPLE_UI_XML, **kwargs)
+        second = manager.create_snapshot(device_id="d", xml_content=SAMPLE_UI_XML, **kwargs)
+
+        assert first.to_dict() is first.to_dict()
+        assert second.to_dict()["refs"]["e1"] is first.to_dict()["refs"]["e1"]
+
+    def test_new_elements_get_fresh_refs(self, manager):
+        """Elements absent from the previous snapshot never reuse an old ref."""
+        first = manager.create_snapshot(
+            device_id="test_device",
+            xml_content=SAMPLE_UI_XML,
+            package="com.example.app",
+            activity=".LoginActivity",
+            screen_size=(1080, 2400),
+        )
+        second = manager.create_snapshot(
+            device_id="test_device",
+            xml_content=SIMPLE_XML,
+            package="com.app",
+            activity=".Activity",
+            screen_size=(1080, 2400),
+        )
+
+        assert set(second.refs).isdisjoint(first.refs)
+
+    def test_snapshot_does_not_retain_raw_xml(self, manager):
+        """Stored snapshots hold the element index, not the XML payload."""
+        xml = SAMPLE_UI_XML.replace("Login", "Log in")  # fresh string object
+        refcount = sys.getrefcount(xml)
+
+        snapshot = manager.create_snapshot(
+            device_id="test_device",
+            xml_content=xml,
+            package="com.example.app",
+            activity=".LoginActivity",
+            screen_size=(1080, 2400),
+        )
+
+        assert sys.getrefcount(xml) == refcount
+        assert all(value is not xml for value in vars(snapshot).values())
 
     def test_invalidate(self, manager):
         """invalidate removes all snapshots for device."""
@@ -510,6 +865,32 @@ class TestSnapshotManager:
         assert manager.get_current_snapshot("device1") is None
         assert manager.get_current_snapshot("device2") is None
 
+    def test_get_current_snapshot_does_not_take_the_device_lock(self, manager):
+        """Readers see the published snapshot while a writer holds the lock."""
+        snapshot = manager.create_snapshot(
+            device_id="device1",
+            xml_content=SIMPLE_XML,
+            package="com.app",
+            activity=".Activity",
+            screen_size=(1080, 2400),
+        )
+
+        with manager._device_lock("device1"):
+            assert manager.get_current_snapshot("device1") is snapshot
+
+    def test_devices_do_not_share_a_lock(self, manager):
+        """A busy device does not block snapshot lookups on another device."""
+        manager.create_snapshot(
+            device_id="device2",
+            xml_content=SIMPLE_XML,
+            package="com.app",
+            activity=".Activity",
+            screen_size=(1080, 2400),
+        )
+
+        with manager._device_lock("device1"):
+            assert manager.get_current_snapshot("device2") is not None
+
 
 # === Global Singleton Tests ===
 
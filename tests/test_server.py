@@ -209,3 +209,28 @@ class TestDeviceCaching:
         # Lock이 존재하고 threading.Lock 타입인지 확인
         assert _cache_lock is not None
         assert isinstance(_cache_lock, type(threading.Lock()))
+
+
+# === Unit Tests: Lazy Bootstrap ===
+
+class TestLazyBootstrap:
+    """Tests for deferred FastMCP and tool module imports"""
+
+    def test_import_does_not_load_fastmcp(self):
+        """서버 모듈 import만으로는 FastMCP를 불러오지 않음"""
+        import subprocess
+        import sys
+
+        code = "import sys, src.server; print('mcp.server.fastmcp' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_mcp_registers_every_tool(self):
+        """mcp 접근 시 모든 도구가 등록되고 모듈 전역과 같은 함수임"""
+        import src.server as server
+
+        tools = server.mcp._tool_manager._tools
+        assert set(tools) == set(server._TOOL_OWNERS)
+        assert tools["wait_seconds"].fn is server.wait_seconds
@@ -0,0 +1,131 @@
+"""Tests for find_element result trimming and ref ranges."""
+import sys
+
+import pytest
+
+import src.tools  # noqa: F401  (loads src.tools.snapshot)
+from src.core import RefNotFoundError, SnapshotManager
+
+snapshot_tools = sys.modules["src.tools.snapshot"]
+
+LIST_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<hierarchy rotation="0">
+""" + "\n".join(
+    f'  <node index="{i}" text="Item {i}" class="android.widget.TextView" '
+    f'bounds="[0,{i * 100}][1080,{i * 100 + 100}]" clickable="true" enabled="true" />'
+    for i in range(10)
+) + """
+</hierarchy>
+"""
+
+
+class _FakeDeviceManager:
+    def resolve_device_id_or_default(self, device_id):
+        return device_id or "default"
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = SnapshotManager()
+    manager.create_snapshot(
+        device_id="default",
+        xml_content=LIST_XML,
+        package="com.app",
+        activity=".ListActivity",
+        screen_size=(1080, 2400),
+    )
+    monkeypatch.setattr(snapshot_tools, "get_device_manager", _FakeDeviceManager)
+    monkeypatch.setattr(snapshot_tools, "get_snapshot_manager", lambda: manager)
+    return manager
+
+
+def test_find_element_trims_to_max_chars(manager):
+    full = snapshot_tools.find_element(text_contains="Item")
+    assert full["count"] == 10
+    assert "trimmed" not in full
+
+    budget = sum(len(snapshot_tools.json.dumps(e)) for e in full["elements"][:3])
+    result = snapshot_tools.find_element(text_contains="Item", max_chars=budget)
+
+    assert result["count"] == 10
+    assert [e["ref"] for e in result["elements"]] == ["e0", "e1", "e2"]
+    assert result["trimmed"] == "[refs e3-e9 trimmed]"
+    assert result["next_ref"] == "e3"
+
+
+def test_find_element_keeps_one_element_over_budget(manager):
+    result = snapshot_tools.find_element(text_contains="Item", max_chars=1)
+
+    assert [e["ref"] for e in result["elements"]] == ["e0"]
+    assert result["next_ref"] == "e1"
+
+    follow_up = snapshot_tools.find_element(
+        text_contains="Item", start_ref=result["next_ref"], max_chars=1
+    )
+    assert [e["ref"] for e in follow_up["elements"]] == ["e1"]
+
+
+def test_device_snapshot_trims_refs_to_max_chars(manager, monkeypatch):
+    snapshot = manager.get_current_snapshot("default")
+    monkeypatch.setattr(snapshot_tools, "_capture_snapshot", lambda device_id: snapshot)
+    refs = snapshot.to_dict()["refs"]
+    budget = sum(len(snapshot_tools.json.dumps(refs[ref])) for ref in ("e0", "e1"))
+
+    result = snapshot_tools.device_snapshot(max_chars=budget)
+
+    assert list(result["refs"]) == ["e0", "e1"]
+    assert result["element_count"] == 10
+    assert result["trimmed"] == "[refs e2-e9 trimmed]"
+    assert result["next_ref"] == "e2"
+    assert "trimmed" not in snapshot_tools.device_snapshot()
+
+
+def test_find_element_follow_up_range(manager):
+    result = snapshot_tools.find_element(text_contains="Item", start_ref="e3", end_ref="e5")
+
+    assert [e["ref"] for e in result["elements"]] == ["e3", "e4", "e5"]
+
+
+def test_find_element_rejects_unknown_range_ref(manager):
+    with pytest.raises(RefNotFoundError):
+        snapshot_tools.find_element(text_contains="Item", start_ref="e99")
+    with pytest.raises(ValueError):
+        snapshot_tools.find_element(text_contains="Item", max_chars=0)
+
+
+def test_find_element_stops_at_limit(manager):
+    result = snapshot_tools.find_element(text_contains="Item", limit=2)
+
+    assert result["count"] == 2
+    assert [e["ref"] for e in result["elements"]] == ["e0", "e1"]
+
+    ranged = snapshot_tools.find_element(text_contains="Item", start_ref="e4", limit=1)
+    assert [e["ref"] for e in ranged["elements"]] == ["e4"]
+
+
+def test_find_elements_answers_queries_in_order(manager):
+    result = snapshot_tools.find_elements(
+        [{"text": "Item 3"}, {"text": "Missing"}, {"text_contains": "Item"}],
+        limit=1,
+    )
+
+    assert [r["count"] for r in result["results"]] == [1, 0, 1]
+    assert result["results"][0]["elements"][0]["ref"] == "e3"
+    assert result["results"][2]["elements"][0]["ref"] == "e0"
+
+
+def test_find_elements_rejects_unknown_criteria(manager):
+    with pytest.raises(ValueError):
+        snapshot_tools.find_elements([{"txt": "Item 3"}])
+    with pytest.raises(ValueError):
+        snapshot_tools.find_elements([])
+
+
+def test_find_elements_wraps_unexpected_errors(monkeypatch):
+    def broken(device_id, refresh_snapshot):
+        raise OSError("adb gone")
+
+    monkeypatch.setattr(snapshot_tools, "_search_snapshot", broken)
+
+    with pytest.raises(RuntimeError, match="Failed to find elements: adb gone"):
+        snapshot_tools.find_elements([{"text": "OK"}])
@@ -0,0 +1,31 @@
+"""Tests for the shared tool error wrapper."""
+import logging
+
+import pytest
+
+from src.core import DeviceConnectionError
+from src.tools._errors import wrap_tool_errors
+
+logger = logging.getLogger(__name__)
+
+
+def test_wrap_tool_errors_chains_the_original_exception():
+    @wrap_tool_errors(logger, "Tap failed")
+    def tap():
+        raise KeyError("x")
+
+    with pytest.raises(RuntimeError, match="Tap failed: 'x'") as info:
+        tap()
+
+    assert isinstance(info.value.__cause__, KeyError)
+
+
+def test_wrap_tool_errors_passes_through_listed_exceptions():
+    @wrap_tool_errors(logger, "Tap failed", pass_through=(ValueError,))
+    def tap(error):
+        raise error
+
+    with pytest.raises(ValueError):
+        tap(ValueError("bad"))
+    with pytest.raises(DeviceConnectionError):
+        tap(DeviceConnectionError("emulator-5554", "gone"))
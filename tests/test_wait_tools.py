@@ -0,0 +1,137 @@
+"""Tests for multi-text waiting and composite wait tools."""
+import contextlib
+import sys
+
+import pytest
+
+import src.tools  # noqa: F401  (loads src.tools.wait)
+from src.core import ElementInfo, Snapshot
+
+# src.tools re-exports a `wait` function that shadows the submodule name.
+wait = sys.modules["src.tools.wait"]
+
+
+def _snapshot(*texts):
+    refs = {
+        f"e{i}": ElementInfo(
+            ref=f"e{i}", class_name="node", bounds=(0, i * 10, 10, i * 10 + 10), text=text
+        )
+        for i, text in enumerate(texts)
+    }
+    return Snapshot(
+        snapshot_id="s",
+        device_id="default",
+        package="com.app",
+        activity=".Main",
+        timestamp=0.0,
+        screen_size=(1080, 2400),
+        refs=refs,
+    )
+
+
+def test_text_matcher_prefers_longest_partial_needle():
+    match = wait._compile_text_matcher(["Status:", "Status: GRANTED"], partial=True)
+
+    assert match("Status: GRANTED") == "Status: GRANTED"
+    assert match("Status: DENIED") == "Status:"
+    assert match("Nothing") is None
+
+
+def test_wait_for_any_text_returns_first_match_in_hierarchy(monkeypatch):
+    screens = iter([_snapshot("Loading"), _snapshot("Title", "Deny", "Allow")])
+    monkeypatch.setattr(wait, "_capture_snapshot", lambda device_id: next(screens))
+    monkeypatch.setattr(wait.time, "sleep", lambda seconds: None)
+
+    result = wait.wait_for_any_text(["Allow", "Deny"], timeout=5)
+
+    assert result["found"] is True
+    assert result["text"] == "Deny"
+    assert result["ref"] == "e1"
+
+
+def test_wait_for_any_text_rejects_empty_texts():
+    with pytest.raises(ValueError):
+        wait.wait_for_any_text([])
+
+
+def test_device_tap_and_wait_validates_before_tapping(monkeypatch):
+    taps = []
+    monkeypatch.setattr(wait, "device_tap", lambda **kwargs: taps.append(kwargs))
+
+    with pytest.raises(ValueError):
+        wait.device_tap_and_wait("Done", x=1, y=2, timeout=0)
+    assert taps == []
+
+
+def test_device_tap_and_wait_returns_wait_result_with_tap(monkeypatch):
+    monkeypatch.setattr(wait, "device_tap", lambda **kwargs: {"success": True, **kwargs})
+    monkeypatch.setattr(wait, "_capture_snapshot", lambda device_id: _snapshot("Done"))
+
+    result = wait.device_tap_and_wait("Done", x=1, y=2, timeout=5)
+
+    assert result["found"] is True
+    assert result["ref"] == "e0"
+    assert result["tap"]["x"] == 1
+
+
+def test_device_tap_and_wait_wraps_device_errors(monkeypatch):
+    def lost(device_id):
+        raise OSError("device lost")
+
+    monkeypatch.setattr(wait, "device_tap", lambda **kwargs: {"success": True})
+    monkeypatch.setattr(wait, "_capture_snapshot", lost)
+
+    with pytest.raises(RuntimeError, match="Tap and wait failed: .*device lost"):
+        wait.device_tap_and_wait("Done", x=1, y=2, timeout=5)
+
+
+def test_wait_skips_rescanning_unchanged_screens(monkeypatch):
+    screens = iter([_snapshot("Loading"), _snapshot("Loading"), _snapshot("Done")])
+    scanned = []
+    monkeypatch.setattr(wait, "_capture_snapshot", lambda device_id: next(screens))
+    monkeypatch.setattr(wait.time, "sleep", lambda seconds: None)
+    original = Snapshot.iter_elements
+
+    def spy(self, *args, **kwargs):
+        scanned.append(self.texts)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Snapshot, "iter_elements", spy)
+
+    result = wait.wait_for_element(text="Done", timeout=5)
+
+    assert result["found"] is True
+    assert scanned == [["Loading"], ["Done"]]
+
+
+def test_swipe_element_and_check_reports_removal(monkeypatch):
+    swipes = []
+
+    class _Device:
+        def swipe(self, *args, **kwargs):
+            swipes.append(args)
+
+    class _Manager:
+        def resolve_device_id_or_default(self, device_id):
+            return device_id or "default"
+
+        @contextlib.contextmanager
+        def get_device(self, device_id=None):
+            yield _Device()
+
+    expired = []
+    screens = iter([_snapshot("Swipe Item 1"), _snapshot("Removed: Swipe Item 1")])
+    monkeypatch.setattr(wait, "_capture_snapshot", lambda device_id: next(screens))
+    monkeypatch.setattr(wait, "_expire_refs", expired.append)
+    monkeypatch.setattr(wait, "get_device_manager", _Manager)
+    monkeypatch.setattr(wait.time, "sleep", lambda seconds: None)
+
+    result = wait.swipe_element_and_check(
+        "Swipe Item 1", expect_text="Removed: Swipe Item 1", padding=2, timeout=5
+    )
+
+    assert swipes == [(8, 5, 2, 5)]  # right edge -> left edge, inset by padding
+    assert expired == ["default"]
+    assert result["found_before"] is True
+    assert result["expect_seen"] is True
+    assert result["found_after"] is False